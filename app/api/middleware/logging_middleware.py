@@ -26,7 +26,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else "unknown"
 
         # Log request
-        logger.info(f"Request: {request.method} {request.url.path} from {client_ip}")
+        logger.info(
+            "Request: %s %s from %s", request.method, request.url.path, client_ip
+        )
 
         # Process request
         try:
@@ -37,8 +39,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             # Log response
             logger.info(
-                f"Response: {request.method} {request.url.path} "
-                f"status={response.status_code} duration={duration:.3f}s"
+                "Response: %s %s status=%s duration=%.3fs",
+                request.method,
+                request.url.path,
+                response.status_code,
+                duration,
             )
 
             # Add custom headers
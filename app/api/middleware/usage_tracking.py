@@ -2,14 +2,26 @@
 
 from fastapi import Request
 from datetime import datetime
+import itertools
+import os
 import time
-import uuid
 from typing import Callable
 
 from app.config.services import ServiceRegistry
 from app.domain.entities.usage_metric import UsageMetric, RequestStatus
 
 
+# Cheap per-process trace IDs (not security sensitive - repository replaces
+# them with the MongoDB ObjectId on insert), avoids os.urandom per request.
+_ID_COUNTER = itertools.count()
+_PID_PREFIX = f"{os.getpid():x}"
+
+
+def _metric_id() -> str:
+    """Generate a unique-per-process metric ID."""
+    return f"{_PID_PREFIX}-{time.monotonic_ns():x}-{next(_ID_COUNTER):x}"
+
+
 async def usage_tracking_middleware(request: Request, call_next: Callable):
     """
     Middleware to track API usage metrics.
@@ -51,7 +63,7 @@ async def usage_tracking_middleware(request: Request, call_next: Callable):
         
         # Create usage metric
         metric = UsageMetric(
-            id=str(uuid.uuid4()),
+            id=_metric_id(),
             endpoint=request.url.path,
             method=request.method,
             user_id=user_id,
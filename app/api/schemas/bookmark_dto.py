@@ -31,6 +31,7 @@ class UpdateBookmarkRequest(BaseModel):
     notes: Optional[str] = None
     folder: Optional[str] = None
     is_pinned: Optional[bool] = None
+    is_archived: Optional[bool] = None
 
 
 class SearchBookmarksRequest(BaseModel):
@@ -46,8 +47,8 @@ class SearchBookmarksRequest(BaseModel):
 # ===== Response DTOs =====
 
 
-class BookmarkResponse(BaseModel):
-    """Bookmark response."""
+class BookmarkSummaryResponse(BaseModel):
+    """Bookmark as listed (without sources/artifacts)."""
 
     id: str
     user_id: str
@@ -59,8 +60,6 @@ class BookmarkResponse(BaseModel):
     tags: List[str] = []
     notes: Optional[str] = None
     folder: Optional[str] = None
-    sources: List[Dict[str, Any]] = []
-    artifacts: List[Dict[str, Any]] = []
     is_pinned: bool = False
     is_archived: bool = False
     created_at: datetime
@@ -70,10 +69,17 @@ class BookmarkResponse(BaseModel):
         from_attributes = True
 
 
+class BookmarkResponse(BookmarkSummaryResponse):
+    """Bookmark response."""
+
+    sources: List[Dict[str, Any]] = []
+    artifacts: List[Dict[str, Any]] = []
+
+
 class BookmarkListResponse(BaseModel):
     """List of bookmarks response."""
 
-    bookmarks: List[BookmarkResponse]
+    bookmarks: List[BookmarkSummaryResponse]
     total: int
     skip: int
     limit: int
@@ -1,7 +1,7 @@
 """Chat DTOs."""
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 
@@ -21,24 +21,30 @@ class SendMessageRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+# Read-only response models: immutable, so empty sequences default to a
+# shared () instead of a fresh list per instance
+_RESPONSE_CONFIG = ConfigDict(frozen=True, from_attributes=True)
+
+
 class ChatMessageResponse(BaseModel):
     """Chat message response."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     session_id: str
     role: str
     content: str
     created_at: datetime
-    attachments: List[Dict[str, Any]] = Field(default_factory=list)
+    attachments: Tuple[Dict[str, Any], ...] = ()
     metadata: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ChatSessionResponse(BaseModel):
     """Chat session response."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     user_id: str
     title: str
@@ -46,13 +52,14 @@ class ChatSessionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ChatHistoryResponse(BaseModel):
     """Chat history response."""
 
+    model_config = _RESPONSE_CONFIG
+
     session: ChatSessionResponse
     messages: List[ChatMessageResponse]
     total: int
+    # Pass back as `cursor` to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
@@ -1,6 +1,6 @@
 """Document DTOs."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -54,3 +54,15 @@ class QueryResponse(BaseModel):
     answer: str
     sources: List[Dict[str, Any]] = []
     metadata: Dict[str, Any] = {}
+
+
+class BatchQueryRequest(BaseModel):
+    """Batch RAG query request."""
+
+    queries: List[QueryRequest] = Field(..., min_length=1, max_length=20)
+
+
+class BatchQueryResponse(BaseModel):
+    """Batch RAG query response."""
+
+    results: List[QueryResponse]
@@ -51,7 +51,7 @@ async def list_conversations(
         is_archived = False
 
     # Get sessions with admin filters
-    sessions = await chat_repo.find_all_sessions(
+    sessions, total = await chat_repo.list_and_count_all_sessions(
         skip=skip,
         limit=limit,
         user_id=user_id,
@@ -60,13 +60,6 @@ async def list_conversations(
         is_archived=is_archived,
     )
 
-    total = await chat_repo.count_all_sessions(
-        user_id=user_id,
-        date_from=date_from,
-        date_to=date_to,
-        is_archived=is_archived,
-    )
-
     # Build response
     items = []
     for session in sessions:
@@ -146,14 +146,14 @@ async def get_gap_detail(
     )
 
     # Filter logs that match this gap's sample queries (simplified)
-    matching_logs = [
-        log
-        for log in related_logs
-        if any(
-            eq.lower() in log.query.lower() or log.query.lower() in eq.lower()
-            for eq in gap.sample_queries
-        )
-    ][:10]
+    sample_queries = [eq.lower() for eq in gap.sample_queries]
+    matching_logs = []
+    for log in related_logs:
+        log_query = log.query.lower()
+        if any(eq in log_query or log_query in eq for eq in sample_queries):
+            matching_logs.append(log)
+            if len(matching_logs) == 10:
+                break
 
     return GapDetailResponse(
         id=str(gap.id),
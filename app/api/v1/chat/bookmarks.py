@@ -1,13 +1,16 @@
 """Bookmark API routes for saving and organizing Q&A pairs."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from typing import AsyncIterator, List, Optional
 
 from app.api.dependencies.auth import get_user_id
 from app.api.schemas.bookmark_dto import (
     CreateBookmarkRequest,
     UpdateBookmarkRequest,
     BookmarkResponse,
+    BookmarkSummaryResponse,
     BookmarkListResponse,
     BookmarkTagsResponse,
     BookmarkFoldersResponse,
@@ -19,6 +22,20 @@ from app.config.services import ServiceRegistry
 
 router = APIRouter(prefix="/bookmarks", tags=["Bookmarks"])
 
+_SUMMARY_LIST = TypeAdapter(List[BookmarkSummaryResponse])
+
+
+def _json_response(content: bytes) -> Response:
+    """
+    Wrap pre-serialized JSON.
+
+    List endpoints build their DTOs once and serialize them in pydantic-core;
+    returning a Response skips FastAPI's re-validation against
+    response_model and its jsonable_encoder pass (response_model still
+    documents the schema).
+    """
+    return Response(content=content, media_type="application/json")
+
 
 @router.post("", response_model=BookmarkResponse, status_code=status.HTTP_201_CREATED)
 async def create_bookmark(
@@ -56,23 +73,39 @@ async def list_bookmarks(
     """List user's bookmarks (pinned first, then by date)."""
     repo = ServiceRegistry.get_bookmark_repository()
 
-    bookmarks = await repo.get_by_user(
+    bookmarks, total = await repo.list_with_total(
         user_id=user_id,
         skip=skip,
         limit=limit,
         include_archived=include_archived,
     )
-    total = await repo.count_by_user(user_id, include_archived)
 
-    return BookmarkListResponse(
-        bookmarks=[_to_response(b) for b in bookmarks],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return _json_response(
+        BookmarkListResponse(
+            bookmarks=[_to_summary_response(b) for b in bookmarks],
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump_json()
     )
 
 
-@router.get("/pinned", response_model=List[BookmarkResponse])
+@router.get("/stream")
+async def stream_bookmarks(
+    user_id: str = Depends(get_user_id),
+    include_archived: bool = Query(default=False),
+):
+    """Stream all of the user's bookmarks as NDJSON (one summary per line)."""
+    repo = ServiceRegistry.get_bookmark_repository()
+
+    async def _ndjson() -> AsyncIterator[str]:
+        async for bookmark in repo.iter_by_user(user_id, include_archived):
+            yield _to_summary_response(bookmark).model_dump_json() + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/pinned", response_model=List[BookmarkSummaryResponse])
 async def get_pinned_bookmarks(
     user_id: str = Depends(get_user_id),
 ):
@@ -80,7 +113,9 @@ async def get_pinned_bookmarks(
     repo = ServiceRegistry.get_bookmark_repository()
 
     bookmarks = await repo.get_pinned(user_id)
-    return [_to_response(b) for b in bookmarks]
+    return _json_response(
+        _SUMMARY_LIST.dump_json([_to_summary_response(b) for b in bookmarks])
+    )
 
 
 @router.get("/tags", response_model=BookmarkTagsResponse)
@@ -132,11 +167,13 @@ async def search_bookmarks(
 
     total = len(bookmarks)
 
-    return BookmarkListResponse(
-        bookmarks=[_to_response(b) for b in bookmarks],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return _json_response(
+        BookmarkListResponse(
+            bookmarks=[_to_summary_response(b) for b in bookmarks],
+            total=total,
+            skip=skip,
+            limit=limit,
+        ).model_dump_json()
     )
 
 
@@ -186,15 +223,21 @@ async def update_bookmark(
             detail="Access denied",
         )
 
-    updated = await repo.update(
-        bookmark_id=bookmark_id,
-        title=request.title,
-        tags=[t.lower().strip() for t in (request.tags or [])],
-        notes=request.notes,
-        folder=request.folder,
-        is_archived=request.is_archived,
-        is_pinned=request.is_pinned,
-    )
+    if request.title is not None:
+        bookmark.title = request.title
+    if request.tags is not None:
+        bookmark.tags = [t.lower().strip() for t in request.tags]
+    if request.notes is not None:
+        bookmark.notes = request.notes
+    if request.folder is not None:
+        bookmark.folder = request.folder
+    if request.is_archived is not None:
+        bookmark.is_archived = request.is_archived
+    if request.is_pinned is not None:
+        bookmark.is_pinned = request.is_pinned
+    bookmark.mark_updated()
+
+    updated = await repo.update(bookmark)
 
     return _to_response(updated)
 
@@ -274,4 +317,24 @@ def _to_response(bookmark: Bookmark) -> BookmarkResponse:
     )
 
 
+def _to_summary_response(bookmark: Bookmark) -> BookmarkSummaryResponse:
+    """Convert a listed Bookmark entity (no sources/artifacts) to its DTO."""
+    return BookmarkSummaryResponse(
+        id=bookmark.id,
+        user_id=bookmark.user_id,
+        session_id=bookmark.session_id,
+        message_id=bookmark.message_id,
+        query=bookmark.query,
+        response=bookmark.response,
+        title=bookmark.title,
+        tags=bookmark.tags,
+        notes=bookmark.notes,
+        folder=bookmark.folder,
+        is_pinned=bookmark.is_pinned,
+        is_archived=bookmark.is_archived,
+        created_at=bookmark.created_at,
+        updated_at=bookmark.updated_at,
+    )
+
+
 __all__ = ["router"]
@@ -1,12 +1,22 @@
 """RAG generation endpoints."""
 
+import json
+from typing import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from app.api.schemas.document_dto import QueryRequest, QueryResponse
+from app.api.schemas.document_dto import (
+    QueryRequest,
+    QueryResponse,
+    BatchQueryRequest,
+    BatchQueryResponse,
+)
 from app.application.use_cases.rag import QueryWithRAGUseCase, QueryWithRAGInput
 from app.domain.value_objects.rag_config import RAGConfig
 from app.domain.value_objects.generation_config import GenerationConfig
 from app.config.services import ServiceRegistry
+from app.config import rag_config
 
 
 router = APIRouter(prefix="/generate", tags=["generation"])
@@ -30,21 +40,10 @@ async def query_with_rag(request: QueryRequest):
             embedding_service=embedding_service,
             vector_store_service=vector_store,
             llm_service=llm_service,
+            response_cache=ServiceRegistry.get_response_cache(),
         )
 
-        result = await use_case.execute(
-            QueryWithRAGInput(
-                query=request.query,
-                collection=request.collection,
-                rag_config=RAGConfig(
-                    enabled=True,
-                    top_k=request.top_k,
-                    similarity_threshold=request.similarity_threshold,
-                    include_sources=request.include_sources,
-                ),
-                generation_config=GenerationConfig.balanced(),
-            )
-        )
+        result = await use_case.execute(_to_input(request))
 
         return QueryResponse(
             answer=result.answer,
@@ -58,12 +57,103 @@ async def query_with_rag(request: QueryRequest):
         )
 
 
+@router.post("/query/batch", response_model=BatchQueryResponse)
+async def query_with_rag_batch(request: BatchQueryRequest):
+    """Run several RAG queries concurrently (single batch embedding call)."""
+    try:
+        embedding_service = ServiceRegistry.get_embedding()
+        vector_store = ServiceRegistry.get_vector_store()
+        llm_service = ServiceRegistry.get_llm()
+
+        if not all([embedding_service, vector_store, llm_service]):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Required services not available",
+            )
+
+        use_case = QueryWithRAGUseCase(
+            embedding_service=embedding_service,
+            vector_store_service=vector_store,
+            llm_service=llm_service,
+            max_concurrency=rag_config.max_concurrency,
+            response_cache=ServiceRegistry.get_response_cache(),
+        )
+
+        results = await use_case.execute_many(
+            [_to_input(q) for q in request.queries]
+        )
+
+        return BatchQueryResponse(
+            results=[
+                QueryResponse(
+                    answer=r.answer,
+                    sources=r.sources,
+                    metadata=r.metadata,
+                )
+                for r in results
+            ]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch query failed: {str(e)}",
+        )
+
+
 @router.post("/query/stream")
 async def query_with_rag_stream(request: QueryRequest):
-    """Placeholder for streaming RAG."""
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Streaming not yet implemented in refactored version",
+    """Query with RAG (streaming, Server-Sent Events)."""
+
+    async def event_generator() -> AsyncIterator[str]:
+        try:
+            embedding_service = ServiceRegistry.get_embedding()
+            vector_store = ServiceRegistry.get_vector_store()
+            llm_service = ServiceRegistry.get_llm()
+
+            if not all([embedding_service, vector_store, llm_service]):
+                yield f"data: {json.dumps({'error': 'Required services not available'})}\n\n"
+                return
+
+            use_case = QueryWithRAGUseCase(
+                embedding_service=embedding_service,
+                vector_store_service=vector_store,
+                llm_service=llm_service,
+            )
+
+            # Sources first, then answer chunks as the LLM decodes them
+            async for event in use_case.execute_stream(_to_input(request)):
+                yield f"data: {json.dumps(event)}\n\n"
+
+            yield "data: [DONE]\n\n"
+
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+def _to_input(request: QueryRequest) -> QueryWithRAGInput:
+    """Map API query request to use case input."""
+    return QueryWithRAGInput(
+        query=request.query,
+        collection=request.collection,
+        rag_config=RAGConfig(
+            enabled=True,
+            top_k=request.top_k,
+            similarity_threshold=request.similarity_threshold,
+            include_sources=request.include_sources,
+        ),
+        generation_config=GenerationConfig.balanced(),
     )
 
 
@@ -1,8 +1,13 @@
 """Chat history and session routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from datetime import datetime
+from typing import List, Optional, Tuple
+import base64
+import binascii
 import json
+import logging
+import re
 
 from app.api.schemas.chat_dto import (
     CreateSessionRequest,
@@ -24,6 +29,45 @@ from app.config.services import ServiceRegistry
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+logger = logging.getLogger(__name__)
+
+# Next-page cursor for GET /sessions (the body stays a plain list)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_CURSOR_ID_RE = re.compile(r"^[0-9a-f]{24}$")
+
+
+def _encode_cursor(value: datetime, item_id: str) -> str:
+    """Opaque keyset cursor for the (timestamp, id) of a page's last item."""
+    raw = f"{value.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Parse a cursor from _encode_cursor; 400 on anything malformed."""
+    try:
+        value, item_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        if not _CURSOR_ID_RE.match(item_id):
+            raise ValueError(item_id)
+        return datetime.fromisoformat(value), item_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def _warn_skip_paging(endpoint: str, skip: int) -> None:
+    """Offset paging re-reads every skipped row; steer clients to cursors."""
+    if skip:
+        logger.warning(
+            "%s: skip-based paging is deprecated, pass `cursor` instead (skip=%s)",
+            endpoint,
+            skip,
+        )
+
 
 @router.post("/sessions", response_model=ChatSessionResponse)
 async def create_session(
@@ -86,10 +130,24 @@ async def send_message(request: SendMessageRequest):
 
 
 @router.get("/sessions/{session_id}/history", response_model=ChatHistoryResponse)
-async def get_history(session_id: str, limit: int = 50, skip: int = 0):
-    """Get chat history for session."""
+async def get_history(
+    session_id: str,
+    limit: int = 50,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+):
+    """
+    Get chat history for session.
+
+    Page with `cursor` (the previous response's next_cursor); `skip` is
+    deprecated and ignored when a cursor is given.
+    """
     from app.application.use_cases.chat import GetHistoryUseCase
 
+    after = _decode_cursor(cursor) if cursor else None
+    if after is None:
+        _warn_skip_paging("GET /chat/sessions/{session_id}/history", skip)
+
     try:
         chat_repo = ServiceRegistry.get_chat_repository()
         use_case = GetHistoryUseCase(chat_repo)
@@ -99,9 +157,13 @@ async def get_history(session_id: str, limit: int = 50, skip: int = 0):
                 session_id=session_id,
                 limit=limit,
                 skip=skip,
+                after=after,
             )
         )
 
+        full_page = result.messages and len(result.messages) == limit
+        last = result.messages[-1] if full_page else None
+
         return ChatHistoryResponse(
             session=ChatSessionResponse(
                 id=result.session.id,
@@ -124,6 +186,7 @@ async def get_history(session_id: str, limit: int = 50, skip: int = 0):
                 for msg in result.messages
             ],
             total=result.total_messages,
+            next_cursor=_encode_cursor(last.created_at, last.id) if last else None,
         )
 
     except ChatSessionNotFoundException as e:
@@ -132,19 +195,37 @@ async def get_history(session_id: str, limit: int = 50, skip: int = 0):
 
 @router.get("/sessions", response_model=List[ChatSessionResponse])
 async def list_sessions(
+    response: Response,
     user_id: str = Depends(get_user_id),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ):
-    """List chat sessions for user."""
+    """
+    List chat sessions for user, most recently updated first.
+
+    When more sessions may follow, the X-Next-Cursor response header holds
+    the `cursor` for the next page; `skip` is deprecated.
+    """
+    after = _decode_cursor(cursor) if cursor else None
+    if after is None:
+        _warn_skip_paging("GET /chat/sessions", skip)
+
     chat_repo = ServiceRegistry.get_chat_repository()
 
     sessions = await chat_repo.list_sessions_by_user(
         user_id=user_id,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
+    if sessions and len(sessions) == limit:
+        last = sessions[-1]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(
+            last.updated_at, last.id
+        )
+
     return [
         ChatSessionResponse(
             id=session.id,
@@ -1,9 +1,11 @@
 """Multimodal endpoints: voice, image, TTS."""
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
+from fastapi.responses import StreamingResponse
 
+from app.config import rag_config
 from app.config.services import ServiceRegistry
 from app.api.schemas.multimodal_dto import (
     VoiceQueryResponse,
@@ -33,6 +35,71 @@ def _get_llm_service():
     return ServiceRegistry.get_llm()
 
 
+_image_query_use_case = None
+
+
+def _get_image_query_use_case():
+    """Build the image query use case once; it holds no per-request state."""
+    global _image_query_use_case
+    if _image_query_use_case is None:
+        from app.application.use_cases.multimodal import ImageQueryUseCase
+
+        _image_query_use_case = ImageQueryUseCase(
+            llm_service=_get_llm_service(),
+            embedding_service=_get_embedding_service(),
+            vector_store=_get_vector_store(),
+            result_cache_size=rag_config.image_query_cache_size,
+            result_cache_ttl=rag_config.image_query_cache_ttl,
+        )
+    return _image_query_use_case
+
+
+_tts_service = None
+
+
+def _get_tts_service():
+    """Build the TTS service once; its audio cache is shared across requests."""
+    global _tts_service
+    if _tts_service is None:
+        from app.infrastructure.ai.tts import GeminiTTSService
+
+        _tts_service = GeminiTTSService()
+    return _tts_service
+
+
+def _tts_config(request: TTSRequest):
+    """Validate a TTS request and build its synthesis config."""
+    from app.application.interfaces.services.tts_service import (
+        TTSConfig,
+        SpeechSpeed,
+        VoiceGender,
+    )
+
+    if not request.text.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text cannot be empty",
+        )
+
+    if len(request.text) > 2000:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text too long. Maximum: 2000 characters",
+        )
+
+    try:
+        return TTSConfig(
+            voice_gender=VoiceGender(request.voice_gender),
+            speed=SpeechSpeed(request.speed),
+            language=request.language,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
 @router.post("/voice-query", response_model=VoiceQueryResponse)
 async def voice_query(
     audio: UploadFile = File(...),
@@ -100,7 +167,7 @@ async def image_query(
     session_id: Optional[str] = Form(None),
 ):
     """Process image query with Vision + RAG."""
-    from app.application.use_cases.multimodal import ImageQueryUseCase, ImageQueryInput
+    from app.application.use_cases.multimodal import ImageQueryInput
 
     if not image.filename:
         raise HTTPException(
@@ -128,13 +195,7 @@ async def image_query(
         )
 
     try:
-        use_case = ImageQueryUseCase(
-            llm_service=_get_llm_service(),
-            embedding_service=_get_embedding_service(),
-            vector_store=_get_vector_store(),
-        )
-
-        result = await use_case.execute(
+        result = await _get_image_query_use_case().execute(
             ImageQueryInput(
                 image_bytes=image_bytes,
                 image_format=ext,
@@ -161,17 +222,7 @@ async def image_query(
 @router.post("/text-to-speech")
 async def text_to_speech(request: TTSRequest):
     """Convert text to speech audio."""
-    if not request.text.strip():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Text cannot be empty",
-        )
-
-    if len(request.text) > 2000:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Text too long. Maximum: 2000 characters",
-        )
+    _tts_config(request)
 
     raise HTTPException(
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
@@ -179,6 +230,40 @@ async def text_to_speech(request: TTSRequest):
     )
 
 
+@router.post("/text-to-speech/stream")
+async def text_to_speech_stream(request: TTSRequest):
+    """
+    Stream speech audio as WAV while it is being synthesized.
+
+    Playback can start on the first chunk instead of after the whole
+    utterance has been generated.
+    """
+    config = _tts_config(request)
+    audio = _get_tts_service().synthesize_stream_wav(request.text, config)
+
+    # Pull the first chunk before responding so upstream failures still
+    # surface as an HTTP error rather than a truncated 200
+    try:
+        first = await anext(audio)
+    except StopAsyncIteration:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="No audio generated",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Speech synthesis failed: {str(e)}",
+        )
+
+    async def _body() -> AsyncIterator[bytes]:
+        yield first
+        async for chunk in audio:
+            yield chunk
+
+    return StreamingResponse(_body(), media_type="audio/wav")
+
+
 @router.get("/capabilities")
 async def get_capabilities():
     """Get available multimodal capabilities."""
@@ -199,6 +284,11 @@ async def get_capabilities():
             "available": False,
             "note": "Coming soon",
         },
+        "text_to_speech_stream": {
+            "available": True,
+            "format": "wav",
+            "sample_rate": 24000,
+        },
     }
 
 
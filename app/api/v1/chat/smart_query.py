@@ -2,7 +2,8 @@
 
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
+import asyncio
 import json
 import logging
 
@@ -20,6 +21,7 @@ from app.application.use_cases.rag import SmartQueryWithRAGUseCase, SmartQueryIn
 from app.application.services.conversation_context_service import (
     ConversationContextService,
 )
+from app.domain.value_objects.chat_response import ResponseIntent
 from app.domain.value_objects.rag_config import RAGConfig
 from app.domain.value_objects.generation_config import GenerationConfig
 from app.config.services import ServiceRegistry
@@ -29,6 +31,24 @@ router = APIRouter(prefix="/smart-query", tags=["smart-query"])
 logger = logging.getLogger(__name__)
 
 
+async def _load_conversation_context(chat_repo, session_id: Optional[str]) -> str:
+    """Load recent conversation history for a session (best effort)."""
+    if not session_id:
+        return ""
+    try:
+        context_window = await ConversationContextService(
+            chat_repo
+        ).build_context_window(session_id, max_messages=6)
+        return context_window.get_context_string()
+    except Exception as exc:  # pragma: no cover - best effort context
+        logger.warning(
+            "Failed to build conversation context for session %s: %s",
+            session_id,
+            exc,
+        )
+        return ""
+
+
 @router.post("", response_model=SmartQueryResponse)
 async def smart_query(request: SmartQueryRequest):
     """Smart query with artifact detection and rich response (non-streaming)."""
@@ -45,20 +65,9 @@ async def smart_query(request: SmartQueryRequest):
                 detail="Required services not available",
             )
 
-        context_service = ConversationContextService(chat_repo)
-        conversation_context = ""
-        if request.session_id:
-            try:
-                context_window = await context_service.build_context_window(
-                    request.session_id, max_messages=6
-                )
-                conversation_context = context_window.get_context_string()
-            except Exception as exc:  # pragma: no cover - best effort context
-                logger.warning(
-                    "Failed to build conversation context for session %s: %s",
-                    request.session_id,
-                    exc,
-                )
+        conversation_context = await _load_conversation_context(
+            chat_repo, request.session_id
+        )
 
         use_case = SmartQueryWithRAGUseCase(
             embedding_service=embedding_service,  # type: ignore
@@ -145,6 +154,7 @@ async def smart_query_stream(request: SmartQueryRequest):
     """Smart query with streaming response (Server-Sent Events)."""
     
     async def event_generator() -> AsyncIterator[str]:
+        context_task = None
         try:
             embedding_service = ServiceRegistry.get_embedding()
             vector_store = ServiceRegistry.get_vector_store()
@@ -156,20 +166,11 @@ async def smart_query_stream(request: SmartQueryRequest):
                 yield f"data: {json.dumps({'error': 'Required services not available'})}\n\n"
                 return
 
-            context_service = ConversationContextService(chat_repo)
-            conversation_context = ""
-            if request.session_id:
-                try:
-                    context_window = await context_service.build_context_window(
-                        request.session_id, max_messages=6
-                    )
-                    conversation_context = context_window.get_context_string()
-                except Exception as exc:  # pragma: no cover - best effort context
-                    logger.warning(
-                        "Failed to build conversation context for session %s: %s",
-                        request.session_id,
-                        exc,
-                    )
+            # Load conversation history while embedding + search run;
+            # it is only needed once the prompt is built
+            context_task = asyncio.create_task(
+                _load_conversation_context(chat_repo, request.session_id)
+            )
 
             # Step 1: RAG retrieval (same as non-streaming)
             input_data = SmartQueryInput(
@@ -187,7 +188,6 @@ async def smart_query_stream(request: SmartQueryRequest):
                     temperature=request.temperature,
                     max_tokens=request.max_tokens,
                 ),
-                conversation_context=conversation_context,
             )
 
             # Get embedding and search
@@ -224,7 +224,7 @@ async def smart_query_stream(request: SmartQueryRequest):
 
             # Fetch artifacts if needed
             artifacts = []
-            if intent in ["file_request", "form_request"]:
+            if intent in (ResponseIntent.FILE_REQUEST, ResponseIntent.FORM_REQUEST):
                 wants_fillable = use_case._wants_fillable_form(request.query)
                 artifacts = await use_case._fetch_artifacts(search_results, wants_fillable)
                 
@@ -241,6 +241,7 @@ async def smart_query_stream(request: SmartQueryRequest):
                 yield f"data: {json.dumps({'artifacts': artifacts_data})}\n\n"
 
             # Build prompt
+            conversation_context = await context_task
             system_prompt = use_case.DEFAULT_SYSTEM_PROMPT
             full_prompt = use_case._build_prompt(
                 query=request.query,
@@ -264,6 +265,10 @@ async def smart_query_stream(request: SmartQueryRequest):
 
         except Exception as e:
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            # Errors and client disconnects must not leave the history load running
+            if context_task is not None and not context_task.done():
+                context_task.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -1,5 +1,6 @@
 """Web crawler interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 
@@ -34,6 +35,42 @@ class IWebCrawler(ABC):
         """
         pass
 
+    async def scrape_urls(
+        self,
+        urls: List[str],
+        formats: List[str] = None,
+        concurrency: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape several URLs concurrently.
+
+        Args:
+            urls: URLs to scrape
+            formats: Desired output formats
+            concurrency: Maximum scrapes in flight (provider rate limits)
+
+        Returns:
+            One scrape_url result per URL, in input order; failures are
+            returned as {"success": False, "url": ..., "error": ...}
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scrape_url(url, formats=formats)
+
+        results = await asyncio.gather(
+            *(_one(url) for url in urls), return_exceptions=True
+        )
+        return [
+            (
+                {"success": False, "url": url, "error": str(result)}
+                if isinstance(result, Exception)
+                else result
+            )
+            for url, result in zip(urls, results)
+        ]
+
     @abstractmethod
     async def crawl_website(
         self,
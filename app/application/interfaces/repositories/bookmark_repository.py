@@ -1,13 +1,18 @@
 """Bookmark repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List, Tuple
 
 from app.domain.entities.bookmark import Bookmark
 
 
 class IBookmarkRepository(ABC):
-    """Interface for bookmark data access."""
+    """
+    Interface for bookmark data access.
+
+    List methods (get_by_user, list_with_total, search, get_pinned) may
+    leave sources/artifacts empty; get_by_id returns the full bookmark.
+    """
 
     @abstractmethod
     async def create(self, bookmark: Bookmark) -> Bookmark:
@@ -30,6 +35,26 @@ class IBookmarkRepository(ABC):
         """Get bookmarks for a user."""
         pass
 
+    async def iter_by_user(
+        self,
+        user_id: str,
+        include_archived: bool = False,
+        page_size: int = 100,
+    ) -> AsyncIterator[Bookmark]:
+        """
+        Yield all of a user's bookmarks in list order without materializing them.
+
+        Default pages through get_by_user; implementations may stream a cursor.
+        """
+        skip = 0
+        while True:
+            page = await self.get_by_user(user_id, skip, page_size, include_archived)
+            for bookmark in page:
+                yield bookmark
+            if len(page) < page_size:
+                return
+            skip += page_size
+
     @abstractmethod
     async def search(
         self,
@@ -43,11 +68,35 @@ class IBookmarkRepository(ABC):
         """Search bookmarks by query, tags, or folder."""
         pass
 
+    async def list_with_total(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        include_archived: bool = False,
+    ) -> Tuple[List[Bookmark], int]:
+        """
+        Get a page of bookmarks for a user plus the user's total count.
+
+        Default issues two queries; implementations may fuse them.
+        """
+        bookmarks = await self.get_by_user(user_id, skip, limit, include_archived)
+        total = await self.count_by_user(user_id, include_archived)
+        return bookmarks, total
+
     @abstractmethod
     async def update(self, bookmark: Bookmark) -> Bookmark:
         """Update an existing bookmark."""
         pass
 
+    async def bulk_create(self, bookmarks: List[Bookmark]) -> List[Bookmark]:
+        """Create many bookmarks. Default creates them one by one."""
+        return [await self.create(bookmark) for bookmark in bookmarks]
+
+    async def bulk_update(self, bookmarks: List[Bookmark]) -> List[Bookmark]:
+        """Update many bookmarks. Default updates them one by one."""
+        return [await self.update(bookmark) for bookmark in bookmarks]
+
     @abstractmethod
     async def delete(self, bookmark_id: str) -> bool:
         """Delete a bookmark."""
@@ -1,7 +1,8 @@
 """Chat repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from app.domain.entities.chat_session import ChatSession
 from app.domain.entities.chat_message import ChatMessage
 
@@ -42,8 +43,15 @@ class IChatRepository(ABC):
         skip: int = 0,
         limit: int = 100,
         include_archived: bool = False,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ChatSession]:
-        """List all sessions for a user."""
+        """
+        List all sessions for a user, most recently updated first.
+
+        `after` is a keyset cursor - (updated_at, id) of the last session of
+        the previous page - and takes precedence over `skip`. Raises
+        ValueError if the cursor id is malformed.
+        """
         pass
 
     @abstractmethod
@@ -55,6 +63,23 @@ class IChatRepository(ABC):
         """Count sessions for a user."""
         pass
 
+    @abstractmethod
+    async def list_and_count_all_sessions(
+        self,
+        user_id: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        is_archived: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[ChatSession], int]:
+        """
+        List sessions across all users (admin) plus the total matching count.
+
+        Sessions are ordered most recently updated first.
+        """
+        pass
+
     # ===== Chat Message Methods =====
 
     @abstractmethod
@@ -84,8 +109,15 @@ class IChatRepository(ABC):
         skip: int = 0,
         limit: int = 100,
         include_deleted: bool = False,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ChatMessage]:
-        """List all messages in a session."""
+        """
+        List all messages in a session, oldest first.
+
+        `after` is a keyset cursor - (created_at, id) of the last message of
+        the previous page - and takes precedence over `skip`. Raises
+        ValueError if the cursor id is malformed.
+        """
         pass
 
     @abstractmethod
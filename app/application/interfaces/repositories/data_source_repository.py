@@ -1,7 +1,7 @@
 """Data source repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from app.domain.entities.data_source import DataSource
 from app.domain.enums.data_source import SourceStatus, DataCategory
@@ -52,6 +52,23 @@ class IDataSourceRepository(ABC):
         """Count data sources with filters."""
         pass
 
+    async def list_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[SourceStatus] = None,
+        category: Optional[DataCategory] = None,
+        is_active: Optional[bool] = None,
+    ) -> Tuple[List[DataSource], int]:
+        """
+        List data sources with filters plus the total matching count.
+
+        Default issues two queries; implementations may fuse them.
+        """
+        sources = await self.list(skip, limit, status, category, is_active)
+        total = await self.count(status, category, is_active)
+        return sources, total
+
     @abstractmethod
     async def get_active_sources(self) -> List[DataSource]:
         """Get all active data sources for scheduling."""
@@ -38,6 +38,19 @@ class IDocumentRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, document_ids: List[str]) -> Dict[str, Document]:
+        """
+        Get several documents in one round-trip.
+
+        Args:
+            document_ids: Document IDs
+
+        Returns:
+            Mapping of ID to document; missing or invalid IDs are omitted
+        """
+        pass
+
     @abstractmethod
     async def update(self, document: Document) -> Document:
         """
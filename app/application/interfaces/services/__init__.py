@@ -11,6 +11,7 @@ from .web_search_service import (
     SearchResult as WebSearchResult,
 )
 from .rag_service import IRAGService, IndexDocumentInput, IndexDocumentOutput
+from .response_cache_service import IResponseCache
 
 __all__ = [
     "ILLMService",
@@ -25,4 +26,6 @@ __all__ = [
     "IRAGService",
     "IndexDocumentInput",
     "IndexDocumentOutput",
+    # Response cache
+    "IResponseCache",
 ]
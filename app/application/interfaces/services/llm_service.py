@@ -82,3 +82,12 @@ class ILLMService(ABC):
         raise NotImplementedError(
             f"{self.__class__.__name__} does not support image QA"
         )
+
+    async def warmup(self) -> None:
+        """
+        Open the provider connection ahead of real traffic (optional).
+
+        Called once at startup so the first user request does not pay for
+        TLS handshake and auth. Must not raise.
+        """
+        return None
@@ -0,0 +1,53 @@
+"""Response cache service interface."""
+
+from abc import ABC, abstractmethod
+from typing import Hashable, List, Optional
+
+
+class IResponseCache(ABC):
+    """
+    Interface for semantic LLM response caches.
+
+    Entries are matched by embedding similarity within a scope. The scope
+    carries whatever must match exactly for an answer to be reusable
+    (e.g. collection and retrieved source IDs for RAG).
+    """
+
+    @abstractmethod
+    async def lookup(
+        self,
+        embedding: List[float],
+        scope: Hashable = None,
+        threshold: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Find a cached answer for a semantically similar query.
+
+        Args:
+            embedding: Query embedding
+            scope: Exact-match partition key
+            threshold: Minimum cosine similarity (implementation default if None)
+
+        Returns:
+            Cached answer or None on miss
+        """
+        pass
+
+    @abstractmethod
+    async def put(
+        self,
+        embedding: List[float],
+        query: str,
+        answer: str,
+        scope: Hashable = None,
+    ) -> None:
+        """
+        Store an answer.
+
+        Args:
+            embedding: Query embedding
+            query: Original query text
+            answer: Generated answer
+            scope: Exact-match partition key
+        """
+        pass
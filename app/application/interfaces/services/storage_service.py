@@ -1,7 +1,7 @@
 """Storage service interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 
 class IStorageService(ABC):
@@ -14,19 +14,21 @@ class IStorageService(ABC):
     @abstractmethod
     async def upload_file(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, BinaryIO],
         filename: str,
         content_type: str,
         path_prefix: Optional[str] = None,
+        length: Optional[int] = None,
     ) -> str:
         """
         Upload file and return URL.
 
         Args:
-            file_data: File bytes
+            file_data: File bytes, or a readable binary stream
             filename: Filename
             content_type: MIME type
             path_prefix: Optional path prefix (e.g., "avatars/", "uploads/")
+            length: Stream size in bytes, if known (ignored for bytes)
 
         Returns:
             Public URL to uploaded file
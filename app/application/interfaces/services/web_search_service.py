@@ -1,7 +1,8 @@
 """Web Search service interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Union
 from dataclasses import dataclass
 
 
@@ -47,6 +48,36 @@ class IWebSearchService(ABC):
         """
         pass
 
+    async def search_many(
+        self,
+        queries: List[str],
+        num_results: int = 5,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> List[Union[WebSearchResponse, Exception]]:
+        """
+        Run several searches concurrently.
+
+        Args:
+            queries: Search queries
+            num_results: Maximum number of results per query
+            concurrency: Maximum searches in flight (provider rate limits)
+            **kwargs: Additional search parameters
+
+        Returns:
+            One WebSearchResponse per query, in input order; a failed query
+            yields its exception instead of cancelling the others
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(query: str) -> WebSearchResponse:
+            async with semaphore:
+                return await self.search(query, num_results, **kwargs)
+
+        return await asyncio.gather(
+            *(_one(query) for query in queries), return_exceptions=True
+        )
+
     async def search_and_summarize(self, query: str, **kwargs) -> str:
         """
         Search and return a summarized answer (convenience method).
@@ -60,3 +91,7 @@ class IWebSearchService(ABC):
         """
         response = await self.search(query, **kwargs)
         return response.answer
+
+    async def close(self) -> None:
+        """Release network resources held by the provider (default: none)."""
+        return None
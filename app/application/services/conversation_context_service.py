@@ -1,6 +1,7 @@
 """Conversation context service for memory management."""
 
 from dataclasses import dataclass
+from itertools import islice
 from typing import List, Dict, Any, Optional
 import re
 import logging
@@ -22,6 +23,16 @@ ENTITY_PATTERNS = {
     "date": r"\b\d{1,2}/\d{1,2}/\d{4}\b",
 }
 
+# Compiled once at import - extract_entities runs on every message
+_COMPILED_ENTITY_PATTERNS = tuple(
+    (entity_type, re.compile(pattern, re.IGNORECASE))
+    for entity_type, pattern in ENTITY_PATTERNS.items()
+)
+
+# Summary limits
+SUMMARY_MAX_MESSAGES = 20  # Messages sent to LLM summary
+SUMMARY_MAX_TOPICS = 5  # User questions used in rule-based summary
+
 # Intent detection keywords (Vietnamese)
 INTENT_KEYWORDS = {
     MessageIntent.FILE_REQUEST: [
@@ -90,6 +101,8 @@ class ConversationContextService:
     5. Track conversation topics
     """
 
+    __slots__ = ("chat_repo", "llm_service")
+
     def __init__(
         self,
         chat_repository: IChatRepository,
@@ -165,9 +178,8 @@ class ConversationContextService:
         """
         entities = []
 
-        for entity_type, pattern in ENTITY_PATTERNS.items():
-            matches = re.finditer(pattern, message, re.IGNORECASE)
-            for match in matches:
+        for entity_type, pattern in _COMPILED_ENTITY_PATTERNS:
+            for match in pattern.finditer(message):
                 entities.append(
                     EntityMention(
                         entity_type=entity_type,
@@ -198,12 +210,10 @@ class ConversationContextService:
             # Fallback to simple summary
             return self._simple_summary(messages)
 
-        # Build prompt for LLM
+        # Build prompt for LLM - only the last 20 messages are ever used
         messages_text = "\n".join(
-            [
-                f"{'User' if m.is_from_user() else 'Assistant'}: {m.content}"
-                for m in messages[-20:]  # Last 20 messages
-            ]
+            f"{'User' if m.is_from_user() else 'Assistant'}: {m.content}"
+            for m in messages[-SUMMARY_MAX_MESSAGES:]
         )
 
         prompt = f"""Tóm tắt ngắn gọn cuộc hội thoại sau bằng tiếng Việt (tối đa 3 câu):
@@ -225,13 +235,16 @@ Tóm tắt:"""
 
     def _simple_summary(self, messages: List[ChatMessage]) -> str:
         """Generate simple rule-based summary."""
-        user_messages = [m for m in messages if m.is_from_user()]
+        # Only the first 5 user messages are used - stop scanning once found
+        user_messages = list(
+            islice((m for m in messages if m.is_from_user()), SUMMARY_MAX_TOPICS)
+        )
         if not user_messages:
             return "Cuộc hội thoại trống"
 
         # Extract main topics from user questions
         topics = []
-        for msg in user_messages[:5]:  # First 5 user messages
+        for msg in user_messages:
             # Simple: take first 50 chars of each question
             preview = msg.content[:50].strip()
             if preview:
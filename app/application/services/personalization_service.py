@@ -13,6 +13,34 @@ from app.application.interfaces.repositories.student_profile_repository import (
 )
 
 
+# Level-based prompt instructions
+LEVEL_INSTRUCTIONS = {
+    StudentLevel.FRESHMAN: "Giải thích chi tiết các khái niệm cơ bản, sử dụng ngôn ngữ đơn giản.",
+    StudentLevel.SOPHOMORE: "Giải thích rõ ràng, có thể dùng một số thuật ngữ chuyên ngành.",
+    StudentLevel.JUNIOR: "Trả lời chuyên sâu, sử dụng thuật ngữ chuyên ngành.",
+    StudentLevel.SENIOR: "Trả lời ngắn gọn, chuyên sâu, tập trung vào thực hành.",
+    StudentLevel.GRADUATE: "Trả lời học thuật, chuyên sâu, có thể đề cập nghiên cứu.",
+    StudentLevel.ALUMNI: "Trả lời thực tiễn, hướng nghề nghiệp.",
+}
+
+# Detail level prompt instructions
+DETAIL_INSTRUCTIONS = {
+    "brief": "Trả lời ngắn gọn, đi thẳng vào vấn đề.",
+    "medium": "Trả lời đầy đủ nhưng súc tích.",
+    "detailed": "Trả lời chi tiết, có ví dụ minh họa.",
+}
+
+# Topic relationships (simple mapping)
+RELATED_TOPICS = {
+    "đăng ký học": ["lịch học", "học phí", "thời khóa biểu"],
+    "học phí": ["học bổng", "miễn giảm", "thanh toán"],
+    "thủ tục": ["mẫu đơn", "phòng đào tạo", "giấy tờ"],
+    "mẫu đơn": ["thủ tục", "phòng đào tạo"],
+    "điểm": ["học bổng", "cảnh báo học vụ", "bảng điểm"],
+    "tốt nghiệp": ["bằng", "đồ án", "thực tập"],
+}
+
+
 @dataclass
 class PersonalizedContext:
     """Context for personalized responses."""
@@ -31,6 +59,8 @@ class PersonalizationService:
     Adapts responses to student's level, interests, and preferences.
     """
 
+    __slots__ = ("profile_repository",)
+
     def __init__(self, profile_repository: IStudentProfileRepository):
         self.profile_repository = profile_repository
 
@@ -107,27 +137,12 @@ class PersonalizationService:
         parts = []
 
         # Level-based instructions
-        level_instructions = {
-            StudentLevel.FRESHMAN: "Giải thích chi tiết các khái niệm cơ bản, sử dụng ngôn ngữ đơn giản.",
-            StudentLevel.SOPHOMORE: "Giải thích rõ ràng, có thể dùng một số thuật ngữ chuyên ngành.",
-            StudentLevel.JUNIOR: "Trả lời chuyên sâu, sử dụng thuật ngữ chuyên ngành.",
-            StudentLevel.SENIOR: "Trả lời ngắn gọn, chuyên sâu, tập trung vào thực hành.",
-            StudentLevel.GRADUATE: "Trả lời học thuật, chuyên sâu, có thể đề cập nghiên cứu.",
-            StudentLevel.ALUMNI: "Trả lời thực tiễn, hướng nghề nghiệp.",
-        }
-
-        if profile.level in level_instructions:
-            parts.append(level_instructions[profile.level])
+        if profile.level in LEVEL_INSTRUCTIONS:
+            parts.append(LEVEL_INSTRUCTIONS[profile.level])
 
         # Detail level
-        detail_instructions = {
-            "brief": "Trả lời ngắn gọn, đi thẳng vào vấn đề.",
-            "medium": "Trả lời đầy đủ nhưng súc tích.",
-            "detailed": "Trả lời chi tiết, có ví dụ minh họa.",
-        }
-
-        if profile.preferred_detail_level in detail_instructions:
-            parts.append(detail_instructions[profile.preferred_detail_level])
+        if profile.preferred_detail_level in DETAIL_INSTRUCTIONS:
+            parts.append(DETAIL_INSTRUCTIONS[profile.preferred_detail_level])
 
         # Major context
         if profile.major:
@@ -139,20 +154,10 @@ class PersonalizationService:
         """Suggest related topics based on interests."""
         top_interests = [t.topic for t in profile.get_top_interests(3)]
 
-        # Topic relationships (simple mapping)
-        related_topics = {
-            "đăng ký học": ["lịch học", "học phí", "thời khóa biểu"],
-            "học phí": ["học bổng", "miễn giảm", "thanh toán"],
-            "thủ tục": ["mẫu đơn", "phòng đào tạo", "giấy tờ"],
-            "mẫu đơn": ["thủ tục", "phòng đào tạo"],
-            "điểm": ["học bổng", "cảnh báo học vụ", "bảng điểm"],
-            "tốt nghiệp": ["bằng", "đồ án", "thực tập"],
-        }
-
         suggestions = set()
         for topic in top_interests:
             topic_lower = topic.lower()
-            for key, related in related_topics.items():
+            for key, related in RELATED_TOPICS.items():
                 if key in topic_lower:
                     suggestions.update(related)
 
@@ -214,7 +214,7 @@ class RAGService(IRAGService):
         # Limit to top_k
         results = results[: cfg.top_k]
 
-        logger.debug(f"Search returned {len(results)} results")
+        logger.debug("Search returned %s results", len(results))
         return results
 
     # =============================================
@@ -235,9 +235,10 @@ class RAGService(IRAGService):
         )
 
         logger.debug(
-            f"Built context: {context.total_results} results, "
-            f"avg_score={context.avg_score:.3f}, "
-            f"{context.unique_sources} unique sources"
+            "Built context: %s results, avg_score=%.3f, %s unique sources",
+            context.total_results,
+            context.avg_score,
+            context.unique_sources,
         )
 
         return context
@@ -105,35 +105,24 @@ Answer:"""
         urls: List[str],
     ) -> List[Dict[str, Any]]:
         """
-        Scrape multiple URLs.
+        Scrape multiple URLs (concurrently).
 
         Returns list of scrape results.
         """
-        results = []
-
-        for url in urls:
-            try:
-                result = await self.crawler.scrape_url(
-                    url=url,
-                    formats=["markdown"],
-                )
-                results.append(
-                    {
-                        "url": url,
-                        "success": result.get("success", False),
-                        "content": result.get("content", ""),
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "url": url,
-                        "success": False,
-                        "error": str(e),
-                    }
-                )
-
-        return results
+        scraped = await self.crawler.scrape_urls(urls, formats=["markdown"])
+
+        return [
+            (
+                {"url": url, "success": True, "content": result.get("content", "")}
+                if result.get("success")
+                else {
+                    "url": url,
+                    "success": False,
+                    "error": result.get("error", "Failed to scrape URL"),
+                }
+            )
+            for url, result in zip(urls, scraped)
+        ]
 
     def build_search_context(
         self,
@@ -144,13 +133,9 @@ Answer:"""
 
         Formats search results into readable context for LLM.
         """
-        context_parts = []
-
-        for i, result in enumerate(search_results, 1):
-            if result.get("success"):
-                url = result.get("url", "")
-                content = result.get("content", "")[:500]  # Limit per result
-
-                context_parts.append(f"[Source {i}] {url}\n{content}\n")
-
-        return "\n\n".join(context_parts)
+        return "\n\n".join(
+            # Limit content per result
+            f"[Source {i}] {result.get('url', '')}\n{result.get('content', '')[:500]}\n"
+            for i, result in enumerate(search_results, 1)
+            if result.get("success")
+        )
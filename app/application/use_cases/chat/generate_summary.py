@@ -1,5 +1,6 @@
 """Generate chat summary use case."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import List
 from app.domain.entities.chat_session import ChatSession
@@ -89,13 +90,6 @@ class GenerateSummaryUseCase:
 
 Title:"""
 
-        title = await self.llm_service.generate(
-            prompt=title_prompt,
-            temperature=0.3,
-            max_tokens=50,
-        )
-        title = title.strip().strip("\"'")
-
         # 5. Generate summary
         summary_prompt = f"""Summarize the following conversation in {input_data.max_length} characters or less:
 
@@ -103,11 +97,20 @@ Title:"""
 
 Summary:"""
 
-        summary = await self.llm_service.generate(
-            prompt=summary_prompt,
-            temperature=0.3,
-            max_tokens=input_data.max_length,
+        # Title and summary are independent - run both LLM calls concurrently
+        title, summary = await asyncio.gather(
+            self.llm_service.generate(
+                prompt=title_prompt,
+                temperature=0.3,
+                max_tokens=50,
+            ),
+            self.llm_service.generate(
+                prompt=summary_prompt,
+                temperature=0.3,
+                max_tokens=input_data.max_length,
+            ),
         )
+        title = title.strip().strip("\"'")
         summary = summary.strip()
 
         # 6. Update session with summary (business logic)
@@ -1,7 +1,8 @@
 """Get chat history use case."""
 
 from dataclasses import dataclass
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 from app.domain.entities.chat_session import ChatSession
 from app.domain.entities.chat_message import ChatMessage
 from app.domain.exceptions.chat_exceptions import ChatSessionNotFoundException
@@ -15,6 +16,8 @@ class GetHistoryInput:
     session_id: str
     limit: int = 50
     skip: int = 0
+    # Keyset cursor: (created_at, id) of the last message already returned
+    after: Optional[Tuple[datetime, str]] = None
 
 
 @dataclass
@@ -65,6 +68,7 @@ class GetHistoryUseCase:
             skip=input_data.skip,
             limit=input_data.limit,
             include_deleted=False,
+            after=input_data.after,
         )
 
         # 3. Get total count
@@ -39,7 +39,7 @@ class ListDataSourcesUseCase:
 
     async def execute(self, input_data: ListDataSourcesInput) -> ListDataSourcesOutput:
         """List data sources with pagination and filters."""
-        sources = await self.repository.list(
+        sources, total = await self.repository.list_with_total(
             skip=input_data.skip,
             limit=input_data.limit,
             status=input_data.status,
@@ -47,12 +47,6 @@ class ListDataSourcesUseCase:
             is_active=input_data.is_active,
         )
 
-        total = await self.repository.count(
-            status=input_data.status,
-            category=input_data.category,
-            is_active=input_data.is_active,
-        )
-
         return ListDataSourcesOutput(
             sources=sources,
             total=total,
@@ -1,8 +1,11 @@
 """Image Query use case - Vision + RAG pipeline."""
 
+import copy
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-import base64
+from typing import Optional, List, Dict, Any, Tuple
 
 from app.application.interfaces.services.llm_service import ILLMService
 from app.application.interfaces.services.vector_store_service import IVectorStoreService
@@ -46,6 +49,10 @@ class ImageQueryUseCase:
     3. Search related documents (RAG)
     4. Generate contextual response
 
+    Identical image bytes + question (re-uploads, client retries) reuse the
+    previous result for result_cache_ttl seconds. Callers always get their
+    own copy, so mutating a result never alters the cached entry.
+
     Single Responsibility: Image-to-response pipeline
     """
 
@@ -54,10 +61,17 @@ class ImageQueryUseCase:
         llm_service: ILLMService,  # Must support vision
         embedding_service: Optional[IEmbeddingService],
         vector_store: IVectorStoreService,
+        result_cache_size: int,
+        result_cache_ttl: float,
     ):
         self.llm_service = llm_service
         self.embedding_service = embedding_service
         self.vector_store = vector_store
+        self.result_cache_size = result_cache_size
+        self.result_cache_ttl = result_cache_ttl
+        self._results: "OrderedDict[Tuple, Tuple[float, ImageQueryOutput]]" = (
+            OrderedDict()
+        )
 
     async def execute(self, input_data: ImageQueryInput) -> ImageQueryOutput:
         """
@@ -69,11 +83,31 @@ class ImageQueryUseCase:
         Returns:
             ImageQueryOutput with analysis and response
         """
-        # 1. Encode image to base64
-        image_b64 = base64.b64encode(input_data.image_bytes).decode("utf-8")
+        cache_key = (
+            hashlib.blake2b(input_data.image_bytes, digest_size=16).digest(),
+            input_data.image_format,
+            input_data.question,
+        )
+        cached = self._results.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            self._results.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+
+        output = await self._run(input_data)
 
-        # 2. Analyze image with Vision
-        analysis = await self._analyze_image(image_b64, input_data.image_format)
+        self._results[cache_key] = (time.monotonic() + self.result_cache_ttl, output)
+        self._results.move_to_end(cache_key)
+        while len(self._results) > self.result_cache_size:
+            self._results.popitem(last=False)
+
+        return copy.deepcopy(output)
+
+    async def _run(self, input_data: ImageQueryInput) -> ImageQueryOutput:
+        """Run the Vision + RAG pipeline."""
+        # 1-2. Analyze image with Vision (raw bytes - providers encode as needed)
+        analysis = await self._analyze_image(
+            input_data.image_bytes, input_data.image_format
+        )
 
         description = analysis.get("description", "")
         extracted_text = analysis.get("text", "")
@@ -96,14 +130,14 @@ class ImageQueryUseCase:
                 score_threshold=0.5,
             )
 
-            for result in search_results:
-                related_docs.append(
-                    {
-                        "title": result.get("metadata", {}).get("title", ""),
-                        "content": result.get("content", "")[:200],
-                        "score": result.get("score", 0.0),
-                    }
-                )
+            related_docs = [
+                {
+                    "title": (result.get("metadata") or {}).get("title", ""),
+                    "content": result.get("content", "")[:200],
+                    "score": result.get("score", 0.0),
+                }
+                for result in search_results
+            ]
 
         # 5. Generate response
         response = await self._generate_response(
@@ -121,7 +155,7 @@ class ImageQueryUseCase:
             related_documents=related_docs,
         )
 
-    async def _analyze_image(self, image_b64: str, format: str) -> Dict[str, Any]:
+    async def _analyze_image(self, image: bytes, format: str) -> Dict[str, Any]:
         """Analyze image using Vision model."""
         mime_type = f"image/{format}"
 
@@ -137,7 +171,7 @@ Nếu đây là tài liệu học viện, đơn từ, hoặc biểu mẫu, hãy
         if hasattr(self.llm_service, "image_qa"):
             response = await self.llm_service.image_qa(
                 prompt=prompt,
-                image=image_b64,
+                image=image,
                 mime_type=mime_type,
             )
         else:
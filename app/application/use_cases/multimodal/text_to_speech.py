@@ -1,5 +1,6 @@
 """Text-to-Speech use case."""
 
+import re
 from dataclasses import dataclass
 
 from app.application.interfaces.services.tts_service import (
@@ -10,6 +11,11 @@ from app.application.interfaces.services.tts_service import (
 )
 
 
+# Markdown formatting characters dropped before synthesis
+_MARKDOWN_STRIP = str.maketrans("", "", "*_`")
+_URL_RE = re.compile(r"http[s]?://\S+")
+
+
 @dataclass
 class TextToSpeechInput:
     """Input for text-to-speech."""
@@ -86,16 +92,11 @@ class TextToSpeechUseCase:
 
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for better TTS output."""
-        # Remove markdown formatting
-        text = text.replace("**", "")
-        text = text.replace("*", "")
-        text = text.replace("_", "")
-        text = text.replace("`", "")
+        # Remove markdown formatting (single pass)
+        text = text.translate(_MARKDOWN_STRIP)
 
         # Remove URLs
-        import re
-
-        text = re.sub(r"http[s]?://\S+", "", text)
+        text = _URL_RE.sub("", text)
 
         # Remove excessive whitespace
         text = " ".join(text.split())
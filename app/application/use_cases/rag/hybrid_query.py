@@ -65,8 +65,8 @@ class HybridQueryUseCase:
     Decision Logic:
     1. First try RAG search in knowledge base
     2. If RAG confidence < threshold, fallback to web search
-    3. Combine results if both have relevant info
-    4. Generate final answer with LLM
+    3. Web-only result is returned as-is (already a grounded answer)
+    4. Otherwise combine results and generate final answer with LLM
 
     Use Cases:
     - Questions about PTIT → RAG (knowledge base)
@@ -178,14 +178,43 @@ Quy tắc:
                 # Web search failed, continue with RAG only
                 pass
 
-        # 3. Build final context
+        # 3. Web-only result is already a grounded LLM answer - skip synthesis
+        # unless the caller needs their own system prompt applied
+        if (
+            source == QuerySource.WEB_SEARCH
+            and web_context
+            and input_data.system_prompt is None
+        ):
+            answer = web_context
+        else:
+            answer = await self._synthesize(input_data, kb_context, web_context, source)
+
+        return HybridQueryOutput(
+            answer=answer,
+            source=source,
+            kb_sources=kb_sources,
+            kb_confidence=kb_confidence,
+            web_sources=web_sources,
+            metadata={
+                "used_rag": input_data.use_rag and len(kb_sources) > 0,
+                "used_web": len(web_sources) > 0,
+            },
+        )
+
+    async def _synthesize(
+        self,
+        input_data: HybridQueryInput,
+        kb_context: str,
+        web_context: str,
+        source: QuerySource,
+    ) -> str:
+        """Generate final answer with LLM from combined contexts."""
         final_context = self._combine_contexts(
             kb_context=kb_context,
             web_context=web_context,
             source=source,
         )
 
-        # 4. Generate answer
         system_prompt = input_data.system_prompt or self.DEFAULT_SYSTEM_PROMPT
 
         if final_context:
@@ -197,23 +226,11 @@ Câu hỏi: {input_data.query}"""
         else:
             prompt = input_data.query
 
-        answer = await self.llm_service.generate(
+        return await self.llm_service.generate(
             prompt=prompt,
             system_prompt=system_prompt,
         )
 
-        return HybridQueryOutput(
-            answer=answer,
-            source=source,
-            kb_sources=kb_sources,
-            kb_confidence=kb_confidence,
-            web_sources=web_sources,
-            metadata={
-                "used_rag": input_data.use_rag and len(kb_sources) > 0,
-                "used_web": len(web_sources) > 0,
-            },
-        )
-
     def _build_context(self, search_results: List[Dict[str, Any]]) -> str:
         """Build context from search results."""
         if not search_results:
@@ -1,12 +1,14 @@
 """Query with RAG use case."""
 
+import asyncio
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from app.domain.value_objects.rag_config import RAGConfig
 from app.domain.value_objects.generation_config import GenerationConfig
 from app.application.interfaces.services.embedding_service import IEmbeddingService
 from app.application.interfaces.services.vector_store_service import IVectorStoreService
 from app.application.interfaces.services.llm_service import ILLMService
+from app.application.interfaces.services.response_cache_service import IResponseCache
 
 
 @dataclass
@@ -39,20 +41,34 @@ class QueryWithRAGUseCase:
        - Search vector store for relevant documents
        - Build context from retrieved documents
     2. Generate answer with LLM using context
+       (reused from the response cache for semantically equivalent queries
+       over the same sources, when a cache is configured)
     3. Return answer with sources
 
     Single Responsibility: RAG query workflow
     """
 
+    __slots__ = (
+        "embedding_service",
+        "vector_store",
+        "llm_service",
+        "max_concurrency",
+        "response_cache",
+    )
+
     def __init__(
         self,
         embedding_service: IEmbeddingService,
         vector_store_service: IVectorStoreService,
         llm_service: ILLMService,
+        max_concurrency: int = 4,
+        response_cache: Optional[IResponseCache] = None,
     ):
         self.embedding_service = embedding_service
         self.vector_store = vector_store_service
         self.llm_service = llm_service
+        self.max_concurrency = max_concurrency
+        self.response_cache = response_cache
 
     async def execute(self, input_data: QueryWithRAGInput) -> QueryWithRAGOutput:
         """
@@ -64,18 +80,151 @@ class QueryWithRAGUseCase:
         Returns:
             QueryWithRAGOutput with answer and sources
         """
+        rag_config = input_data.rag_config or RAGConfig()
+
+        # 1. Generate query embedding
+        query_embedding = None
+        if rag_config.enabled:
+            query_embedding = await self.embedding_service.embed_text(input_data.query)
+
+        return await self._execute_with_embedding(input_data, query_embedding)
+
+    async def execute_many(
+        self, inputs: List[QueryWithRAGInput]
+    ) -> List[QueryWithRAGOutput]:
+        """
+        Execute several RAG queries concurrently.
+
+        Query embeddings are computed in one batch call; search and generation
+        then run concurrently, bounded by max_concurrency (provider rate limits).
+
+        Args:
+            inputs: Queries and configuration
+
+        Returns:
+            QueryWithRAGOutput per input, in the same order
+        """
+        if not inputs:
+            return []
+
+        # 1. Batch-embed all queries that need retrieval
+        rag_indexes = [
+            i
+            for i, item in enumerate(inputs)
+            if (item.rag_config or RAGConfig()).enabled
+        ]
+        embeddings: List[Optional[List[float]]] = [None] * len(inputs)
+        if rag_indexes:
+            batch = await self.embedding_service.embed_batch(
+                [inputs[i].query for i in rag_indexes]
+            )
+            for i, embedding in zip(rag_indexes, batch):
+                embeddings[i] = embedding
+
+        # 2. Search + generate concurrently
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(item: QueryWithRAGInput, embedding):
+            async with semaphore:
+                return await self._execute_with_embedding(item, embedding)
+
+        return await asyncio.gather(
+            *(_bounded(item, emb) for item, emb in zip(inputs, embeddings))
+        )
+
+    async def _execute_with_embedding(
+        self,
+        input_data: QueryWithRAGInput,
+        query_embedding: Optional[List[float]],
+    ) -> QueryWithRAGOutput:
+        """Run retrieval and generation with a pre-computed query embedding."""
         # Use defaults if not provided
         rag_config = input_data.rag_config or RAGConfig()
         gen_config = input_data.generation_config or GenerationConfig.balanced()
 
-        sources = []
-        context = ""
+        # 2-4. Retrieve and build prompt
+        sources, full_prompt = await self._prepare(
+            input_data, rag_config, query_embedding
+        )
 
-        # Perform RAG retrieval if enabled
+        # 5. Reuse a cached answer grounded on the same sources
+        cache_scope = None
+        answer = None
+        if self.response_cache and query_embedding is not None:
+            cache_scope = self._cache_scope(input_data, sources)
+            answer = await self.response_cache.lookup(query_embedding, cache_scope)
+        cache_hit = answer is not None
+
+        # 6. Generate answer with LLM
+        if not cache_hit:
+            answer = await self.llm_service.generate(
+                prompt=full_prompt,
+                temperature=gen_config.temperature,
+                max_tokens=gen_config.max_tokens,
+                top_p=gen_config.top_p,
+                frequency_penalty=gen_config.frequency_penalty,
+                presence_penalty=gen_config.presence_penalty,
+            )
+            if cache_scope is not None:
+                await self.response_cache.put(
+                    query_embedding, input_data.query, answer, cache_scope
+                )
+
+        return QueryWithRAGOutput(
+            answer=answer,
+            sources=sources,
+            metadata={
+                "rag_enabled": rag_config.enabled,
+                "sources_count": len(sources),
+                "collection": input_data.collection,
+                "temperature": gen_config.temperature,
+                "cache": "hit" if cache_hit else "miss",
+            },
+        )
+
+    async def execute_stream(
+        self, input_data: QueryWithRAGInput
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute RAG query, streaming the answer as it is generated.
+
+        Yields a {"sources": [...]} event once retrieval is done, then
+        {"content": chunk} events from the LLM stream.
+        """
+        rag_config = input_data.rag_config or RAGConfig()
+        gen_config = input_data.generation_config or GenerationConfig.balanced()
+
+        query_embedding = None
         if rag_config.enabled:
-            # 1. Generate query embedding
             query_embedding = await self.embedding_service.embed_text(input_data.query)
 
+        sources, full_prompt = await self._prepare(
+            input_data, rag_config, query_embedding
+        )
+        yield {"sources": sources}
+
+        async for chunk in self.llm_service.stream_generate(
+            prompt=full_prompt,
+            temperature=gen_config.temperature,
+            max_tokens=gen_config.max_tokens,
+            top_p=gen_config.top_p,
+            frequency_penalty=gen_config.frequency_penalty,
+            presence_penalty=gen_config.presence_penalty,
+        ):
+            yield {"content": chunk}
+
+    async def _prepare(
+        self,
+        input_data: QueryWithRAGInput,
+        rag_config: RAGConfig,
+        query_embedding: Optional[List[float]],
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Search vector store and build the full prompt."""
+        sources = []
+        context = ""
+
+        # Perform RAG retrieval if enabled
+        if rag_config.enabled and query_embedding is not None:
             # 2. Search vector store
             search_results = await self.vector_store.search(
                 query_embedding=query_embedding,
@@ -97,27 +246,14 @@ class QueryWithRAGUseCase:
             context=context,
             system_prompt=input_data.system_prompt,
         )
+        return sources, full_prompt
 
-        # 5. Generate answer with LLM
-        answer = await self.llm_service.generate(
-            prompt=full_prompt,
-            temperature=gen_config.temperature,
-            max_tokens=gen_config.max_tokens,
-            top_p=gen_config.top_p,
-            frequency_penalty=gen_config.frequency_penalty,
-            presence_penalty=gen_config.presence_penalty,
-        )
-
-        return QueryWithRAGOutput(
-            answer=answer,
-            sources=sources,
-            metadata={
-                "rag_enabled": rag_config.enabled,
-                "sources_count": len(sources),
-                "collection": input_data.collection,
-                "temperature": gen_config.temperature,
-            },
-        )
+    def _cache_scope(
+        self, input_data: QueryWithRAGInput, sources: List[Dict[str, Any]]
+    ) -> Tuple:
+        """Exact-match part of the cache key: answers must share their grounding."""
+        source_ids = tuple(sorted(str(s.get("id", "")) for s in sources))
+        return (input_data.collection, input_data.system_prompt, source_ids)
 
     def _build_context(self, search_results: List[Dict[str, Any]]) -> str:
         """Build context string from search results."""
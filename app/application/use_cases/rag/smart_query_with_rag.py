@@ -1,6 +1,8 @@
 """Query with smart artifact response use case."""
 
+import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from app.domain.value_objects.rag_config import RAGConfig
 from app.domain.value_objects.generation_config import GenerationConfig
@@ -18,6 +20,8 @@ from app.application.interfaces.repositories.document_repository import (
     IDocumentRepository,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Keywords for artifact/file request detection (Vietnamese)
 ARTIFACT_KEYWORDS = [
@@ -66,6 +70,55 @@ FILLABLE_KEYWORDS = [
 ]
 
 
+# Artifact requests that are specifically about forms
+FORM_KEYWORDS = ("mẫu đơn", "form", "đơn xin", "biểu mẫu")
+
+# Non-artifact intents, checked in order (first match wins)
+INTENT_RULES = (
+    (
+        ResponseIntent.PROCEDURE_GUIDE,
+        ("quy trình", "cách làm", "hướng dẫn", "thủ tục"),
+    ),
+    (
+        ResponseIntent.CONTACT_INFO,
+        ("liên hệ", "số điện thoại", "email", "địa chỉ"),
+    ),
+    (ResponseIntent.NAVIGATION, ("đường đi", "chỉ đường", "ở đâu", "vị trí")),
+)
+
+
+# Shared fallback for search results without metadata (read-only)
+_NO_METADATA: Dict[str, Any] = {}
+
+
+# Intent detection is a pure function of the (lowercased) query; repeated
+# questions are common, so results are memoized per process.
+INTENT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=INTENT_CACHE_SIZE)
+def _classify_intent(query_lower: str) -> ResponseIntent:
+    """Classify response intent from a lowercased query."""
+    # Check for file/form request keywords
+    if any(k in query_lower for k in ARTIFACT_KEYWORDS):
+        # More specific: form or file?
+        if any(k in query_lower for k in FORM_KEYWORDS):
+            return ResponseIntent.FORM_REQUEST
+        return ResponseIntent.FILE_REQUEST
+
+    for intent, keywords in INTENT_RULES:
+        if any(k in query_lower for k in keywords):
+            return intent
+
+    return ResponseIntent.GENERAL_ANSWER
+
+
+@lru_cache(maxsize=INTENT_CACHE_SIZE)
+def _is_fillable_request(query_lower: str) -> bool:
+    """Check for form-filling keywords in a lowercased query."""
+    return any(k in query_lower for k in FILLABLE_KEYWORDS)
+
+
 @dataclass
 class SmartQueryInput:
     """Input for smart query with artifact support."""
@@ -97,6 +150,8 @@ class SmartQueryWithRAGUseCase:
     Single Responsibility: Smart RAG with artifact delivery
     """
 
+    __slots__ = ("embedding_service", "vector_store", "llm_service", "document_repo")
+
     DEFAULT_SYSTEM_PROMPT = """Bạn là AMI - trợ lý thông minh của Học viện Công nghệ Bưu chính Viễn thông (PTIT).
 Nhiệm vụ: Hỗ trợ sinh viên, giảng viên và người quan tâm tìm hiểu về PTIT.
 
@@ -136,9 +191,10 @@ Quy tắc trả lời:
         rag_config = input_data.rag_config or RAGConfig()
         gen_config = input_data.generation_config or GenerationConfig.balanced()
 
-        # 1. Detect intent
-        intent = self._detect_intent(input_data.query)
-        wants_fillable = self._wants_fillable_form(input_data.query)
+        # 1. Detect intent (lowercase the query once for both checks)
+        query_lower = input_data.query.lower()
+        intent = _classify_intent(query_lower)
+        wants_fillable = _is_fillable_request(query_lower)
 
         # 2. Perform RAG retrieval
         sources: List[SourceReference] = []
@@ -202,40 +258,11 @@ Quy tắc trả lời:
 
     def _detect_intent(self, query: str) -> ResponseIntent:
         """Detect user intent from query."""
-        query_lower = query.lower()
-
-        # Check for file/form request keywords
-        for keyword in ARTIFACT_KEYWORDS:
-            if keyword in query_lower:
-                # More specific: form or file?
-                if any(
-                    k in query_lower for k in ["mẫu đơn", "form", "đơn xin", "biểu mẫu"]
-                ):
-                    return ResponseIntent.FORM_REQUEST
-                return ResponseIntent.FILE_REQUEST
-
-        # Check for procedure/guide request
-        if any(
-            k in query_lower for k in ["quy trình", "cách làm", "hướng dẫn", "thủ tục"]
-        ):
-            return ResponseIntent.PROCEDURE_GUIDE
-
-        # Check for contact info
-        if any(
-            k in query_lower for k in ["liên hệ", "số điện thoại", "email", "địa chỉ"]
-        ):
-            return ResponseIntent.CONTACT_INFO
-
-        # Check for navigation
-        if any(k in query_lower for k in ["đường đi", "chỉ đường", "ở đâu", "vị trí"]):
-            return ResponseIntent.NAVIGATION
-
-        return ResponseIntent.GENERAL_ANSWER
+        return _classify_intent(query.lower())
 
     def _wants_fillable_form(self, query: str) -> bool:
         """Check if user wants a pre-filled form."""
-        query_lower = query.lower()
-        return any(k in query_lower for k in FILLABLE_KEYWORDS)
+        return _is_fillable_request(query.lower())
 
     async def _process_search_results(
         self, search_results: List[Dict[str, Any]]
@@ -246,19 +273,20 @@ Quy tắc trả lời:
 
         for i, result in enumerate(search_results, 1):
             content = result.get("content", "")
-            score = result.get("score", 0.0)
-            doc_id = result.get("document_id", "")
-            title = result.get("metadata", {}).get("title", f"Source {i}")
+            metadata = result.get("metadata") or _NO_METADATA
+            title = metadata.get("title")
+            if title is None:
+                title = f"Source {i}"
 
             context_parts.append(f"[{i}] {content}")
 
             sources.append(
                 SourceReference(
                     source_type=SourceType.DOCUMENT,
-                    document_id=doc_id,
+                    document_id=result.get("document_id", ""),
                     title=title,
                     chunk_text=content[:200] + "..." if len(content) > 200 else content,
-                    relevance_score=score,
+                    relevance_score=result.get("score", 0.0),
                 )
             )
 
@@ -270,17 +298,26 @@ Quy tắc trả lời:
     ) -> List[ArtifactReference]:
         """Fetch artifacts from source documents."""
         artifacts = []
-        seen_doc_ids = set()
 
-        for result in search_results:
-            doc_id = result.get("document_id", "")
-            if not doc_id or doc_id in seen_doc_ids:
-                continue
+        # Unique source documents, in relevance order
+        doc_ids = list(
+            dict.fromkeys(
+                r.get("document_id") for r in search_results if r.get("document_id")
+            )
+        )
+
+        if not doc_ids:
+            return artifacts
 
-            seen_doc_ids.add(doc_id)
+        # Fetch all source documents in a single query
+        try:
+            documents = await self.document_repo.get_by_ids(doc_ids)
+        except Exception as e:
+            logger.warning("Failed to fetch source documents: %s", e)
+            return artifacts
 
-            # Fetch full document
-            document = await self.document_repo.get_by_id(doc_id)
+        for doc_id in doc_ids:
+            document = documents.get(doc_id)
             if not document or not document.has_artifacts():
                 continue
 
@@ -99,12 +99,29 @@ class QualityValidatorUseCase:
 
     # Outdated content markers (Vietnamese)
     OUTDATED_MARKERS = [
-        r"năm\s+20(1[0-9]|20|21)",  # Years 2010-2021
-        r"khóa\s+(K)?[0-5][0-9]\s",  # Course numbers K50-K59 etc (old)
-        r"học\s+kỳ\s+[12]\s+năm\s+20(1[0-9]|20|21)",
-        r"niên\s+khóa\s+20(1[0-9]|20|21)",
+        re.compile(p, re.IGNORECASE)
+        for p in (
+            r"năm\s+20(1[0-9]|20|21)",  # Years 2010-2021
+            r"khóa\s+(K)?[0-5][0-9]\s",  # Course numbers K50-K59 etc (old)
+            r"học\s+kỳ\s+[12]\s+năm\s+20(1[0-9]|20|21)",
+            r"niên\s+khóa\s+20(1[0-9]|20|21)",
+        )
     ]
 
+    # Placeholder text markers
+    PLACEHOLDER_PATTERNS = [
+        re.compile(p, re.IGNORECASE)
+        for p in (
+            r"\[.*?\]",  # [placeholder]
+            r"TODO",
+            r"FIXME",
+            r"XXX",
+            r"\.\.\.",  # ...
+        )
+    ]
+
+    SPECIAL_CHAR_PATTERN = re.compile(r"[^\w\s]")
+
     # Required metadata fields
     REQUIRED_METADATA = ["title", "category"]
 
@@ -192,7 +209,7 @@ class QualityValidatorUseCase:
     def _check_outdated_markers(self, content: str, result: ValidationResult) -> None:
         """Check for outdated content markers."""
         for pattern in self.OUTDATED_MARKERS:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+            matches = pattern.findall(content)
             if matches:
                 result.add_issue(
                     ValidationIssue(
@@ -261,16 +278,8 @@ class QualityValidatorUseCase:
     def _check_content_quality(self, content: str, result: ValidationResult) -> None:
         """Check content quality signals."""
         # Check for placeholder text
-        placeholder_patterns = [
-            r"\[.*?\]",  # [placeholder]
-            r"TODO",
-            r"FIXME",
-            r"XXX",
-            r"\.\.\.",  # ...
-        ]
-
-        for pattern in placeholder_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in self.PLACEHOLDER_PATTERNS:
+            matches = pattern.findall(content)
             if matches and len(matches) > 2:
                 result.add_issue(
                     ValidationIssue(
@@ -284,7 +293,7 @@ class QualityValidatorUseCase:
                 break
 
         # Check for excessive special characters
-        special_chars = len(re.findall(r"[^\w\s]", content))
+        special_chars = len(self.SPECIAL_CHAR_PATTERN.findall(content))
         if special_chars > len(content) * 0.2:
             result.add_issue(
                 ValidationIssue(
@@ -17,6 +17,7 @@ class OpenAIConfig(BaseConfig):
     openai_model_reasoning: str = Field(default="o4-mini")
     openai_max_retries: int = Field(default=3, ge=0, le=10)
     openai_timeout: float = Field(default=60.0, ge=1.0)
+    openai_warmup_timeout: float = Field(default=5.0, gt=0.0)  # startup, seconds
 
     # Convenience properties
     @property
@@ -39,6 +40,10 @@ class OpenAIConfig(BaseConfig):
     def timeout(self) -> float:
         return self.openai_timeout
 
+    @property
+    def warmup_timeout(self) -> float:
+        return self.openai_warmup_timeout
+
 
 class AnthropicConfig(BaseConfig):
     """Anthropic (Claude) configuration."""
@@ -80,6 +85,11 @@ class GeminiConfig(BaseConfig):
     gemini_model_web_search: str = Field(default="gemini-2.0-flash")
     gemini_model_tts: str = Field(default="gemini-2.5-flash-preview-tts")
     gemini_tts_voice: str = Field(default="Kore")  # 30 voice options
+    gemini_tts_cache_max_bytes: int = Field(default=10 * 1024 * 1024, ge=0)  # 0 = off
+    gemini_tts_cache_ttl: int = Field(default=86400, ge=1)  # seconds
+    gemini_web_search_timeout: float = Field(default=30.0, ge=1.0)  # seconds
+    gemini_web_search_max_connections: int = Field(default=100, ge=1)
+    gemini_web_search_max_keepalive: int = Field(default=20, ge=0)
 
     # Convenience properties
     @property
@@ -106,6 +116,26 @@ class GeminiConfig(BaseConfig):
     def tts_voice(self) -> str:
         return self.gemini_tts_voice
 
+    @property
+    def tts_cache_max_bytes(self) -> int:
+        return self.gemini_tts_cache_max_bytes
+
+    @property
+    def tts_cache_ttl(self) -> int:
+        return self.gemini_tts_cache_ttl
+
+    @property
+    def web_search_timeout(self) -> float:
+        return self.gemini_web_search_timeout
+
+    @property
+    def web_search_max_connections(self) -> int:
+        return self.gemini_web_search_max_connections
+
+    @property
+    def web_search_max_keepalive(self) -> int:
+        return self.gemini_web_search_max_keepalive
+
 
 class EmbeddingConfig(BaseConfig):
     """Embedding model configuration."""
@@ -156,6 +186,13 @@ class RAGConfig(BaseConfig):
 
     rag_top_k: int = Field(default=5, ge=1, le=20)
     rag_similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    rag_max_concurrency: int = Field(default=4, ge=1, le=64)  # Batch query fan-out
+    rag_response_cache_enabled: bool = Field(default=False)
+    rag_response_cache_threshold: float = Field(default=0.92, ge=0.0, le=1.0)
+    rag_response_cache_size: int = Field(default=512, ge=1)
+    rag_response_cache_ttl: int = Field(default=3600, ge=1)  # seconds
+    rag_image_query_cache_size: int = Field(default=128, ge=1)
+    rag_image_query_cache_ttl: int = Field(default=600, ge=1)  # seconds
 
     # Convenience properties
     @property
@@ -166,6 +203,34 @@ class RAGConfig(BaseConfig):
     def similarity_threshold(self) -> float:
         return self.rag_similarity_threshold
 
+    @property
+    def max_concurrency(self) -> int:
+        return self.rag_max_concurrency
+
+    @property
+    def response_cache_enabled(self) -> bool:
+        return self.rag_response_cache_enabled
+
+    @property
+    def response_cache_threshold(self) -> float:
+        return self.rag_response_cache_threshold
+
+    @property
+    def response_cache_size(self) -> int:
+        return self.rag_response_cache_size
+
+    @property
+    def response_cache_ttl(self) -> int:
+        return self.rag_response_cache_ttl
+
+    @property
+    def image_query_cache_size(self) -> int:
+        return self.rag_image_query_cache_size
+
+    @property
+    def image_query_cache_ttl(self) -> int:
+        return self.rag_image_query_cache_ttl
+
 
 class LLMConfig(BaseConfig):
     """Aggregated LLM configuration."""
@@ -16,6 +16,12 @@ class FirecrawlConfig(BaseConfig):
     firecrawl_api_key: str = Field(default="")
     firecrawl_timeout: int = Field(default=60000, ge=1000)  # milliseconds
     firecrawl_min_content_length: int = Field(default=10, ge=1)
+    # Retries on 429/5xx and network errors (exponential backoff + jitter)
+    firecrawl_max_retries: int = Field(default=2, ge=0)
+    firecrawl_retry_backoff: float = Field(default=1.0, ge=0)  # seconds
+    firecrawl_retry_max_backoff: float = Field(default=10.0, ge=0)  # seconds
+    # Parallel re-fetches of search results returned without content
+    firecrawl_search_enrich_concurrency: int = Field(default=5, ge=1)
 
     # Convenience properties
     @property
@@ -30,6 +36,22 @@ class FirecrawlConfig(BaseConfig):
     def min_content_length(self) -> int:
         return self.firecrawl_min_content_length
 
+    @property
+    def max_retries(self) -> int:
+        return self.firecrawl_max_retries
+
+    @property
+    def retry_backoff(self) -> float:
+        return self.firecrawl_retry_backoff
+
+    @property
+    def retry_max_backoff(self) -> float:
+        return self.firecrawl_retry_max_backoff
+
+    @property
+    def search_enrich_concurrency(self) -> int:
+        return self.firecrawl_search_enrich_concurrency
+
 
 # Singleton instances
 firecrawl_config = FirecrawlConfig()
@@ -104,6 +104,7 @@ class MinIOConfig(BaseConfig):
     minio_secret_key: str = Field(default="")
     minio_bucket: str = Field(default="ami")
     minio_secure: bool = Field(default=False)
+    minio_max_connections: int = Field(default=50, ge=1)  # keep-alive pool size
 
     # Convenience properties
     @property
@@ -126,6 +127,10 @@ class MinIOConfig(BaseConfig):
     def secure(self) -> bool:
         return self.minio_secure
 
+    @property
+    def max_connections(self) -> int:
+        return self.minio_max_connections
+
 
 class DocumentProcessingConfig(BaseConfig):
     """Document processing configuration."""
@@ -4,33 +4,39 @@ Simple singleton registry - no heavy factory class.
 All config is loaded from app/config/*.py.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Optional
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from typing import TYPE_CHECKING, Optional
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.domain.enums.llm_mode import LLMMode
 from app.application.interfaces.services.llm_service import ILLMService
 from app.application.interfaces.services.embedding_service import IEmbeddingService
 from app.application.interfaces.services.vector_store_service import IVectorStoreService
 from app.application.interfaces.services.rag_service import IRAGService
-
-# Repository imports
-from app.infrastructure.persistence.mongodb.repositories import (
-    MongoDBChatRepository,
-    MongoDBDocumentRepository,
-    MongoDBFileRepository,
-    MongoDBCrawlerRepository,
-    MongoDBDataSourceRepository,
-    MongoDBPendingUpdateRepository,
-    MongoDBFeedbackRepository,
-    MongoDBUsageMetricRepository,
-    MongoDBLLMUsageRepository,
-    MongoDBDailyStatsRepository,
-    MongoDBSearchLogRepository,
-    MongoDBKnowledgeGapRepository,
-    MongoDBStudentProfileRepository,
-    MongoDBBookmarkRepository,
-)
+from app.application.interfaces.services.response_cache_service import IResponseCache
+
+# Repository classes resolve lazily (package __getattr__) on first use
+from app.infrastructure.persistence.mongodb import repositories
+
+if TYPE_CHECKING:
+    from app.infrastructure.persistence.mongodb.repositories import (
+        MongoDBChatRepository,
+        MongoDBDocumentRepository,
+        MongoDBFileRepository,
+        MongoDBCrawlerRepository,
+        MongoDBDataSourceRepository,
+        MongoDBPendingUpdateRepository,
+        MongoDBFeedbackRepository,
+        MongoDBUsageMetricRepository,
+        MongoDBLLMUsageRepository,
+        MongoDBDailyStatsRepository,
+        MongoDBSearchLogRepository,
+        MongoDBKnowledgeGapRepository,
+        MongoDBStudentProfileRepository,
+        MongoDBBookmarkRepository,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +51,7 @@ class ServiceRegistry:
         embedding = ServiceRegistry.get_embedding()
     """
 
-    _db: Optional[AsyncIOMotorDatabase] = None
+    _db: Optional[AsyncDatabase] = None
     _initialized = False
 
     # Singleton instances
@@ -55,6 +61,7 @@ class ServiceRegistry:
     _storage = None
     _scheduler = None
     _rag = None
+    _response_cache = None
 
     # Repository singletons
     _chat_repo = None
@@ -73,7 +80,7 @@ class ServiceRegistry:
     _bookmark_repo = None
 
     @classmethod
-    def initialize(cls, db: AsyncIOMotorDatabase):
+    def initialize(cls, db: AsyncDatabase):
         """Initialize registry with database."""
         cls._db = db
         cls._initialized = True
@@ -90,13 +97,17 @@ class ServiceRegistry:
     @classmethod
     def get_llm(cls, provider: str = "openai", mode: LLMMode = LLMMode.QA) -> ILLMService:
         """Get LLM service by provider."""
-        key = f"{provider}_{mode.value}"
-        
+        # Tuple key: no string formatting on the per-request lookup
+        llm = cls._llm_instances.get((provider, mode))
+        if llm is not None:
+            return llm
+
+        provider = provider.lower()
+        key = (provider, mode)
         if key in cls._llm_instances:
+            # Same provider requested with different casing
             return cls._llm_instances[key]
 
-        provider = provider.lower()
-        
         if provider == "openai":
             from app.infrastructure.ai.llm.openai_llm import OpenAILLMService
             llm = OpenAILLMService(default_mode=mode)
@@ -177,6 +188,22 @@ class ServiceRegistry:
             )
         return cls._rag
 
+    @classmethod
+    def get_response_cache(cls) -> Optional[IResponseCache]:
+        """Get semantic response cache (None when disabled)."""
+        from app.config import rag_config
+
+        if not rag_config.response_cache_enabled:
+            return None
+        if cls._response_cache is None:
+            from app.infrastructure.cache import InMemorySemanticCache
+            cls._response_cache = InMemorySemanticCache(
+                threshold=rag_config.response_cache_threshold,
+                max_entries=rag_config.response_cache_size,
+                ttl_seconds=rag_config.response_cache_ttl,
+            )
+        return cls._response_cache
+
     # ===== Repositories =====
 
     @classmethod
@@ -184,7 +211,7 @@ class ServiceRegistry:
         """Get chat repository."""
         cls._ensure_initialized()
         if cls._chat_repo is None:
-            cls._chat_repo = MongoDBChatRepository(cls._db)
+            cls._chat_repo = repositories.MongoDBChatRepository(cls._db)
         return cls._chat_repo
 
     @classmethod
@@ -192,7 +219,7 @@ class ServiceRegistry:
         """Get document repository."""
         cls._ensure_initialized()
         if cls._document_repo is None:
-            cls._document_repo = MongoDBDocumentRepository(cls._db)
+            cls._document_repo = repositories.MongoDBDocumentRepository(cls._db)
         return cls._document_repo
 
     @classmethod
@@ -200,7 +227,7 @@ class ServiceRegistry:
         """Get file repository."""
         cls._ensure_initialized()
         if cls._file_repo is None:
-            cls._file_repo = MongoDBFileRepository(cls._db)
+            cls._file_repo = repositories.MongoDBFileRepository(cls._db)
         return cls._file_repo
 
     @classmethod
@@ -208,7 +235,7 @@ class ServiceRegistry:
         """Get crawler repository."""
         cls._ensure_initialized()
         if cls._crawler_repo is None:
-            cls._crawler_repo = MongoDBCrawlerRepository(cls._db)
+            cls._crawler_repo = repositories.MongoDBCrawlerRepository(cls._db)
         return cls._crawler_repo
 
     @classmethod
@@ -216,7 +243,7 @@ class ServiceRegistry:
         """Get data source repository."""
         cls._ensure_initialized()
         if cls._data_source_repo is None:
-            cls._data_source_repo = MongoDBDataSourceRepository(cls._db)
+            cls._data_source_repo = repositories.MongoDBDataSourceRepository(cls._db)
         return cls._data_source_repo
 
     @classmethod
@@ -224,7 +251,7 @@ class ServiceRegistry:
         """Get pending update repository."""
         cls._ensure_initialized()
         if cls._pending_update_repo is None:
-            cls._pending_update_repo = MongoDBPendingUpdateRepository(cls._db)
+            cls._pending_update_repo = repositories.MongoDBPendingUpdateRepository(cls._db)
         return cls._pending_update_repo
 
     @classmethod
@@ -232,7 +259,7 @@ class ServiceRegistry:
         """Get feedback repository."""
         cls._ensure_initialized()
         if cls._feedback_repo is None:
-            cls._feedback_repo = MongoDBFeedbackRepository(cls._db)
+            cls._feedback_repo = repositories.MongoDBFeedbackRepository(cls._db)
         return cls._feedback_repo
 
     @classmethod
@@ -240,7 +267,7 @@ class ServiceRegistry:
         """Get usage metric repository."""
         cls._ensure_initialized()
         if cls._usage_metric_repo is None:
-            cls._usage_metric_repo = MongoDBUsageMetricRepository(cls._db)
+            cls._usage_metric_repo = repositories.MongoDBUsageMetricRepository(cls._db)
         return cls._usage_metric_repo
 
     @classmethod
@@ -248,7 +275,7 @@ class ServiceRegistry:
         """Get LLM usage repository."""
         cls._ensure_initialized()
         if cls._llm_usage_repo is None:
-            cls._llm_usage_repo = MongoDBLLMUsageRepository(cls._db)
+            cls._llm_usage_repo = repositories.MongoDBLLMUsageRepository(cls._db)
         return cls._llm_usage_repo
 
     @classmethod
@@ -256,7 +283,7 @@ class ServiceRegistry:
         """Get daily stats repository."""
         cls._ensure_initialized()
         if cls._daily_stats_repo is None:
-            cls._daily_stats_repo = MongoDBDailyStatsRepository(cls._db)
+            cls._daily_stats_repo = repositories.MongoDBDailyStatsRepository(cls._db)
         return cls._daily_stats_repo
 
     @classmethod
@@ -264,7 +291,7 @@ class ServiceRegistry:
         """Get search log repository."""
         cls._ensure_initialized()
         if cls._search_log_repo is None:
-            cls._search_log_repo = MongoDBSearchLogRepository(cls._db)
+            cls._search_log_repo = repositories.MongoDBSearchLogRepository(cls._db)
         return cls._search_log_repo
 
     @classmethod
@@ -272,7 +299,7 @@ class ServiceRegistry:
         """Get knowledge gap repository."""
         cls._ensure_initialized()
         if cls._knowledge_gap_repo is None:
-            cls._knowledge_gap_repo = MongoDBKnowledgeGapRepository(cls._db)
+            cls._knowledge_gap_repo = repositories.MongoDBKnowledgeGapRepository(cls._db)
         return cls._knowledge_gap_repo
 
     @classmethod
@@ -280,7 +307,7 @@ class ServiceRegistry:
         """Get student profile repository."""
         cls._ensure_initialized()
         if cls._student_profile_repo is None:
-            cls._student_profile_repo = MongoDBStudentProfileRepository(cls._db)
+            cls._student_profile_repo = repositories.MongoDBStudentProfileRepository(cls._db)
         return cls._student_profile_repo
 
     @classmethod
@@ -288,5 +315,5 @@ class ServiceRegistry:
         """Get bookmark repository."""
         cls._ensure_initialized()
         if cls._bookmark_repo is None:
-            cls._bookmark_repo = MongoDBBookmarkRepository(cls._db)
+            cls._bookmark_repo = repositories.MongoDBBookmarkRepository(cls._db)
         return cls._bookmark_repo
@@ -42,6 +42,10 @@ class Bookmark:
         if not self.title and self.query:
             self.title = self.query[:100] + ("..." if len(self.query) > 100 else "")
 
+    def mark_updated(self, now: Optional[datetime] = None) -> None:
+        """Stamp updated_at (pass `now` to control the clock)."""
+        self.updated_at = now or datetime.now(timezone.utc)
+
     def add_tag(self, tag: str) -> None:
         """Add a tag if not already present."""
         tag = tag.strip().lower()
@@ -76,7 +76,9 @@ class HuggingFaceEmbeddings(IEmbeddingService):
             )
 
             result = embedding.tolist()
-            logger.debug(f"Embedded text ({len(text)} chars) -> {len(result)}D vector")
+            logger.debug(
+                "Embedded text (%s chars) -> %sD vector", len(text), len(result)
+            )
             return result
 
         except Exception as e:
@@ -107,7 +109,7 @@ class HuggingFaceEmbeddings(IEmbeddingService):
                 logger.warning("All texts empty, returning zero vectors")
                 return [[0.0] * self.dimension] * len(texts)
 
-            logger.debug(f"Embedding batch of {len(filtered_texts)} texts")
+            logger.debug("Embedding batch of %s texts", len(filtered_texts))
 
             # Run in thread pool
             loop = asyncio.get_event_loop()
@@ -134,7 +136,7 @@ class HuggingFaceEmbeddings(IEmbeddingService):
                 else:
                     result.append([0.0] * self.dimension)
 
-            logger.info(f"Successfully embedded batch of {len(texts)} texts")
+            logger.info("Successfully embedded batch of %s texts", len(texts))
             return result
 
         except Exception as e:
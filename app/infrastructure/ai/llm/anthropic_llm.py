@@ -56,6 +56,15 @@ class AnthropicLLMService(ILLMService):
 
 
 
+    async def warmup(self) -> None:
+        """Fetch model metadata to establish a pooled, authenticated connection."""
+        model = self._models[self._current_mode]
+        try:
+            await self.client.models.retrieve(model)
+            logger.info("%s warmed up (%s)", self.__class__.__name__, model)
+        except Exception as e:
+            logger.warning("%s warmup failed: %s", self.__class__.__name__, e)
+
     async def generate(
         self,
         prompt: str,
@@ -76,7 +85,7 @@ class AnthropicLLMService(ILLMService):
             max_tokens = kwargs.pop("max_tokens", 4096)
             temperature = kwargs.pop("temperature", 0.7)
 
-            logger.debug(f"Generating with {model}")
+            logger.debug("Generating with %s", model)
 
             response = await self.client.messages.create(
                 model=model,
@@ -87,7 +96,7 @@ class AnthropicLLMService(ILLMService):
             )
 
             result = response.content[0].text
-            logger.debug(f"Generated: {len(result)} chars")
+            logger.debug("Generated: %s chars", len(result))
             return result
 
         except RateLimitError as e:
@@ -123,7 +132,7 @@ class AnthropicLLMService(ILLMService):
             max_tokens = kwargs.pop("max_tokens", 4096)
             temperature = kwargs.pop("temperature", 0.7)
 
-            logger.debug(f"Streaming with {model}")
+            logger.debug("Streaming with %s", model)
 
             async with self.client.messages.stream(
                 model=model,
@@ -201,7 +210,7 @@ class AnthropicLLMService(ILLMService):
             max_tokens = kwargs.pop("max_tokens", 4096)
             temperature = kwargs.pop("temperature", 0.7)
 
-            logger.debug(f"Image QA with {model}")
+            logger.debug("Image QA with %s", model)
 
             response = await self.client.messages.create(
                 model=model,
@@ -211,7 +220,7 @@ class AnthropicLLMService(ILLMService):
             )
 
             result = response.content[0].text
-            logger.debug(f"Image QA response: {len(result)} chars")
+            logger.debug("Image QA response: %s chars", len(result))
             return result
 
         except RateLimitError as e:
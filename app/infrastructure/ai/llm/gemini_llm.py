@@ -3,9 +3,10 @@ Google Gemini LLM provider - Simple, config-driven implementation.
 Supports Vision (image QA) capabilities.
 """
 
+import asyncio
 import base64
 import logging
-from typing import Optional, AsyncIterator, Union
+from typing import Dict, Optional, AsyncIterator, Tuple, Union
 
 import google.genai as genai
 from google.genai import types
@@ -39,10 +40,21 @@ class GeminiLLMService(ILLMService):
             LLMMode.REASONING: self.config.model_reasoning,
         }
         self._current_mode = default_mode
+        # Single-flight: identical concurrent requests share one API call
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
         logger.info(
             f"Gemini initialized - QA: {self.config.model_qa}, Reasoning: {self.config.model_reasoning}"
         )
 
+    async def warmup(self) -> None:
+        """Fetch model metadata to establish a pooled, authenticated connection."""
+        model = self._models[self._current_mode]
+        try:
+            await self._client.aio.models.get(model=model)
+            logger.info("%s warmed up (%s)", self.__class__.__name__, model)
+        except Exception as e:
+            logger.warning("%s warmup failed: %s", self.__class__.__name__, e)
+
     async def generate(
         self,
         prompt: str,
@@ -54,29 +66,50 @@ class GeminiLLMService(ILLMService):
         Generate completion.
         
         Note: Context formatting should be done in Application layer.
+        Concurrent calls with identical arguments are coalesced into one request.
         """
         model = self._models[mode or self._current_mode]
+        temperature = kwargs.pop("temperature", 0.7)
+        max_tokens = kwargs.pop("max_tokens", 4096)
+
+        key = (model, context, prompt, temperature, max_tokens)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._generate(model, prompt, context, temperature, max_tokens)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
 
-        try:
-            # Simple prompt building - context is system message equivalent
-            full_prompt = f"{context}\n\n{prompt}" if context else prompt
-
-            temperature = kwargs.pop("temperature", 0.7)
-            max_tokens = kwargs.pop("max_tokens", 4096)
+        # shield: a cancelled caller must not cancel the call for other waiters
+        return await asyncio.shield(task)
 
-            logger.debug(f"Generating with {model}")
+    async def _generate(
+        self,
+        model: str,
+        prompt: str,
+        context: Optional[str],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Run a single generate_content call."""
+        try:
+            logger.debug("Generating with %s", model)
 
+            # Context goes to system_instruction (stable prefix), prompt is the
+            # single user turn - same split as the OpenAI/Anthropic providers.
             response = await self._client.aio.models.generate_content(
                 model=model,
-                contents=full_prompt,
+                contents=prompt,
                 config=genai.types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=max_tokens,
+                    system_instruction=context or None,
                 ),
             )
 
             result = response.text or ""
-            logger.debug(f"Generated {len(result)} chars")
+            logger.debug("Generated %s chars", len(result))
             return result
 
         except Exception as e:
@@ -94,19 +127,19 @@ class GeminiLLMService(ILLMService):
         model = self._models[mode or self._current_mode]
 
         try:
-            full_prompt = f"{context}\n\n{prompt}" if context else prompt
-
             temperature = kwargs.pop("temperature", 0.7)
             max_tokens = kwargs.pop("max_tokens", 4096)
 
-            logger.debug(f"Streaming with {model}")
+            logger.debug("Streaming with %s", model)
 
-            response = await self._client.aio.models.generate_content(
+            # generate_content_stream yields chunks as they are decoded
+            response = await self._client.aio.models.generate_content_stream(
                 model=model,
-                contents=full_prompt,
+                contents=prompt,
                 config=genai.types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=max_tokens,
+                    system_instruction=context or None,
                 ),
             )
 
@@ -130,8 +163,7 @@ class GeminiLLMService(ILLMService):
         try:
             # Prepare image part
             if isinstance(image, bytes):
-                # Raw bytes - encode to base64
-                image_data = base64.b64encode(image).decode("utf-8")
+                # Raw bytes - passed through without a base64 copy
                 image_part = types.Part.from_bytes(
                     data=image, mime_type=kwargs.pop("mime_type", "image/jpeg")
                 )
@@ -158,7 +190,7 @@ class GeminiLLMService(ILLMService):
             max_tokens = kwargs.pop("max_tokens", 4096)
             model = self._models[mode or self._current_mode]
 
-            logger.debug(f"Image QA with {model}")
+            logger.debug("Image QA with %s", model)
 
             response = await self._client.aio.models.generate_content(
                 model=model,
@@ -170,7 +202,7 @@ class GeminiLLMService(ILLMService):
             )
 
             result = response.text or ""
-            logger.debug(f"Image QA: {len(result)} chars")
+            logger.debug("Image QA: %s chars", len(result))
             return result
 
         except Exception as e:
@@ -180,8 +212,6 @@ class GeminiLLMService(ILLMService):
 
 if __name__ == "__main__":
     # Simple test
-    import asyncio
-
     async def test_gemini():
         service = GeminiLLMService()
         prompt = "PTIT là gì? có bao nhiêu ngành, điểm ngành IT là bao nhiêu?"
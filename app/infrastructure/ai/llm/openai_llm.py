@@ -43,6 +43,15 @@ class OpenAILLMService(ILLMService):
             f"OpenAI initialized - QA: {self.config.model_qa}, Reasoning: {self.config.model_reasoning}"
         )
 
+    async def warmup(self) -> None:
+        """Fetch model metadata to establish a pooled, authenticated connection."""
+        model = self._models[self._current_mode]
+        try:
+            await self.client.models.retrieve(model)
+            logger.info("%s warmed up (%s)", self.__class__.__name__, model)
+        except Exception as e:
+            logger.warning("%s warmup failed: %s", self.__class__.__name__, e)
+
     async def generate(
         self,
         prompt: str,
@@ -67,14 +76,14 @@ class OpenAILLMService(ILLMService):
 
             kwargs.setdefault("max_tokens", 4096)
 
-            logger.debug(f"Generating with {model}")
+            logger.debug("Generating with %s", model)
 
             response = await self.client.chat.completions.create(
                 model=model, messages=messages, **kwargs
             )
 
             result = response.choices[0].message.content
-            logger.debug(f"Generated {len(result)} chars")
+            logger.debug("Generated %s chars", len(result))
             return result
 
         except RateLimitError as e:
@@ -108,7 +117,7 @@ class OpenAILLMService(ILLMService):
 
             kwargs.setdefault("max_tokens", 4096)
 
-            logger.debug(f"Streaming with {model}")
+            logger.debug("Streaming with %s", model)
 
             stream = await self.client.chat.completions.create(
                 model=model, messages=messages, stream=True, **kwargs
@@ -173,14 +182,14 @@ class OpenAILLMService(ILLMService):
 
             kwargs.setdefault("max_tokens", 4096)
 
-            logger.debug(f"Image QA with {model}")
+            logger.debug("Image QA with %s", model)
 
             response = await self.client.chat.completions.create(
                 model=model, messages=messages, **kwargs
             )
 
             result = response.choices[0].message.content
-            logger.debug(f"Image QA response: {len(result)} chars")
+            logger.debug("Image QA response: %s chars", len(result))
             return result
 
         except RateLimitError as e:
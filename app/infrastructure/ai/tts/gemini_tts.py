@@ -4,10 +4,15 @@ Uses Google's Gemini TTS model for speech synthesis.
 Supports Vietnamese and 23 other languages.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
-import wave
-import io
-from typing import Optional, List
+import re
+import struct
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Optional, List, Tuple
 
 import google.genai as genai
 from google.genai import types
@@ -58,6 +63,51 @@ GEMINI_VOICES = {
     "Sulafat": "Warm",
 }
 
+# Voice listing, built once (entries are shared - treat as read-only)
+_VOICE_LIST = tuple(
+    {"name": name, "description": desc} for name, desc in GEMINI_VOICES.items()
+)
+
+# Prompt prefix per speech speed
+SPEED_INSTRUCTIONS = {
+    SpeechSpeed.SLOW: "Speak slowly and clearly",
+    SpeechSpeed.NORMAL: "",
+    SpeechSpeed.FAST: "Speak quickly",
+}
+
+# Gemini TTS output format: raw PCM, 24kHz, 16-bit, mono
+PCM_SAMPLE_RATE = 24000
+PCM_SAMPLE_WIDTH = 2  # bytes per sample
+PCM_CHANNELS = 1
+_SECONDS_PER_PCM_BYTE = 1.0 / (PCM_SAMPLE_RATE * PCM_SAMPLE_WIDTH * PCM_CHANNELS)
+
+# Canonical 44-byte RIFF/WAVE header (PCM)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+# data size for a streamed WAV of unknown length (RIFF size saturates too)
+_WAV_STREAM_DATA_LEN = 0xFFFFFFFF - 36
+
+# SSML/XML tags (stripped - Gemini TTS takes plain text)
+_SSML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@functools.lru_cache(maxsize=32)
+def _tts_config(voice_name: str) -> types.GenerateContentConfig:
+    """
+    Audio generation config for a voice.
+
+    Built once per voice and shared across requests - do not mutate.
+    """
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice_name,
+                )
+            )
+        ),
+    )
+
 
 class GeminiTTSService(ITTSService):
     """
@@ -67,6 +117,7 @@ class GeminiTTSService(ITTSService):
     - 30 different voice options
     - 24 supported languages (including Vietnamese)
     - Style control via prompts
+    - In-process TTL + LRU cache of synthesized audio (bounded by total bytes)
     """
 
     def __init__(
@@ -84,6 +135,14 @@ class GeminiTTSService(ITTSService):
         self._model = self.config.model_tts
         self._default_voice = self.config.tts_voice
 
+        # Audio cache: key -> (expires_at, result), LRU ordered
+        self._cache: "OrderedDict[str, Tuple[float, TTSResult]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_max_bytes = self.config.tts_cache_max_bytes
+        self._cache_ttl = self.config.tts_cache_ttl
+        # Single-flight: identical concurrent requests share one API call
+        self._inflight: Dict[str, asyncio.Task] = {}
+
         logger.info(
             f"Initialized GeminiTTSService - Model: {self._model}, "
             f"Default voice: {self._default_voice}"
@@ -91,12 +150,7 @@ class GeminiTTSService(ITTSService):
 
     def _get_speed_instruction(self, speed: SpeechSpeed) -> str:
         """Get speed instruction for prompt."""
-        speed_map = {
-            SpeechSpeed.SLOW: "Speak slowly and clearly",
-            SpeechSpeed.NORMAL: "",
-            SpeechSpeed.FAST: "Speak quickly",
-        }
-        return speed_map.get(speed, "")
+        return SPEED_INSTRUCTIONS.get(speed, "")
 
     def _build_prompt(self, text: str, config: TTSConfig) -> str:
         """Build TTS prompt with style instructions."""
@@ -131,23 +185,43 @@ class GeminiTTSService(ITTSService):
         """
         if config is None:
             config = TTSConfig()
+        voice_name = self._default_voice
+
+        key = self._cache_key(text, config, voice_name)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("TTS cache hit (%s chars)", len(text))
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._synthesize_and_cache(key, text, config, voice_name)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
 
+        # shield: a cancelled caller must not cancel the call for other waiters
+        return await asyncio.shield(task)
+
+    async def _synthesize_and_cache(
+        self, key: str, text: str, config: TTSConfig, voice_name: str
+    ) -> TTSResult:
+        """Synthesize and store the result before waiters are released."""
+        result = await self._synthesize(text, config, voice_name)
+        self._cache_put(key, result)
+        return result
+
+    async def _synthesize(
+        self, text: str, config: TTSConfig, voice_name: str
+    ) -> TTSResult:
+        """Call Gemini TTS and wrap the PCM output as WAV."""
         try:
             # Build prompt with instructions
             prompt = self._build_prompt(text, config)
 
             # Configure TTS
-            voice_name = self._default_voice
-            tts_config = types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice_name,
-                        )
-                    )
-                ),
-            )
+            tts_config = _tts_config(voice_name)
 
             logger.debug(
                 f"Synthesizing with voice: {voice_name}, text length: {len(text)}"
@@ -172,28 +246,138 @@ class GeminiTTSService(ITTSService):
             if not audio_data:
                 raise RuntimeError("Empty audio data received")
 
-            # Convert to WAV format
-            wav_bytes = self._pcm_to_wav(audio_data)
+            result = self._wav_result(audio_data, text, voice_name)
+            logger.info(
+                f"TTS completed: {len(result.audio_bytes)} bytes, "
+                f"{result.duration_seconds:.2f}s"
+            )
+            return result
 
-            # Calculate duration (PCM: 24kHz, 16-bit, mono)
-            duration = len(audio_data) / (
-                24000 * 2
-            )  # bytes / (sample_rate * bytes_per_sample)
+        except Exception as e:
+            logger.error(f"Error in Gemini TTS: {e}")
+            raise RuntimeError(f"Failed to synthesize speech: {str(e)}")
 
-            logger.info(f"TTS completed: {len(wav_bytes)} bytes, {duration:.2f}s")
+    def _wav_result(self, pcm_data: bytes, text: str, voice_name: str) -> TTSResult:
+        """Wrap synthesized PCM as a WAV TTSResult."""
+        return TTSResult(
+            audio_bytes=self._pcm_to_wav(pcm_data),
+            audio_format="wav",
+            duration_seconds=len(pcm_data) * _SECONDS_PER_PCM_BYTE,
+            sample_rate=PCM_SAMPLE_RATE,
+            text_length=len(text),
+            voice_used=voice_name,
+        )
 
-            return TTSResult(
-                audio_bytes=wav_bytes,
-                audio_format="wav",
-                duration_seconds=duration,
-                sample_rate=24000,
-                text_length=len(text),
-                voice_used=voice_name,
+    async def synthesize_stream(
+        self,
+        text: str,
+        config: Optional[TTSConfig] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized speech as it is generated.
+
+        Args:
+            text: Text to convert to speech
+            config: TTS configuration
+
+        Yields:
+            Raw PCM chunks (24kHz, 16-bit, mono) - see synthesize_stream_wav
+            for a playable stream
+        """
+        if config is None:
+            config = TTSConfig()
+        voice_name = self._default_voice
+
+        try:
+            stream = await self._client.aio.models.generate_content_stream(
+                model=self._model,
+                contents=self._build_prompt(text, config),
+                config=_tts_config(voice_name),
             )
+            async for chunk in stream:
+                if not chunk.candidates or not chunk.candidates[0].content:
+                    continue
+                for part in chunk.candidates[0].content.parts or []:
+                    if part.inline_data and part.inline_data.data:
+                        yield part.inline_data.data
 
         except Exception as e:
-            logger.error(f"Error in Gemini TTS: {e}")
-            raise RuntimeError(f"Failed to synthesize speech: {str(e)}")
+            logger.error(f"Error in Gemini TTS stream: {e}")
+            raise RuntimeError(f"Failed to stream speech: {str(e)}")
+
+    async def synthesize_stream_wav(
+        self,
+        text: str,
+        config: Optional[TTSConfig] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a playable WAV: header, then PCM chunks as they are generated.
+
+        The total length is unknown when the header goes out, so it carries
+        the streaming placeholder sizes players read as "until end of
+        stream". Nothing is yielded before the first audio arrives, so
+        callers can still turn an upstream failure into an error response.
+        Cached audio is served whole; a completed stream is cached.
+
+        Yields:
+            WAV bytes (24kHz, 16-bit, mono)
+        """
+        if config is None:
+            config = TTSConfig()
+        voice_name = self._default_voice
+
+        key = self._cache_key(text, config, voice_name)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("TTS cache hit (%s chars)", len(text))
+            yield cached.audio_bytes
+            return
+
+        pcm = bytearray()
+        async for chunk in self.synthesize_stream(text, config):
+            if not pcm:
+                header = bytearray(_WAV_HEADER.size)
+                self._write_wav_header(header, _WAV_STREAM_DATA_LEN)
+                yield bytes(header)
+            pcm.extend(chunk)
+            yield chunk
+
+        if pcm:
+            self._cache_put(key, self._wav_result(bytes(pcm), text, voice_name))
+
+    def _cache_key(self, text: str, config: TTSConfig, voice_name: str) -> str:
+        """Hash everything that affects the synthesized audio."""
+        raw = f"{self._model}|{voice_name}|{config.speed.value}|{text}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[TTSResult]:
+        """Return a live cached result and mark it recently used."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            self._cache_evict(key)
+            return None
+        self._cache.move_to_end(key)
+        return result
+
+    def _cache_put(self, key: str, result: TTSResult) -> None:
+        """Store result, evicting least recently used audio over the byte budget."""
+        size = len(result.audio_bytes)
+        if size > self._cache_max_bytes:
+            return
+        if key in self._cache:
+            self._cache_evict(key)
+        self._cache[key] = (time.monotonic() + self._cache_ttl, result)
+        self._cache_bytes += size
+        while self._cache_bytes > self._cache_max_bytes:
+            self._cache_evict(next(iter(self._cache)))
+
+    def _cache_evict(self, key: str) -> None:
+        """Drop one cache entry."""
+        _, result = self._cache.pop(key)
+        self._cache_bytes -= len(result.audio_bytes)
 
     async def synthesize_ssml(
         self,
@@ -213,11 +397,8 @@ class GeminiTTSService(ITTSService):
         Returns:
             TTSResult with audio bytes
         """
-        import re
-
         # Strip SSML tags to get plain text
-        text = re.sub(r"<[^>]+>", "", ssml)
-        text = text.strip()
+        text = _SSML_TAG_RE.sub("", ssml).strip()
 
         logger.warning("SSML not natively supported, using extracted text")
         return await self.synthesize(text, config)
@@ -229,9 +410,7 @@ class GeminiTTSService(ITTSService):
         Returns:
             List of voice dictionaries with name and description
         """
-        return [
-            {"name": name, "description": desc} for name, desc in GEMINI_VOICES.items()
-        ]
+        return list(_VOICE_LIST)
 
     async def is_available(self) -> bool:
         """Check if Gemini TTS service is available."""
@@ -244,9 +423,9 @@ class GeminiTTSService(ITTSService):
     def _pcm_to_wav(
         self,
         pcm_data: bytes,
-        channels: int = 1,
-        sample_rate: int = 24000,
-        sample_width: int = 2,
+        channels: int = PCM_CHANNELS,
+        sample_rate: int = PCM_SAMPLE_RATE,
+        sample_width: int = PCM_SAMPLE_WIDTH,
     ) -> bytes:
         """
         Convert raw PCM audio to WAV format.
@@ -260,20 +439,42 @@ class GeminiTTSService(ITTSService):
         Returns:
             WAV formatted audio bytes
         """
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(sample_width)
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
+        # Header, then the samples as-is
+        header = bytearray(_WAV_HEADER.size)
+        self._write_wav_header(
+            header, len(pcm_data), channels, sample_rate, sample_width
+        )
+        return bytes(header) + pcm_data
 
-        buffer.seek(0)
-        return buffer.read()
+    def _write_wav_header(
+        self,
+        buf: bytearray,
+        data_len: int,
+        channels: int = PCM_CHANNELS,
+        sample_rate: int = PCM_SAMPLE_RATE,
+        sample_width: int = PCM_SAMPLE_WIDTH,
+    ) -> None:
+        """Write the WAV header into the first 44 bytes of buf, in place."""
+        _WAV_HEADER.pack_into(
+            buf,
+            0,
+            b"RIFF",
+            36 + data_len,
+            b"WAVE",
+            b"fmt ",
+            16,  # fmt chunk size
+            1,  # PCM
+            channels,
+            sample_rate,
+            sample_rate * channels * sample_width,  # byte rate
+            channels * sample_width,  # block align
+            sample_width * 8,  # bits per sample
+            b"data",
+            data_len,
+        )
 
 
 if __name__ == "__main__":
-    import asyncio
-
     async def test_tts():
         service = GeminiTTSService()
 
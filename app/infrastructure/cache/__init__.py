@@ -0,0 +1,5 @@
+"""In-process caches."""
+
+from .semantic_cache import InMemorySemanticCache
+
+__all__ = ["InMemorySemanticCache"]
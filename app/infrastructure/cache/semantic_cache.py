@@ -0,0 +1,113 @@
+"""In-memory semantic response cache."""
+
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+from app.application.interfaces.services.response_cache_service import IResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """Cached answer with its normalized query embedding."""
+
+    scope: Hashable
+    vector: np.ndarray
+    query: str
+    answer: str
+    expires_at: float
+
+
+class InMemorySemanticCache(IResponseCache):
+    """
+    Per-process semantic cache for LLM answers.
+
+    Entries are partitioned by scope, so a lookup only scans answers whose
+    scope matches exactly; within a scope the best cosine match above the
+    threshold wins. Bounded (LRU eviction) and TTL-expired.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_seconds: int = 3600,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._ids = itertools.count()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._scopes: Dict[Hashable, List[int]] = {}
+
+    async def lookup(
+        self,
+        embedding: List[float],
+        scope: Hashable = None,
+        threshold: Optional[float] = None,
+    ) -> Optional[str]:
+        """Return the best cached answer above threshold within scope."""
+        ids = self._scopes.get(scope)
+        if not ids:
+            return None
+
+        now = time.monotonic()
+        for entry_id in [i for i in ids if self._entries[i].expires_at <= now]:
+            self._remove(entry_id)
+        ids = self._scopes.get(scope)
+        if not ids:
+            return None
+
+        matrix = np.stack([self._entries[i].vector for i in ids])
+        scores = matrix @ self._normalize(embedding)
+        best = int(np.argmax(scores))
+        if scores[best] < (self.threshold if threshold is None else threshold):
+            return None
+
+        entry_id = ids[best]
+        self._entries.move_to_end(entry_id)
+        logger.debug("Semantic cache hit (%.3f)", scores[best])
+        return self._entries[entry_id].answer
+
+    async def put(
+        self,
+        embedding: List[float],
+        query: str,
+        answer: str,
+        scope: Hashable = None,
+    ) -> None:
+        """Store answer, evicting least recently used entries when full."""
+        entry_id = next(self._ids)
+        self._entries[entry_id] = _Entry(
+            scope=scope,
+            vector=self._normalize(embedding),
+            query=query,
+            answer=answer,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._scopes.setdefault(scope, []).append(entry_id)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry from both indexes."""
+        entry = self._entries.pop(entry_id)
+        ids = self._scopes[entry.scope]
+        ids.remove(entry_id)
+        if not ids:
+            del self._scopes[entry.scope]
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Unit-normalize so dot product equals cosine similarity."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
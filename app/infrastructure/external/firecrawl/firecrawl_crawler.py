@@ -3,11 +3,15 @@ FireCrawl crawler for extracting web content.
 Uses FireCrawl API to crawl and extract content from URLs.
 """
 
+import asyncio
 import logging
+import random
+import re
 import time
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Literal, Optional, List
 
-from firecrawl import FirecrawlApp
+import httpx
+from firecrawl import AsyncFirecrawl
 
 from app.application.interfaces.processors.web_crawler import IWebCrawler
 from app.config import firecrawl_config
@@ -15,6 +19,35 @@ from app.config.external import FirecrawlConfig
 
 logger = logging.getLogger(__name__)
 
+# Common error page indicators, matched in one pass
+_ERROR_PAGE_RE = re.compile(
+    r"404 not found|page not found|access denied|forbidden|error 404"
+    r"|500 internal server error",
+    re.IGNORECASE,
+)
+
+# clean_content normalization (whitespace other than newlines, per line)
+_LINE_WS_RE = re.compile(r"[^\S\n]*\n[^\S\n]*")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+# Payload modes: "full" fetches cleaned markdown; "preview" only metadata
+# (title/description); "links" metadata plus outgoing links. Non-full modes
+# skip markdown download and validate/clean.
+ScrapeMode = Literal["full", "preview", "links"]
+
+# Transient Firecrawl failures worth retrying (rate limiting, server errors)
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Retry network errors and 429/5xx responses, never other 4xx."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code in _RETRYABLE_STATUS
+
 
 class FireCrawlCrawler(IWebCrawler):
     """Crawler using FireCrawl API to extract content from URLs."""
@@ -31,23 +64,57 @@ class FireCrawlCrawler(IWebCrawler):
         if not self.config.api_key:
             raise ValueError("FIRECRAWL_API_KEY is required")
 
-        self.client = FirecrawlApp(api_key=self.config.api_key)
+        # Async client: requests run on a pooled httpx.AsyncClient instead of
+        # blocking the event loop for the whole round-trip
+        self.client = AsyncFirecrawl(api_key=self.config.api_key)
         self.timeout = self.config.timeout
         self.min_content_length = self.config.min_content_length
 
+    async def _with_retry(
+        self, operation: str, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run a Firecrawl call, retrying transient errors with backoff + jitter."""
+        attempts = self.config.max_retries + 1
+        for attempt in range(1, attempts + 1):
+            try:
+                return await call()
+            except Exception as e:
+                if attempt == attempts or not _is_retryable(e):
+                    raise
+                delay = min(
+                    self.config.retry_max_backoff,
+                    self.config.retry_backoff * 2 ** (attempt - 1)
+                    + random.uniform(0, self.config.retry_backoff),
+                )
+                logger.info(
+                    "Retrying %s (attempt %d/%d) in %.1fs: %s",
+                    operation,
+                    attempt + 1,
+                    attempts,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+
     async def scrape_url(
-        self, url: str, formats: List[str] = None, timeout: int = 60000
+        self,
+        url: str,
+        formats: List[str] = None,
+        timeout: int = 60000,
+        mode: ScrapeMode = "full",
     ) -> Dict[str, Any]:
         """
         Scrape a single URL and extract content.
 
         Args:
             url: URL to scrape
-            formats: Output formats (default: ["markdown"])
+            formats: Output formats (default: ["markdown"]), "full" mode only
             timeout: Timeout in milliseconds
+            mode: "full", "preview" (metadata only) or "links"
 
         Returns:
             Dictionary with scraped data including markdown content
+            (metadata only for "preview", plus "links" for "links")
         """
         start_time = time.time()
 
@@ -55,11 +122,15 @@ class FireCrawlCrawler(IWebCrawler):
             logger.info(f"Scraping URL: {url}")
 
             # Scrape using Firecrawl
-            result = self.client.scrape(
-                url,
-                formats=formats or ["markdown"],
-                only_main_content=True,
-                timeout=timeout,
+            result = await self._with_retry(
+                f"scrape {url}",
+                lambda: self.client.scrape(
+                    url,
+                    # "links" is the lightest format; metadata always comes back
+                    formats=(formats or ["markdown"]) if mode == "full" else ["links"],
+                    only_main_content=True,
+                    timeout=timeout,
+                ),
             )
 
             duration = time.time() - start_time
@@ -67,6 +138,27 @@ class FireCrawlCrawler(IWebCrawler):
             if not result:
                 raise Exception("Empty response from Firecrawl")
 
+            metadata = (
+                result.metadata
+                if hasattr(result, "metadata")
+                else result.get("metadata", {})
+            )
+
+            if mode != "full":
+                page = {
+                    "success": True,
+                    "url": url,
+                    "metadata": metadata,
+                    "duration_seconds": duration,
+                }
+                if mode == "links":
+                    page["links"] = (
+                        result.links
+                        if hasattr(result, "links")
+                        else result.get("links", [])
+                    ) or []
+                return page
+
             # Extract markdown content
             markdown_content = (
                 result.markdown
@@ -87,12 +179,6 @@ class FireCrawlCrawler(IWebCrawler):
                 f"({len(cleaned_content)} chars)"
             )
 
-            metadata = (
-                result.metadata
-                if hasattr(result, "metadata")
-                else result.get("metadata", {})
-            )
-
             return {
                 "success": True,
                 "url": url,
@@ -146,13 +232,17 @@ class FireCrawlCrawler(IWebCrawler):
                 timeout=self.timeout,
             )
 
-            # Start crawl job (async mode)
-            result = self.client.crawl(
-                url,
-                limit=limit,
-                max_discovery_depth=max_depth,
-                scrape_options=scrape_opts,
-                poll_interval=5,
+            # Start crawl job (async mode); AsyncFirecrawlClient.crawl() is
+            # keyword-only
+            result = await self._with_retry(
+                f"crawl {url}",
+                lambda: self.client.crawl(
+                    url=url,
+                    limit=limit,
+                    max_discovery_depth=max_depth,
+                    scrape_options=scrape_opts,
+                    poll_interval=5,
+                ),
             )
 
             duration = time.time() - start_time
@@ -223,20 +313,10 @@ class FireCrawlCrawler(IWebCrawler):
         if len(content) < self.min_content_length:
             return False, f"Content too short ({len(content)} chars)"
 
-        # Check for common error pages
-        error_indicators = [
-            "404 not found",
-            "page not found",
-            "access denied",
-            "forbidden",
-            "error 404",
-            "500 internal server error",
-        ]
-
-        content_lower = content.lower()
-        for indicator in error_indicators:
-            if indicator in content_lower[:500]:  # Check first 500 chars
-                return False, f"Detected error page: {indicator}"
+        # Check for common error pages (first 500 chars, no lowercased copy)
+        match = _ERROR_PAGE_RE.search(content, 0, 500)
+        if match:
+            return False, f"Detected error page: {match.group(0).lower()}"
 
         return True, None
 
@@ -245,6 +325,7 @@ class FireCrawlCrawler(IWebCrawler):
         query: str,
         max_results: int = 5,
         formats: list[str] = None,
+        mode: ScrapeMode = "full",
     ) -> Dict[str, Any]:
         """
         Search the web using Firecrawl.
@@ -253,6 +334,8 @@ class FireCrawlCrawler(IWebCrawler):
             query: Search query
             max_results: Maximum number of results
             formats: Output formats
+            mode: "full" scrapes each result; "preview"/"links" return only
+                url, title and snippet (no page content is downloaded)
 
         Returns:
             Dictionary with search results
@@ -260,81 +343,17 @@ class FireCrawlCrawler(IWebCrawler):
         start_time = time.time()
 
         try:
-            logger.info(f"Searching web for: {query}")
-
-            # Create scrape options for search results
-            from firecrawl.v2.types import ScrapeOptions
-
-            scrape_opts = ScrapeOptions(
-                formats=formats or ["markdown"],
-                only_main_content=True,
-            )
-
-            # Search using Firecrawl
-            result = self.client.search(
-                query,
-                limit=max_results,
-                scrape_options=scrape_opts,
-            )
-
-            duration = time.time() - start_time
-
-            if not result:
-                raise Exception("No results returned from search")
-
-            # Extract search results (Firecrawl returns web, news, images)
-            results = []
-            if hasattr(result, "web") and result.web:
-                results = result.web
-            elif hasattr(result, "news") and result.news:
-                results = result.news
+            items = await self._search(query, max_results, formats, mode)
+            if mode == "full":
+                semaphore = asyncio.Semaphore(self.config.search_enrich_concurrency)
+                enriched = await asyncio.gather(
+                    *(self._enrich_search_item(item, semaphore) for item in items)
+                )
+                processed_results = [item for item in enriched if item]
             else:
-                results = []
-
-            # Process each result
-            processed_results = []
-            for item in results:
-                try:
-                    # Extract content
-                    if hasattr(item, "markdown"):
-                        markdown = item.markdown
-                        url = item.url if hasattr(item, "url") else ""
-                        title = (
-                            item.metadata.title
-                            if hasattr(item, "metadata")
-                            and hasattr(item.metadata, "title")
-                            else ""
-                        )
-                    else:
-                        markdown = item.get("markdown", "")
-                        url = item.get("url", "")
-                        metadata = item.get("metadata", {})
-                        title = (
-                            metadata.get("title", "")
-                            if isinstance(metadata, dict)
-                            else ""
-                        )
-
-                    # Validate and clean
-                    is_valid, error_msg = self.validate_content(markdown)
-                    if not is_valid:
-                        continue
-
-                    cleaned = self.clean_content(markdown)
-
-                    processed_results.append(
-                        {
-                            "url": url,
-                            "title": title,
-                            "content": cleaned,
-                            "length": len(cleaned),
-                        }
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Failed to process search result: {e}")
-                    continue
+                processed_results = [self._preview_search_item(item) for item in items]
 
+            duration = time.time() - start_time
             logger.info(
                 f"Search completed in {duration:.2f}s, found {len(processed_results)} valid results"
             )
@@ -358,39 +377,139 @@ class FireCrawlCrawler(IWebCrawler):
                 "duration_seconds": duration,
             }
 
-    def clean_content(self, content: str) -> str:
-        """Clean and normalize extracted content."""
-        if not content:
-            return ""
+    async def search_web_stream(
+        self,
+        query: str,
+        max_results: int = 5,
+        formats: list[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search the web, yielding each valid result as soon as it is ready.
+
+        Same result dicts as search_web()["results"], in completion order.
+        Search failures propagate to the caller.
+        """
+        items = await self._search(query, max_results, formats)
+        semaphore = asyncio.Semaphore(self.config.search_enrich_concurrency)
+        for next_item in asyncio.as_completed(
+            [self._enrich_search_item(item, semaphore) for item in items]
+        ):
+            processed = await next_item
+            if processed:
+                yield processed
+
+    async def _search(
+        self,
+        query: str,
+        max_results: int,
+        formats: Optional[List[str]],
+        mode: ScrapeMode = "full",
+    ) -> List[Any]:
+        """Run a Firecrawl search and return the raw result items."""
+        logger.info(f"Searching web for: {query}")
+
+        # Create scrape options for search results (none: urls/titles only)
+        scrape_opts = None
+        if mode == "full":
+            from firecrawl.v2.types import ScrapeOptions
 
-        # Remove excessive whitespace
-        lines = content.split("\n")
-        cleaned_lines = []
+            scrape_opts = ScrapeOptions(
+                formats=formats or ["markdown"],
+                only_main_content=True,
+            )
 
-        prev_empty = False
-        for line in lines:
-            line = line.strip()
+        # Search using Firecrawl
+        result = await self._with_retry(
+            f"search '{query}'",
+            lambda: self.client.search(
+                query,
+                limit=max_results,
+                scrape_options=scrape_opts,
+            ),
+        )
+
+        if not result:
+            raise Exception("No results returned from search")
+
+        # Extract search results (Firecrawl returns web, news, images)
+        if hasattr(result, "web") and result.web:
+            return result.web
+        if hasattr(result, "news") and result.news:
+            return result.news
+        return []
+
+    def _preview_search_item(self, item: Any) -> Dict[str, Any]:
+        """Url, title and snippet of an unscraped search result."""
+        if isinstance(item, dict):
+            return {
+                "url": item.get("url", ""),
+                "title": item.get("title", ""),
+                "snippet": item.get("description", ""),
+            }
+        return {
+            "url": getattr(item, "url", "") or "",
+            "title": getattr(item, "title", "") or "",
+            "snippet": getattr(item, "description", "") or "",
+        }
+
+    async def _enrich_search_item(
+        self, item: Any, semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validate and clean one search result.
 
-            if not line:
-                if not prev_empty:
-                    cleaned_lines.append("")
-                prev_empty = True
+        Results that came back without content (partial responses) are
+        re-fetched with scrape_url, bounded by the shared semaphore.
+        """
+        try:
+            # Extract content
+            if hasattr(item, "markdown"):
+                markdown = item.markdown
+                url = item.url if hasattr(item, "url") else ""
+                title = (
+                    item.metadata.title
+                    if hasattr(item, "metadata") and hasattr(item.metadata, "title")
+                    else ""
+                )
             else:
-                cleaned_lines.append(line)
-                prev_empty = False
+                markdown = item.get("markdown", "")
+                url = item.get("url", "")
+                metadata = item.get("metadata", {})
+                title = metadata.get("title", "") if isinstance(metadata, dict) else ""
+
+            if not markdown and url:
+                async with semaphore:
+                    scraped = await self.scrape_url(url)
+                markdown = scraped.get("markdown", "") if scraped["success"] else ""
+
+            # Validate and clean
+            is_valid, _ = self.validate_content(markdown)
+            if not is_valid:
+                return None
 
-        # Join lines
-        cleaned = "\n".join(cleaned_lines)
+            cleaned = self.clean_content(markdown)
 
-        # Remove more than 2 consecutive newlines
-        while "\n\n\n" in cleaned:
-            cleaned = cleaned.replace("\n\n\n", "\n\n")
+            return {
+                "url": url,
+                "title": title,
+                "content": cleaned,
+                "length": len(cleaned),
+            }
 
-        return cleaned.strip()
+        except Exception as e:
+            logger.warning(f"Failed to process search result: {e}")
+            return None
 
-if __name__ == "__main__":
-    import asyncio
+    def clean_content(self, content: str) -> str:
+        """Clean and normalize extracted content."""
+        if not content:
+            return ""
 
+        # Strip whitespace around line breaks, then collapse blank-line runs
+        normalized = _LINE_WS_RE.sub("\n", content)
+        return _MULTI_NEWLINE_RE.sub("\n\n", normalized).strip()
+
+if __name__ == "__main__":
     async def test_crawler():
         crawler = FireCrawlCrawler()
         url = "https://www.ptit.edu.vn/"
@@ -3,10 +3,12 @@ Gemini Web Search implementation using Google Search grounding.
 Uses Google's generative AI with built-in web search capability.
 """
 
+import functools
 import logging
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+import httpx
 import google.genai as genai
 from google.genai import types
 
@@ -20,6 +22,34 @@ from app.config.ai import GeminiConfig
 
 logger = logging.getLogger(__name__)
 
+# Generation defaults for grounded search
+DEFAULT_TEMPERATURE = 0.7
+DEFAULT_MAX_TOKENS = 4096
+
+# Links in the rendered Google search entry point HTML. A single character
+# class keeps matching linear; trailing dots are stripped afterwards.
+_URL_RE = re.compile(r'https?://[^\s<>"\'`]+')
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_urls_from_html(html: str) -> Tuple[str, ...]:
+    """
+    Extract unique non-Google URLs from HTML content.
+
+    Memoized: Google often returns the same rendered search widget for
+    repeated queries.
+    """
+    # Filter out Google URLs and duplicates (first occurrence wins)
+    seen = set()
+    unique_urls = []
+    for url in _URL_RE.findall(html):
+        url = url.rstrip(".")
+        if "google.com" in url or url in seen:
+            continue
+        seen.add(url)
+        unique_urls.append(url)
+    return tuple(unique_urls)
+
 
 class GeminiWebSearchService(IWebSearchService):
     """
@@ -40,14 +70,44 @@ class GeminiWebSearchService(IWebSearchService):
             config: Gemini configuration. If None, uses global gemini_config.
         """
         self.config = config or gemini_config
-        self._client = genai.Client(api_key=self.config.api_key)
+        # One pooled HTTP client for the service lifetime: repeated searches
+        # reuse warm keep-alive connections instead of new TLS handshakes
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.web_search_max_connections,
+                max_keepalive_connections=self.config.web_search_max_keepalive,
+            ),
+        )
+        # google-genai passes HttpOptions.timeout (milliseconds) on every
+        # request, overriding any default set on the httpx client
+        self._client = genai.Client(
+            api_key=self.config.api_key,
+            http_options=types.HttpOptions(
+                httpx_async_client=self._http,
+                timeout=int(self.config.web_search_timeout * 1000),
+            ),
+        )
         self._model = self.config.model_web_search
 
         # Configure grounding tool
         self._grounding_tool = types.Tool(google_search=types.GoogleSearch())
+        # Shared config for default-parameter searches (never mutated)
+        self._default_config = self._build_config(
+            DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS
+        )
 
         logger.info(f"Initialized GeminiWebSearchService with model: {self._model}")
 
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "GeminiWebSearchService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def search(
         self, query: str, num_results: int = 5, **kwargs
     ) -> WebSearchResponse:
@@ -63,14 +123,15 @@ class GeminiWebSearchService(IWebSearchService):
             WebSearchResponse with answer and sources
         """
         try:
-            logger.debug(f"Web search query: {query}")
+            logger.debug("Web search query: %s", query)
 
             # Configure generation with grounding
-            config = types.GenerateContentConfig(
-                tools=[self._grounding_tool],
-                temperature=kwargs.pop("temperature", 0.7),
-                max_output_tokens=kwargs.pop("max_tokens", 4096),
-            )
+            temperature = kwargs.pop("temperature", DEFAULT_TEMPERATURE)
+            max_tokens = kwargs.pop("max_tokens", DEFAULT_MAX_TOKENS)
+            if (temperature, max_tokens) == (DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS):
+                config = self._default_config
+            else:
+                config = self._build_config(temperature, max_tokens)
 
             # Generate response with web search
             response = await self._client.aio.models.generate_content(
@@ -86,7 +147,7 @@ class GeminiWebSearchService(IWebSearchService):
             sources = self._extract_sources(response, num_results)
 
             logger.info(
-                f"Web search completed: {len(answer)} chars, {len(sources)} sources"
+                "Web search completed: %s chars, %s sources", len(answer), len(sources)
             )
 
             return WebSearchResponse(
@@ -99,6 +160,16 @@ class GeminiWebSearchService(IWebSearchService):
             logger.error(f"Error in Gemini web search: {e}")
             raise RuntimeError(f"Web search failed: {str(e)}")
 
+    def _build_config(
+        self, temperature: float, max_tokens: int
+    ) -> types.GenerateContentConfig:
+        """Generation config with the Google Search grounding tool."""
+        return types.GenerateContentConfig(
+            tools=[self._grounding_tool],
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+
     def _extract_sources(self, response, max_sources: int = 5) -> List[SearchResult]:
         """
         Extract source URLs from Gemini response grounding metadata.
@@ -111,71 +182,65 @@ class GeminiWebSearchService(IWebSearchService):
             List of SearchResult objects
         """
         sources = []
+        # Local bindings for the append loops
+        append = sources.append
+        result_cls = SearchResult
 
         try:
-            # Check if response has grounding metadata
-            if not hasattr(response, "candidates") or not response.candidates:
+            # Grounding metadata (absent: no candidates / not grounded)
+            try:
+                metadata = response.candidates[0].grounding_metadata
+                chunks = metadata.grounding_chunks or []
+            except (AttributeError, IndexError, TypeError):
                 return sources
 
-            candidate = response.candidates[0]
-
-            # Try to get grounding metadata
-            if (
-                hasattr(candidate, "grounding_metadata")
-                and candidate.grounding_metadata
-            ):
-                metadata = candidate.grounding_metadata
-
-                # Extract from grounding_chunks if available
-                if hasattr(metadata, "grounding_chunks"):
-                    for chunk in metadata.grounding_chunks[:max_sources]:
-                        if hasattr(chunk, "web") and chunk.web:
-                            sources.append(
-                                SearchResult(
-                                    title=getattr(chunk.web, "title", "Unknown"),
-                                    url=getattr(chunk.web, "uri", ""),
-                                    snippet=(
-                                        getattr(chunk, "text", "")[:200]
-                                        if hasattr(chunk, "text")
-                                        else ""
-                                    ),
-                                )
-                            )
+            # Extract from grounding_chunks if available
+            for chunk in chunks[:max_sources]:
+                try:
+                    web = chunk.web
+                    if not web:
+                        continue
+                    append(
+                        result_cls(
+                            title=web.title or "Unknown",
+                            url=web.uri or "",
+                            snippet=(getattr(chunk, "text", "") or "")[:200],
+                        )
+                    )
+                except AttributeError:
+                    continue
+
+            # Enough sources already - skip parsing the entry point HTML
+            if len(sources) >= max_sources:
+                return sources
 
-                # Extract from search_entry_point if available
-                if (
-                    hasattr(metadata, "search_entry_point")
-                    and metadata.search_entry_point
-                ):
-                    if hasattr(metadata.search_entry_point, "rendered_content"):
-                        # Parse rendered HTML for links
-                        rendered = metadata.search_entry_point.rendered_content
-                        urls = self._extract_urls_from_html(rendered)
-                        for url in urls[: max_sources - len(sources)]:
-                            if not any(s.url == url for s in sources):
-                                sources.append(
-                                    SearchResult(
-                                        title="Search Result",
-                                        url=url,
-                                        snippet="",
-                                    )
-                                )
+            # Extract from search_entry_point if available
+            try:
+                rendered = metadata.search_entry_point.rendered_content
+            except AttributeError:
+                rendered = None
+
+            if rendered:
+                # Parse rendered HTML for links
+                urls = _extract_urls_from_html(rendered)
+                seen_urls = {s.url for s in sources}
+                for url in urls:
+                    if len(sources) >= max_sources:
+                        break
+                    if url not in seen_urls:
+                        append(
+                            result_cls(
+                                title="Search Result",
+                                url=url,
+                                snippet="",
+                            )
+                        )
 
         except Exception as e:
             logger.warning(f"Failed to extract sources: {e}")
 
-        return sources[:max_sources]
-
-    def _extract_urls_from_html(self, html: str) -> List[str]:
-        """Extract URLs from HTML content."""
-        url_pattern = r'https?://[^\s<>"\']+[^\s<>"\'\.]'
-        urls = re.findall(url_pattern, html)
-        # Filter out Google URLs and duplicates
-        unique_urls = []
-        for url in urls:
-            if "google.com" not in url and url not in unique_urls:
-                unique_urls.append(url)
-        return unique_urls
+        # Bounded by construction: chunks are sliced, entry point loop breaks
+        return sources
 
 
 if __name__ == "__main__":
@@ -3,11 +3,14 @@ MinIO storage - Simple implementation.
 Config từ centralized config module.
 """
 
+import asyncio
 import logging
-import uuid
+import secrets
 from io import BytesIO
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
+import certifi
+import urllib3
 from minio import Minio
 
 from app.application.interfaces.services.storage_service import IStorageService
@@ -16,10 +19,29 @@ from app.config.persistence import MinIOConfig
 
 logger = logging.getLogger(__name__)
 
+# Multipart part size for streams of unknown length
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+# (endpoint, bucket) pairs already probed/created by this process
+_VERIFIED_BUCKETS: set[tuple[str, str]] = set()
+
+
+class _StoredObject:
+    """Stub object record; doubles as the stat_object result (has .size)."""
+
+    __slots__ = ("data", "size", "content_type")
+
+    def __init__(self, data: bytes, content_type: Optional[str]):
+        self.data = data
+        self.size = len(data)
+        self.content_type = content_type
+
 
 class _InMemoryMinioObject:
     """Minimal file-like object for stubbed downloads."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: bytes):
         self._data = data
 
@@ -36,8 +58,10 @@ class _InMemoryMinioObject:
 class _InMemoryMinioClient:
     """Simple in-memory MinIO client replacement used as fallback."""
 
+    __slots__ = ("_buckets",)
+
     def __init__(self):
-        self._buckets: dict[str, dict[str, bytes]] = {}
+        self._buckets: dict[str, dict[str, _StoredObject]] = {}
 
     def bucket_exists(self, bucket_name: str) -> bool:
         return bucket_name in self._buckets
@@ -52,21 +76,18 @@ class _InMemoryMinioClient:
         data,
         length: int,
         content_type: Optional[str] = None,
+        part_size: int = 0,
     ):
         bucket = self._buckets.setdefault(bucket_name, {})
         payload = data.read() if hasattr(data, "read") else data
-        bucket[object_name] = {
-            "data": payload,
-            "size": len(payload),
-            "content_type": content_type,
-        }
+        bucket[object_name] = _StoredObject(payload, content_type)
 
     def get_object(self, bucket_name: str, object_name: str):
         bucket = self._buckets.get(bucket_name, {})
         stored = bucket.get(object_name)
         if not stored:
             raise FileNotFoundError(f"{object_name} not found")
-        return _InMemoryMinioObject(stored["data"])
+        return _InMemoryMinioObject(stored.data)
 
     def remove_object(self, bucket_name: str, object_name: str):
         bucket = self._buckets.get(bucket_name, {})
@@ -77,11 +98,7 @@ class _InMemoryMinioClient:
         stored = bucket.get(object_name)
         if not stored:
             raise FileNotFoundError(f"{object_name} not found")
-
-        class _Stat:
-            size = stored["size"]
-
-        return _Stat()
+        return stored
 
     def presigned_get_object(self, bucket_name: str, object_name: str, **_):
         return f"http://stub/{bucket_name}/{object_name}"
@@ -100,49 +117,103 @@ class MinIOStorage(IStorageService):
         """
         self.config = config or minio_config
         self.bucket = bucket
+        protocol = "https" if self.config.secure else "http"
+        self._url_prefix = f"{protocol}://{self.config.endpoint}/{self.bucket}/"
 
+        # No network I/O here - the connection probe runs on first use
         try:
             self.client = Minio(
                 endpoint=self.config.endpoint,
                 access_key=self.config.access_key,
                 secret_key=self.config.secret_key,
                 secure=self.config.secure,
+                http_client=self._build_http_client(),
             )
-            # Probe connection to detect credential issues early
-            self.client.bucket_exists(self.bucket)
         except Exception as e:
             logger.warning(
-                "MinIO connection failed, falling back to in-memory stub: %s", e
+                "MinIO client setup failed, falling back to in-memory stub: %s", e
             )
             self.client = _InMemoryMinioClient()
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
 
-        self._ensure_bucket()
-        logger.info(f"MinIO initialized: {self.config.endpoint}/{bucket}")
+    def _build_http_client(self) -> urllib3.PoolManager:
+        """
+        Keep-alive pool sized for concurrent calls from worker threads.
+
+        Same timeouts/retries as minio-py's default client, which only keeps
+        10 connections per host and churns connections under load.
+        """
+        return urllib3.PoolManager(
+            maxsize=self.config.max_connections,
+            timeout=urllib3.Timeout(connect=300, read=300),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where(),
+            retries=urllib3.Retry(
+                total=5,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        )
+
+    async def _ensure_ready(self):
+        """Probe the connection and ensure the bucket, once, off the event loop."""
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            if (self.config.endpoint, self.bucket) in _VERIFIED_BUCKETS:
+                self._ready = True
+                return
+            try:
+                # Probe connection to detect credential issues early
+                await asyncio.to_thread(self.client.bucket_exists, self.bucket)
+            except Exception as e:
+                logger.warning(
+                    "MinIO connection failed, falling back to in-memory stub: %s", e
+                )
+                self.client = _InMemoryMinioClient()
+
+            await asyncio.to_thread(self._ensure_bucket)
+            self._ready = True
+            logger.info(f"MinIO initialized: {self.config.endpoint}/{self.bucket}")
 
     def _ensure_bucket(self):
         """Create bucket if not exists."""
+        key = (self.config.endpoint, self.bucket)
+        if key in _VERIFIED_BUCKETS:
+            return
         try:
             if not self.client.bucket_exists(self.bucket):
                 self.client.make_bucket(self.bucket)
                 logger.info(f"Created bucket: {self.bucket}")
+            # The in-memory stub is per instance - only cache real buckets
+            if not isinstance(self.client, _InMemoryMinioClient):
+                _VERIFIED_BUCKETS.add(key)
         except Exception as e:
             logger.error(f"Bucket error: {e}")
 
     async def upload_file(
         self,
-        file_data: bytes,
+        file_data: Union[bytes, BinaryIO],
         filename: str,
         content_type: str,
         path_prefix: Optional[str] = None,
+        length: Optional[int] = None,
     ) -> str:
         """
         Upload file to MinIO.
 
+        Streams are passed through to minio-py, which reads them in parts;
+        unknown-length streams use multipart upload without buffering.
+
         Returns: URL to uploaded file
         """
+        await self._ensure_ready()
         try:
             # Generate unique filename
-            unique_id = uuid.uuid4().hex[:12]
+            unique_id = secrets.token_hex(6)
             unique_filename = f"{unique_id}_{filename}"
 
             # Build path
@@ -151,20 +222,27 @@ class MinIOStorage(IStorageService):
             else:
                 object_name = unique_filename
 
-            # Upload
-            self.client.put_object(
+            # Upload (BytesIO shares the bytes buffer, no copy)
+            if isinstance(file_data, (bytes, bytearray, memoryview)):
+                data = BytesIO(file_data)
+                length = memoryview(file_data).nbytes
+            else:
+                data = file_data
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket,
                 object_name=object_name,
-                data=BytesIO(file_data),
-                length=len(file_data),
+                data=data,
+                length=length if length is not None else -1,
                 content_type=content_type,
+                part_size=UPLOAD_PART_SIZE if length is None else 0,
             )
 
             # Return URL
-            protocol = "https" if self.config.secure else "http"
-            url = f"{protocol}://{self.config.endpoint}/{self.bucket}/{object_name}"
+            url = self._url_prefix + object_name
 
-            logger.info(f"Uploaded: {object_name} ({len(file_data)} bytes)")
+            size = f"{length} bytes" if length is not None else "streamed"
+            logger.info(f"Uploaded: {object_name} ({size})")
             return url
 
         except Exception as e:
@@ -173,20 +251,27 @@ class MinIOStorage(IStorageService):
 
     async def download(self, object_name: str) -> Optional[bytes]:
         """Download file from MinIO."""
+        await self._ensure_ready()
         try:
-            response = self.client.get_object(self.bucket, object_name)
-            data = response.read()
-            response.close()
-            response.release_conn()
-            return data
+            return await asyncio.to_thread(self._download_sync, object_name)
         except Exception as e:
             logger.error(f"Download failed: {e}")
             return None
 
+    def _download_sync(self, object_name: str) -> bytes:
+        """Read a whole object (runs in a worker thread)."""
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     async def delete_file(self, object_name: str) -> bool:
         """Delete file from MinIO."""
+        await self._ensure_ready()
         try:
-            self.client.remove_object(self.bucket, object_name)
+            await asyncio.to_thread(self.client.remove_object, self.bucket, object_name)
             logger.info(f"Deleted: {object_name}")
             return True
         except Exception as e:
@@ -195,16 +280,20 @@ class MinIOStorage(IStorageService):
 
     async def file_exists(self, object_name: str) -> bool:
         """Check if file exists."""
+        await self._ensure_ready()
         try:
-            self.client.stat_object(self.bucket, object_name)
+            await asyncio.to_thread(self.client.stat_object, self.bucket, object_name)
             return True
         except:
             return False
 
     async def get_file_size(self, object_name: str) -> Optional[int]:
         """Get file size in bytes."""
+        await self._ensure_ready()
         try:
-            stat = self.client.stat_object(self.bucket, object_name)
+            stat = await asyncio.to_thread(
+                self.client.stat_object, self.bucket, object_name
+            )
             return stat.size
         except Exception as e:
             logger.error(f"Get file size failed: {e}")
@@ -227,8 +316,10 @@ class MinIOStorage(IStorageService):
         """
         from datetime import timedelta
 
+        await self._ensure_ready()
         try:
-            url = self.client.presigned_get_object(
+            url = await asyncio.to_thread(
+                self.client.presigned_get_object,
                 bucket_name=self.bucket,
                 object_name=object_name,
                 expires=timedelta(seconds=expires_seconds),
@@ -277,6 +368,4 @@ if __name__ == "__main__":
         deleted = await storage.delete_file(object_name)
         print("File Deleted:", deleted)
 
-    import asyncio
-
     asyncio.run(test())
\ No newline at end of file
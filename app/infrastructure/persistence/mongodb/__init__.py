@@ -2,7 +2,20 @@
 
 from .client import get_mongodb_client, get_database
 from .models import DocumentInDB, ChatSessionInDB, ChatMessageInDB
-from .mappers import DocumentMapper, ChatSessionMapper, ChatMessageMapper
+from .mappers import (
+    DocumentMapper,
+    ChatSessionMapper,
+    ChatMessageMapper,
+    document_to_entity,
+    documents_to_entities,
+    document_to_model,
+    chat_session_to_entity,
+    chat_session_doc_to_entity,
+    chat_session_to_model,
+    chat_message_to_entity,
+    chat_message_doc_to_entity,
+    chat_message_to_model,
+)
 
 __all__ = [
     "get_mongodb_client",
@@ -13,4 +26,13 @@ __all__ = [
     "DocumentMapper",
     "ChatSessionMapper",
     "ChatMessageMapper",
+    "document_to_entity",
+    "documents_to_entities",
+    "document_to_model",
+    "chat_session_to_entity",
+    "chat_session_doc_to_entity",
+    "chat_session_to_model",
+    "chat_message_to_entity",
+    "chat_message_doc_to_entity",
+    "chat_message_to_model",
 ]
@@ -6,7 +6,8 @@ Handles connection pooling and database operations for document and user managem
 import logging
 from typing import Any, Dict, List, Optional
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient, IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.errors import ConnectionFailure, DuplicateKeyError
 
 from app.config import mongodb_config
@@ -14,9 +15,101 @@ from app.config import mongodb_config
 logger = logging.getLogger(__name__)
 
 
+# Every collection's indexes, in one place. Compound indexes put equality
+# fields first, then the sort, then ranges; an index that is a prefix of
+# another here is redundant and only slows writes.
+_INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel("username", unique=True),
+        IndexModel("email", unique=True),
+    ],
+    "documents": [
+        IndexModel("file_name"),
+        IndexModel("is_active"),
+        IndexModel("created_at"),
+        IndexModel([("title", "text")]),
+    ],
+    "vector_mappings": [
+        IndexModel("document_id"),
+        IndexModel("qdrant_point_id", unique=True),
+    ],
+    "chat_sessions": [
+        IndexModel("created_at"),
+        IndexModel("is_deleted"),
+        IndexModel([("title", "text")]),
+        # Per-user listings/counts: equality on the flags, then the
+        # (updated_at, _id) order with no SORT stage
+        IndexModel(
+            [
+                ("user_id", 1),
+                ("is_deleted", 1),
+                ("is_archived", 1),
+                ("updated_at", -1),
+                ("_id", -1),
+            ]
+        ),
+        # Admin listings across all users
+        IndexModel([("updated_at", -1), ("_id", -1)]),
+    ],
+    "chat_messages": [
+        IndexModel("created_at"),
+        IndexModel("is_deleted"),
+        # Session history (skipping deleted), oldest first / recent last
+        IndexModel(
+            [("session_id", 1), ("is_deleted", 1), ("created_at", 1), ("_id", 1)]
+        ),
+    ],
+    "bookmarks": [
+        # Equality on user/archived, then the pinned-first recency order:
+        # get_by_user and search read in index order with no SORT stage
+        IndexModel(
+            [
+                ("user_id", 1),
+                ("is_archived", 1),
+                ("is_pinned", -1),
+                ("created_at", -1),
+            ]
+        ),
+        # get_pinned: equality on all three flags, newest first
+        IndexModel(
+            [
+                ("user_id", 1),
+                ("is_pinned", 1),
+                ("is_archived", 1),
+                ("created_at", -1),
+            ]
+        ),
+        # Folder / tag (multikey) distinct values per user
+        IndexModel([("user_id", 1), ("folder", 1)]),
+        IndexModel([("user_id", 1), ("tags", 1)]),
+        # Weighted full-text index backing search(): a title hit outranks a
+        # hit buried in the (long) response body. Content is mostly
+        # Vietnamese: no English stemming/stop-words.
+        IndexModel(
+            [(field, "text") for field in ("query", "response", "title", "notes")],
+            weights={"title": 10, "query": 5, "notes": 2, "response": 1},
+            name="bm_text",
+            default_language="none",
+        ),
+    ],
+    "crawl_jobs": [
+        # Job listings: status equality, newest first; unfiltered listing
+        IndexModel([("status", 1), ("created_at", -1)]),
+        IndexModel([("created_at", -1)]),
+    ],
+    "data_sources": [
+        # get_active_sources: is_active equality, priority order, then the
+        # status != disabled range
+        IndexModel([("is_active", 1), ("priority", 1), ("status", 1)]),
+        IndexModel([("priority", 1)]),
+        IndexModel([("base_url", 1)]),
+    ],
+}
+
+
 class MongoDBClient:
     """
-    Async MongoDB client using Motor.
+    Async MongoDB client using PyMongo's native asyncio driver.
     Manages connection to MongoDB for document metadata and user management.
 
     All configuration is loaded from app.config.mongodb_config.
@@ -32,8 +125,8 @@ class MongoDBClient:
         self._config = mongodb_config
         self.database_name = self._config.database
 
-        self.client: Optional[AsyncIOMotorClient] = None
-        self.db: Optional[AsyncIOMotorDatabase] = None
+        self.client: Optional[AsyncMongoClient] = None
+        self.db: Optional[AsyncDatabase] = None
 
         logger.info(f"Initialized MongoDBClient (db={self.database_name})")
 
@@ -42,8 +135,8 @@ class MongoDBClient:
         try:
             connection_url = self._config.get_connection_url()
 
-            # Create Motor client
-            self.client = AsyncIOMotorClient(
+            # Create async client
+            self.client = AsyncMongoClient(
                 connection_url,
                 serverSelectionTimeoutMS=5000,
             )
@@ -66,45 +159,24 @@ class MongoDBClient:
     async def disconnect(self) -> None:
         """Close MongoDB connection."""
         if self.client:
-            self.client.close()
+            await self.client.close()
             logger.info("✓ MongoDB connection closed")
 
     async def _create_indexes(self) -> None:
-        """Create necessary indexes for collections."""
-        try:
-            # Users collection indexes
-            await self.db.users.create_index("username", unique=True)
-            await self.db.users.create_index("email", unique=True)
-
-            # Documents collection indexes
-            await self.db.documents.create_index("file_name")
-            await self.db.documents.create_index("is_active")
-            await self.db.documents.create_index("created_at")
-            await self.db.documents.create_index([("title", "text")])
-
-            # Vector mappings collection indexes
-            await self.db.vector_mappings.create_index("document_id")
-            await self.db.vector_mappings.create_index("qdrant_point_id", unique=True)
-
-            # Chat sessions collection indexes
-            await self.db.chat_sessions.create_index("user_id")
-            await self.db.chat_sessions.create_index("created_at")
-            await self.db.chat_sessions.create_index("updated_at")
-            await self.db.chat_sessions.create_index("is_deleted")
-            await self.db.chat_sessions.create_index([("title", "text")])
-
-            # Chat messages collection indexes
-            await self.db.chat_messages.create_index("session_id")
-            await self.db.chat_messages.create_index("created_at")
-            await self.db.chat_messages.create_index("is_deleted")
-            await self.db.chat_messages.create_index(
-                [("session_id", 1), ("created_at", 1)]
-            )
+        """
+        Create necessary indexes for collections.
 
-            logger.info("✓ MongoDB indexes created")
+        Best-effort per index: a conflicting existing index or a user
+        without createIndex is logged and skipped, never aborts startup.
+        """
+        for collection, indexes in _INDEXES.items():
+            for index in indexes:
+                try:
+                    await self.db[collection].create_indexes([index])
+                except Exception as e:
+                    logger.warning(f"Index creation warning ({collection}): {e}")
 
-        except Exception as e:
-            logger.warning(f"Index creation warning: {e}")
+        logger.info("✓ MongoDB indexes ensured")
 
     # User Management
 
@@ -665,12 +737,12 @@ async def get_mongodb_client() -> MongoDBClient:
     return _mongodb_client
 
 
-async def get_database() -> AsyncIOMotorDatabase:
+async def get_database() -> AsyncDatabase:
     """
     Get MongoDB database instance.
 
     Returns:
-        AsyncIOMotorDatabase instance
+        AsyncDatabase instance
     """
     client = await get_mongodb_client()
     return client.db
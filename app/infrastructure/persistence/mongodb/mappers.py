@@ -2,142 +2,202 @@
 
 These mappers handle conversion between domain entities (pure Python)
 and MongoDB models (Pydantic with database-specific fields).
+
+Mappers are plain module functions (called per document on list paths);
+the *Mapper classes remain as namespaces over them.
 """
 
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
 from app.domain.entities.document import Document
 from app.domain.entities.chat_session import ChatSession
 from app.domain.entities.chat_message import ChatMessage
+from app.domain.enums.chat_message_role import ChatMessageRole
 from app.infrastructure.persistence.mongodb.models import (
     DocumentInDB,
     ChatSessionInDB,
     ChatMessageInDB,
+    ChatMessageRole as DBRole,
 )
 
 
+def document_to_entity(model: DocumentInDB) -> Document:
+    """Convert MongoDB model to domain entity."""
+    return Document(
+        id=model.id,
+        title=model.title,
+        file_name=model.file_name,
+        source=model.metadata.get("source"),
+        content=model.content,
+        collection=model.collection,
+        metadata=model.metadata,
+        tags=model.tags,
+        chunk_count=model.chunk_count,
+        vector_ids=[],  # Not stored in MongoDB, managed separately
+        file_path=None,
+        file_size=None,
+        mime_type=None,
+        is_active=model.is_active,
+        created_by=model.created_by,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def documents_to_entities(models: Iterable[DocumentInDB]) -> List[Document]:
+    """Convert a batch of MongoDB models to domain entities."""
+    return [document_to_entity(model) for model in models]
+
+
+def document_to_model(entity: Document) -> DocumentInDB:
+    """Convert domain entity to MongoDB model."""
+    # Copy only when injecting the source; Pydantic copies on validation
+    metadata = entity.metadata or {}
+    if entity.source and "source" not in metadata:
+        metadata = {**metadata, "source": entity.source}
+
+    return DocumentInDB(
+        id=entity.id or "",
+        title=entity.title,
+        file_name=entity.file_name or entity.title,
+        content=entity.content,
+        collection=entity.collection,
+        metadata=metadata,
+        tags=entity.tags,
+        chunk_count=entity.chunk_count,
+        is_active=entity.is_active,
+        created_at=entity.created_at,
+        updated_at=entity.updated_at,
+        created_by=entity.created_by,
+    )
+
+
+def chat_session_to_entity(model: ChatSessionInDB) -> ChatSession:
+    """Convert MongoDB model to domain entity."""
+    return ChatSession(
+        id=model.id,
+        user_id=model.user_id,
+        title=model.title,
+        summary=model.summary,
+        metadata=model.metadata,
+        tags=model.tags,
+        is_archived=model.is_archived,
+        is_deleted=model.is_deleted,
+        message_count=model.message_count,
+        last_message_at=model.last_message_at,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def chat_session_doc_to_entity(doc: Dict[str, Any]) -> ChatSession:
+    """
+    Convert a stored session document straight to a domain entity.
+
+    Read paths skip the ChatSessionInDB round trip: stored documents were
+    written through the model, so re-validating them per row is wasted work.
+    Missing fields fall back to the model defaults.
+    """
+    now = datetime.now()
+    return ChatSession(
+        id=str(doc["_id"]),
+        user_id=doc["user_id"],
+        title=doc.get("title", "New Conversation"),
+        summary=doc.get("summary"),
+        metadata=doc.get("metadata") or {},
+        tags=doc.get("tags") or [],
+        is_archived=doc.get("is_archived", False),
+        is_deleted=doc.get("is_deleted", False),
+        message_count=doc.get("message_count", 0),
+        last_message_at=doc.get("last_message_at"),
+        created_at=doc.get("created_at") or now,
+        updated_at=doc.get("updated_at") or now,
+    )
+
+
+def chat_session_to_model(entity: ChatSession) -> ChatSessionInDB:
+    """Convert domain entity to MongoDB model."""
+    return ChatSessionInDB(
+        id=entity.id or "",
+        user_id=entity.user_id,
+        title=entity.title,
+        summary=entity.summary,
+        metadata=entity.metadata,
+        tags=entity.tags,
+        is_archived=entity.is_archived,
+        is_deleted=entity.is_deleted,
+        message_count=entity.message_count,
+        last_message_at=entity.last_message_at,
+        created_at=entity.created_at,
+        updated_at=entity.updated_at,
+    )
+
+
+def chat_message_to_entity(model: ChatMessageInDB) -> ChatMessage:
+    """Convert MongoDB model to domain entity."""
+    return ChatMessage(
+        id=model.id,
+        session_id=model.session_id,
+        role=ChatMessageRole(model.role.value),
+        content=model.content,
+        attachments=model.attachments,
+        metadata=model.metadata,
+        is_deleted=model.is_deleted,
+        created_at=model.created_at,
+        edited_at=model.edited_at,
+    )
+
+
+def chat_message_doc_to_entity(doc: Dict[str, Any]) -> ChatMessage:
+    """Convert a stored message document straight to a domain entity."""
+    return ChatMessage(
+        id=str(doc["_id"]),
+        session_id=doc["session_id"],
+        role=ChatMessageRole(doc["role"]),
+        content=doc["content"],
+        attachments=doc.get("attachments") or [],
+        metadata=doc.get("metadata") or {},
+        is_deleted=doc.get("is_deleted", False),
+        created_at=doc.get("created_at") or datetime.now(),
+        edited_at=doc.get("edited_at"),
+    )
+
+
+def chat_message_to_model(entity: ChatMessage) -> ChatMessageInDB:
+    """Convert domain entity to MongoDB model."""
+    return ChatMessageInDB(
+        id=entity.id or "",
+        session_id=entity.session_id,
+        role=DBRole(entity.role.value),
+        content=entity.content,
+        attachments=entity.attachments,
+        metadata=entity.metadata,
+        is_deleted=entity.is_deleted,
+        created_at=entity.created_at,
+        edited_at=entity.edited_at,
+    )
+
+
 class DocumentMapper:
-    """Mapper for Document entity ↔ MongoDB model."""
-
-    @staticmethod
-    def to_entity(model: DocumentInDB) -> Document:
-        """Convert MongoDB model to domain entity."""
-        return Document(
-            id=model.id,
-            title=model.title,
-            file_name=model.file_name,
-            source=model.metadata.get("source"),
-            content=model.content,
-            collection=model.collection,
-            metadata=model.metadata,
-            tags=model.tags,
-            chunk_count=model.chunk_count,
-            vector_ids=[],  # Not stored in MongoDB, managed separately
-            file_path=None,
-            file_size=None,
-            mime_type=None,
-            is_active=model.is_active,
-            created_by=model.created_by,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
-
-    @staticmethod
-    def to_model(entity: Document) -> DocumentInDB:
-        """Convert domain entity to MongoDB model."""
-        metadata = dict(entity.metadata or {})
-        if entity.source:
-            metadata.setdefault("source", entity.source)
-
-        return DocumentInDB(
-            id=entity.id or "",
-            title=entity.title,
-            file_name=entity.file_name or entity.title,
-            content=entity.content,
-            collection=entity.collection,
-            metadata=metadata,
-            tags=entity.tags,
-            chunk_count=entity.chunk_count,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-            created_by=entity.created_by,
-        )
+    """Mapper for Document entity ↔ MongoDB model (kept for backwards compatibility)."""
+
+    to_entity = staticmethod(document_to_entity)
+    to_model = staticmethod(document_to_model)
+    map_many = staticmethod(documents_to_entities)
 
 
 class ChatSessionMapper:
-    """Mapper for ChatSession entity ↔ MongoDB model."""
-
-    @staticmethod
-    def to_entity(model: ChatSessionInDB) -> ChatSession:
-        """Convert MongoDB model to domain entity."""
-        return ChatSession(
-            id=model.id,
-            user_id=model.user_id,
-            title=model.title,
-            summary=model.summary,
-            metadata=model.metadata,
-            tags=model.tags,
-            is_archived=model.is_archived,
-            is_deleted=model.is_deleted,
-            message_count=model.message_count,
-            last_message_at=model.last_message_at,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
-
-    @staticmethod
-    def to_model(entity: ChatSession) -> ChatSessionInDB:
-        """Convert domain entity to MongoDB model."""
-        return ChatSessionInDB(
-            id=entity.id or "",
-            user_id=entity.user_id,
-            title=entity.title,
-            summary=entity.summary,
-            metadata=entity.metadata,
-            tags=entity.tags,
-            is_archived=entity.is_archived,
-            is_deleted=entity.is_deleted,
-            message_count=entity.message_count,
-            last_message_at=entity.last_message_at,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+    """Mapper for ChatSession entity ↔ MongoDB model (kept for backwards compatibility)."""
+
+    to_entity = staticmethod(chat_session_to_entity)
+    to_entity_from_doc = staticmethod(chat_session_doc_to_entity)
+    to_model = staticmethod(chat_session_to_model)
 
 
 class ChatMessageMapper:
-    """Mapper for ChatMessage entity ↔ MongoDB model."""
-
-    @staticmethod
-    def to_entity(model: ChatMessageInDB) -> ChatMessage:
-        """Convert MongoDB model to domain entity."""
-        from app.domain.enums.chat_message_role import ChatMessageRole
-
-        return ChatMessage(
-            id=model.id,
-            session_id=model.session_id,
-            role=ChatMessageRole(model.role.value),
-            content=model.content,
-            attachments=model.attachments,
-            metadata=model.metadata,
-            is_deleted=model.is_deleted,
-            created_at=model.created_at,
-            edited_at=model.edited_at,
-        )
-
-    @staticmethod
-    def to_model(entity: ChatMessage) -> ChatMessageInDB:
-        """Convert domain entity to MongoDB model."""
-        from app.infrastructure.persistence.mongodb.models import (
-            ChatMessageRole as DBRole,
-        )
-
-        return ChatMessageInDB(
-            id=entity.id or "",
-            session_id=entity.session_id,
-            role=DBRole(entity.role.value),
-            content=entity.content,
-            attachments=entity.attachments,
-            metadata=entity.metadata,
-            is_deleted=entity.is_deleted,
-            created_at=entity.created_at,
-            edited_at=entity.edited_at,
-        )
+    """Mapper for ChatMessage entity ↔ MongoDB model (kept for backwards compatibility)."""
+
+    to_entity = staticmethod(chat_message_to_entity)
+    to_entity_from_doc = staticmethod(chat_message_doc_to_entity)
+    to_model = staticmethod(chat_message_to_model)
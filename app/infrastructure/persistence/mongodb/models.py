@@ -4,13 +4,14 @@ Clean data models following domain-driven design.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from enum import StrEnum
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from typing_extensions import NotRequired, TypedDict
 
 
-class UserRole(str, Enum):
+class UserRole(StrEnum):
     """User roles for access control."""
 
     ADMIN = "admin"
@@ -221,7 +222,7 @@ class UserListResponse(BaseModel):
 # ============================================================================
 
 
-class ChatMessageRole(str, Enum):
+class ChatMessageRole(StrEnum):
     """Message role in conversation."""
 
     SYSTEM = "system"
@@ -240,6 +241,8 @@ class ChatMessageBase(BaseModel):
 class ChatMessageCreate(ChatMessageBase):
     """Model for creating a new message."""
 
+    # Literal validates by set lookup - no Enum construction per message
+    role: Literal["system", "user", "assistant"]
     session_id: str
     attachments: List[Dict[str, Any]] = Field(default_factory=list)
 
@@ -264,14 +267,21 @@ class ChatMessageUpdate(BaseModel):
     content: str
 
 
+# Read-only response models: immutable, so empty sequences default to a
+# shared () instead of a fresh list per instance
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
+
 class ChatMessageResponse(BaseModel):
     """Chat message for API responses."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     session_id: str
     role: ChatMessageRole
     content: str
-    attachments: List[Dict[str, Any]] = Field(default_factory=list)
+    attachments: Tuple[Dict[str, Any], ...] = ()
     metadata: Dict[str, Any] = Field(default_factory=dict)
     created_at: datetime
     edited_at: Optional[datetime] = None
@@ -323,6 +333,8 @@ class ChatSessionInDB(ChatSessionBase):
 class ChatSessionResponse(BaseModel):
     """Chat session for API responses."""
 
+    model_config = _RESPONSE_CONFIG
+
     id: str
     title: str
     summary: Optional[str] = None
@@ -331,14 +343,14 @@ class ChatSessionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     is_archived: bool = False
 
 
 class ChatSessionWithMessages(ChatSessionResponse):
     """Chat session with messages included."""
 
-    messages: List[ChatMessageResponse] = Field(default_factory=list)
+    messages: Tuple[ChatMessageResponse, ...] = ()
 
 
 class ChatSessionListResponse(BaseModel):
@@ -371,7 +383,7 @@ class SummarizeResponse(BaseModel):
 # ============================================================================
 
 
-class FileType(str, Enum):
+class FileType(StrEnum):
     """Type of file."""
 
     UPLOADED = "uploaded"
@@ -429,6 +441,14 @@ class FileMetadata(BaseModel):
 class FileAttachmentDB(BaseModel):
     """File attachment in chat message (embedded in message)."""
 
+    # Read-only snapshot of stored data: immutable, never re-validated
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        populate_by_name=True,
+        revalidate_instances="never",
+    )
+
     file_id: str
     type: str  # image, document, audio, video
     url: str
@@ -454,7 +474,7 @@ class FileAttachmentDB(BaseModel):
 # ============================================
 
 
-class LogLevel(str, Enum):
+class LogLevel(StrEnum):
     """Log severity levels."""
 
     DEBUG = "debug"
@@ -464,7 +484,7 @@ class LogLevel(str, Enum):
     CRITICAL = "critical"
 
 
-class LogAction(str, Enum):
+class LogAction(StrEnum):
     """Types of logged actions."""
 
     # Authentication
@@ -501,7 +521,7 @@ class LogAction(str, Enum):
 class LogCreate(BaseModel):
     """Model for creating a new log entry."""
 
-    level: LogLevel
+    level: Literal["debug", "info", "warning", "error", "critical"]
     action: LogAction
     message: str
     user_id: Optional[str] = None
@@ -512,19 +532,19 @@ class LogCreate(BaseModel):
     user_agent: Optional[str] = None
 
 
-class LogResponse(BaseModel):
-    """Log entry for API responses."""
+class LogResponse(TypedDict):
+    """Log entry for API responses (plain dict, built from trusted rows)."""
 
     id: str
     level: LogLevel
     action: LogAction
     message: str
-    user_id: Optional[str] = None
-    username: Optional[str] = None
-    session_id: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    ip_address: Optional[str] = None
-    user_agent: Optional[str] = None
+    user_id: NotRequired[Optional[str]]
+    username: NotRequired[Optional[str]]
+    session_id: NotRequired[Optional[str]]
+    metadata: NotRequired[Dict[str, Any]]
+    ip_address: NotRequired[Optional[str]]
+    user_agent: NotRequired[Optional[str]]
     created_at: datetime
 
 
@@ -552,7 +572,7 @@ class LogStatsResponse(BaseModel):
 # ============================================================================
 
 
-class CrawlJobStatus(str, Enum):
+class CrawlJobStatus(StrEnum):
     """Status of a crawl job."""
 
     PENDING = "pending"
@@ -563,7 +583,7 @@ class CrawlJobStatus(str, Enum):
     SCHEDULED = "scheduled"
 
 
-class CrawlJobType(str, Enum):
+class CrawlJobType(StrEnum):
     """Type of crawl job."""
 
     SCRAPE = "scrape"  # Single page scrape
@@ -668,22 +688,22 @@ class CrawlHistoryInDB(CrawlHistoryBase):
         populate_by_name = True
 
 
-class CrawlHistoryResponse(BaseModel):
-    """Crawl history model for API responses."""
+class CrawlHistoryResponse(TypedDict):
+    """Crawl history for API responses (plain dict, built from trusted rows)."""
 
     id: str
-    job_id: Optional[str] = None
+    job_id: NotRequired[Optional[str]]
     url: str
     status: str
     content_length: int
-    error: Optional[str] = None
+    error: NotRequired[Optional[str]]
     metadata: Dict[str, Any]
     crawled_by: str
     crawled_at: datetime
     duration_seconds: float
-    saved_path: Optional[str] = None
+    saved_path: NotRequired[Optional[str]]
     ingested: bool
-    doc_id: Optional[str] = None
+    doc_id: NotRequired[Optional[str]]
     chunk_count: int
 
 
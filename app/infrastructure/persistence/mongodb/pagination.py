@@ -0,0 +1,42 @@
+"""Shared MongoDB paging helpers."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo.asynchronous.collection import AsyncCollection
+
+
+async def find_page_with_total(
+    collection: AsyncCollection,
+    query: Dict[str, Any],
+    sort: Dict[str, int],
+    skip: int,
+    limit: int,
+    projection: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Fetch one page of documents plus the total match count.
+
+    A single $match + $facet aggregation: one round trip and one query plan
+    instead of a find() followed by count_documents() over the same filter.
+
+    Returns:
+        (raw documents of the page, total matching documents)
+    """
+    items: List[Dict[str, Any]] = [
+        {"$sort": sort},
+        {"$skip": skip},
+        {"$limit": limit},
+    ]
+    if projection:
+        items.append({"$project": projection})
+
+    pipeline = [
+        {"$match": query},
+        {"$facet": {"items": items, "total": [{"$count": "n"}]}},
+    ]
+    result = await (await collection.aggregate(pipeline)).to_list(length=1)
+    if not result:
+        return [], 0
+    facet = result[0]
+    total = facet["total"][0]["n"] if facet["total"] else 0
+    return facet["items"], total
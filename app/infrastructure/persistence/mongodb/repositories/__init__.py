@@ -1,23 +1,39 @@
-"""MongoDB repository implementations."""
+"""MongoDB repository implementations.
+
+Repositories are imported lazily on first attribute access, so a process
+only loads the repository modules (and their models) it actually uses.
+"""
+
+import importlib
+
+# Exported name -> defining submodule
+_LAZY = {
+    "MongoDBDocumentRepository": "mongodb_document_repository",
+    "MongoDBChatRepository": "mongodb_chat_repository",
+    "MongoDBFileRepository": "mongodb_file_repository",
+    "MongoDBCrawlerRepository": "mongodb_crawler_repository",
+    "MongoDBDataSourceRepository": "mongodb_data_source_repository",
+    "MongoDBPendingUpdateRepository": "mongodb_pending_update_repository",
+    "MongoDBStudentProfileRepository": "mongodb_student_profile_repository",
+    "MongoDBFeedbackRepository": "mongodb_feedback_repository",
+    "MongoDBUsageMetricRepository": "mongodb_usage_repository",
+    "MongoDBLLMUsageRepository": "mongodb_usage_repository",
+    "MongoDBDailyStatsRepository": "mongodb_usage_repository",
+    "MongoDBSearchLogRepository": "mongodb_search_log_repository",
+    "MongoDBKnowledgeGapRepository": "mongodb_search_log_repository",
+    "MongoDBBookmarkRepository": "mongodb_bookmark_repository",
+}
+
+
+def __getattr__(name):
+    """Lazy import of repository classes."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
 
-from .mongodb_document_repository import MongoDBDocumentRepository
-from .mongodb_chat_repository import MongoDBChatRepository
-from .mongodb_file_repository import MongoDBFileRepository
-from .mongodb_crawler_repository import MongoDBCrawlerRepository
-from .mongodb_data_source_repository import MongoDBDataSourceRepository
-from .mongodb_pending_update_repository import MongoDBPendingUpdateRepository
-from .mongodb_student_profile_repository import MongoDBStudentProfileRepository
-from .mongodb_feedback_repository import MongoDBFeedbackRepository
-from .mongodb_usage_repository import (
-    MongoDBUsageMetricRepository,
-    MongoDBLLMUsageRepository,
-    MongoDBDailyStatsRepository,
-)
-from .mongodb_search_log_repository import (
-    MongoDBSearchLogRepository,
-    MongoDBKnowledgeGapRepository,
-)
-from .mongodb_bookmark_repository import MongoDBBookmarkRepository
 
 __all__ = [
     # Core
@@ -1,14 +1,71 @@
 """MongoDB implementation of bookmark repository."""
 
-from typing import Optional, List
+import asyncio
+import operator
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Tuple
 from datetime import datetime, timezone
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo import ReplaceOne
 
 from app.application.interfaces.repositories.bookmark_repository import (
     IBookmarkRepository,
 )
 from app.domain.entities.bookmark import Bookmark
+from app.infrastructure.persistence.mongodb.pagination import find_page_with_total
+
+_UTC = timezone.utc
+# Fallback for stored documents missing a timestamp - "now" would be wrong
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+
+
+# List reads skip the per-answer source/artifact payloads - list views
+# render query/response/tags only; get_by_id returns the full document
+_LIST_PROJECTION = {"sources": 0, "artifacts": 0}
+
+# Stored fields in document order; attrgetter fetches them in one C call
+_BM_FIELDS = (
+    "user_id",
+    "session_id",
+    "message_id",
+    "query",
+    "response",
+    "title",
+    "tags",
+    "notes",
+    "folder",
+    "sources",
+    "artifacts",
+    "is_pinned",
+    "is_archived",
+    "created_at",
+    "updated_at",
+)
+_BM_KEYS = ("_id",) + _BM_FIELDS
+_bm_get = operator.attrgetter(*_BM_FIELDS)
+
+# Per-user distinct tags/folders: only the $match stage varies per call
+_TAGS_PIPELINE_TAIL = (
+    {"$unwind": "$tags"},
+    {"$group": {"_id": "$tags"}},
+    {"$sort": {"_id": 1}},
+)
+_FOLDERS_PIPELINE_TAIL = (
+    {"$group": {"_id": "$folder"}},
+    {"$sort": {"_id": 1}},
+)
+# Tags/folders change rarely; writes through this repository invalidate
+FACETS_CACHE_TTL = 60.0
+FACETS_CACHE_SIZE = 1024
+
+# Identical concurrent list reads share one query; its result is reused
+# for this long after completion (writes for the user drop it at once)
+COALESCE_WINDOW = 0.1
+
+# Upper bound on get_pinned, which has no caller-supplied limit
+MAX_PINNED = 500
 
 
 class MongoDBBookmarkRepository(IBookmarkRepository):
@@ -16,14 +73,19 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
 
     COLLECTION = "bookmarks"
 
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(self, database: AsyncDatabase):
         self._db = database
         self._collection = database[self.COLLECTION]
+        # (kind, user_id) -> (expires_at, values)
+        self._facets_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+        # (kind, user_id, *args) -> shared in-flight/just-finished query
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
 
     async def create(self, bookmark: Bookmark) -> Bookmark:
         """Create a new bookmark."""
         doc = self._to_document(bookmark)
         await self._collection.insert_one(doc)
+        self._invalidate_user(bookmark.user_id)
         return bookmark
 
     async def get_by_id(self, bookmark_id: str) -> Optional[Bookmark]:
@@ -39,12 +101,22 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
         include_archived: bool = False,
     ) -> List[Bookmark]:
         """Get bookmarks for a user, sorted by pinned first, then created_at desc."""
+        bookmarks = await self._coalesce(
+            ("by_user", user_id, skip, limit, include_archived),
+            lambda: self._query_by_user(user_id, skip, limit, include_archived),
+        )
+        return list(bookmarks)
+
+    async def _query_by_user(
+        self, user_id: str, skip: int, limit: int, include_archived: bool
+    ) -> List[Bookmark]:
+        """Run the get_by_user query."""
         query = {"user_id": user_id}
         if not include_archived:
             query["is_archived"] = False
 
         cursor = (
-            self._collection.find(query)
+            self._collection.find(query, _LIST_PROJECTION)
             .sort(
                 [
                     ("is_pinned", -1),
@@ -53,12 +125,62 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
             )
             .skip(skip)
             .limit(limit)
+            .batch_size(limit)
         )
 
-        bookmarks = []
+        docs = await cursor.to_list(length=limit)
+        return [self._from_document(doc) for doc in docs]
+
+    async def list_with_total(
+        self,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        include_archived: bool = False,
+    ) -> Tuple[List[Bookmark], int]:
+        """Get a page of bookmarks and the total count in one $facet round trip."""
+        bookmarks, total = await self._coalesce(
+            ("with_total", user_id, skip, limit, include_archived),
+            lambda: self._query_with_total(user_id, skip, limit, include_archived),
+        )
+        return list(bookmarks), total
+
+    async def _query_with_total(
+        self, user_id: str, skip: int, limit: int, include_archived: bool
+    ) -> Tuple[List[Bookmark], int]:
+        """Run the list_with_total $facet aggregation."""
+        query = {"user_id": user_id}
+        if not include_archived:
+            query["is_archived"] = False
+
+        docs, total = await find_page_with_total(
+            self._collection,
+            query,
+            {"is_pinned": -1, "created_at": -1},
+            skip,
+            limit,
+            projection=_LIST_PROJECTION,
+        )
+        return [self._from_document(doc) for doc in docs], total
+
+    async def iter_by_user(
+        self,
+        user_id: str,
+        include_archived: bool = False,
+        page_size: int = 100,
+    ) -> AsyncIterator[Bookmark]:
+        """Stream a user's bookmarks from one cursor, one batch in memory."""
+        query = {"user_id": user_id}
+        if not include_archived:
+            query["is_archived"] = False
+
+        cursor = (
+            self._collection.find(query, _LIST_PROJECTION)
+            .sort([("is_pinned", -1), ("created_at", -1)])
+            .batch_size(page_size)
+        )
         async for doc in cursor:
-            bookmarks.append(self._from_document(doc))
-        return bookmarks
+            yield self._from_document(doc)
 
     async def search(
         self,
@@ -74,52 +196,83 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
             "user_id": user_id,
             "is_archived": False,
         }
+        projection = _LIST_PROJECTION
+        sort = [
+            ("is_pinned", -1),
+            ("created_at", -1),
+        ]
 
-        # Text search on query and response
+        # Text search on query, response, title and notes
         if query:
-            filter_query["$or"] = [
-                {"query": {"$regex": query, "$options": "i"}},
-                {"response": {"$regex": query, "$options": "i"}},
-                {"title": {"$regex": query, "$options": "i"}},
-                {"notes": {"$regex": query, "$options": "i"}},
-            ]
-
-        # Filter by tags
+            if query.endswith("*"):
+                # $text matches whole stemmed words only - prefix searches
+                # fall back to a (literal) case-insensitive regex scan
+                pattern = re.escape(query.rstrip("*"))
+                filter_query["$or"] = [
+                    {field: {"$regex": pattern, "$options": "i"}}
+                    for field in ("query", "response", "title", "notes")
+                ]
+            else:
+                filter_query["$text"] = {"$search": query}
+                projection = {**_LIST_PROJECTION, "score": {"$meta": "textScore"}}
+                sort.insert(0, ("score", {"$meta": "textScore"}))
+
+        # Filter by tags (stored lowercased - callers pass normalized tags)
         if tags:
-            filter_query["tags"] = {"$all": [t.lower() for t in tags]}
+            filter_query["tags"] = {"$all": tags}
 
         # Filter by folder
         if folder:
             filter_query["folder"] = folder
 
         cursor = (
-            self._collection.find(filter_query)
-            .sort(
-                [
-                    ("is_pinned", -1),
-                    ("created_at", -1),
-                ]
-            )
+            self._collection.find(filter_query, projection)
+            .sort(sort)
             .skip(skip)
             .limit(limit)
+            .batch_size(limit)
         )
 
-        bookmarks = []
-        async for doc in cursor:
-            bookmarks.append(self._from_document(doc))
-        return bookmarks
+        docs = await cursor.to_list(length=limit)
+        return [self._from_document(doc) for doc in docs]
 
     async def update(self, bookmark: Bookmark) -> Bookmark:
-        """Update an existing bookmark."""
-        bookmark.updated_at = datetime.now(timezone.utc)
+        """Update an existing bookmark (updated_at is stamped by the caller)."""
         doc = self._to_document(bookmark)
         await self._collection.replace_one({"_id": bookmark.id}, doc)
+        self._invalidate_user(bookmark.user_id)
         return bookmark
 
+    async def bulk_create(self, bookmarks: List[Bookmark]) -> List[Bookmark]:
+        """Create many bookmarks in a single unordered insert_many."""
+        if bookmarks:
+            try:
+                await self._collection.insert_many(
+                    [self._to_document(b) for b in bookmarks], ordered=False
+                )
+            finally:
+                self._invalidate_user(*{b.user_id for b in bookmarks})
+        return bookmarks
+
+    async def bulk_update(self, bookmarks: List[Bookmark]) -> List[Bookmark]:
+        """Replace many bookmarks in a single unordered bulk_write."""
+        if bookmarks:
+            ops = [ReplaceOne({"_id": b.id}, self._to_document(b)) for b in bookmarks]
+            try:
+                await self._collection.bulk_write(ops, ordered=False)
+            finally:
+                self._invalidate_user(*{b.user_id for b in bookmarks})
+        return bookmarks
+
     async def delete(self, bookmark_id: str) -> bool:
         """Delete a bookmark."""
-        result = await self._collection.delete_one({"_id": bookmark_id})
-        return result.deleted_count > 0
+        deleted = await self._collection.find_one_and_delete(
+            {"_id": bookmark_id}, projection={"user_id": 1}
+        )
+        if deleted is None:
+            return False
+        self._invalidate_user(deleted.get("user_id", ""))
+        return True
 
     async def count_by_user(self, user_id: str, include_archived: bool = False) -> int:
         """Count bookmarks for a user."""
@@ -130,28 +283,18 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
 
     async def get_tags_by_user(self, user_id: str) -> List[str]:
         """Get all unique tags used by a user."""
-        pipeline = [
-            {"$match": {"user_id": user_id}},
-            {"$unwind": "$tags"},
-            {"$group": {"_id": "$tags"}},
-            {"$sort": {"_id": 1}},
-        ]
-        tags = []
-        async for doc in self._collection.aggregate(pipeline):
-            tags.append(doc["_id"])
-        return tags
+        return await self._cached_facet(
+            "tags", user_id, {"user_id": user_id}, _TAGS_PIPELINE_TAIL
+        )
 
     async def get_folders_by_user(self, user_id: str) -> List[str]:
         """Get all unique folders used by a user."""
-        pipeline = [
-            {"$match": {"user_id": user_id, "folder": {"$ne": None}}},
-            {"$group": {"_id": "$folder"}},
-            {"$sort": {"_id": 1}},
-        ]
-        folders = []
-        async for doc in self._collection.aggregate(pipeline):
-            folders.append(doc["_id"])
-        return folders
+        return await self._cached_facet(
+            "folders",
+            user_id,
+            {"user_id": user_id, "folder": {"$ne": None}},
+            _FOLDERS_PIPELINE_TAIL,
+        )
 
     async def get_pinned(self, user_id: str) -> List[Bookmark]:
         """Get pinned bookmarks for a user."""
@@ -160,40 +303,86 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
                 "user_id": user_id,
                 "is_pinned": True,
                 "is_archived": False,
-            }
-        ).sort("created_at", -1)
+            },
+            _LIST_PROJECTION,
+        ).sort("created_at", -1).limit(MAX_PINNED).batch_size(MAX_PINNED)
 
-        bookmarks = []
-        async for doc in cursor:
-            bookmarks.append(self._from_document(doc))
-        return bookmarks
+        docs = await cursor.to_list(length=MAX_PINNED)
+        return [self._from_document(doc) for doc in docs]
 
     # ========== Internal Methods ==========
 
+    async def _cached_facet(
+        self, kind: str, user_id: str, match: dict, tail: tuple
+    ) -> List[str]:
+        """Distinct values for a user, served from a short TTL cache."""
+        key = (kind, user_id)
+        cached = self._facets_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
+
+        cursor = await self._collection.aggregate([{"$match": match}, *tail])
+        values = [doc["_id"] for doc in await cursor.to_list(length=None)]
+        if len(self._facets_cache) >= FACETS_CACHE_SIZE:
+            # Dicts keep insertion order - evict the oldest entry
+            del self._facets_cache[next(iter(self._facets_cache))]
+        self._facets_cache[key] = (time.monotonic() + FACETS_CACHE_TTL, values)
+        return list(values)
+
+    async def _coalesce(self, key: Tuple, query: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Share one run of `query` between identical concurrent callers.
+
+        The task stays cached for COALESCE_WINDOW after it succeeds; failures
+        are dropped immediately. Callers are shielded so one cancelled
+        request does not cancel the query for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            loop = asyncio.get_running_loop()
+            task = loop.create_task(query())
+            self._inflight[key] = task
+
+            def _expire(done: asyncio.Task) -> None:
+                if done.cancelled() or done.exception() is not None:
+                    self._drop_inflight(key, done)
+                else:
+                    loop.call_later(COALESCE_WINDOW, self._drop_inflight, key, done)
+
+            task.add_done_callback(_expire)
+        return await asyncio.shield(task)
+
+    def _drop_inflight(self, key: Tuple, task: asyncio.Task) -> None:
+        """Forget a coalesced query unless it was already replaced."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _invalidate_user(self, *user_ids: str) -> None:
+        """Drop cached tags/folders and shared list reads after a write."""
+        for user_id in user_ids:
+            self._facets_cache.pop(("tags", user_id), None)
+            self._facets_cache.pop(("folders", user_id), None)
+        stale = [key for key in self._inflight if key[1] in user_ids]
+        for key in stale:
+            del self._inflight[key]
+
     def _to_document(self, bookmark: Bookmark) -> dict:
         """Convert Bookmark entity to MongoDB document."""
-        return {
-            "_id": bookmark.id,
-            "user_id": bookmark.user_id,
-            "session_id": bookmark.session_id,
-            "message_id": bookmark.message_id,
-            "query": bookmark.query,
-            "response": bookmark.response,
-            "title": bookmark.title,
-            "tags": bookmark.tags,
-            "notes": bookmark.notes,
-            "folder": bookmark.folder,
-            "sources": bookmark.sources,
-            "artifacts": bookmark.artifacts,
-            "is_pinned": bookmark.is_pinned,
-            "is_archived": bookmark.is_archived,
-            "created_at": bookmark.created_at,
-            "updated_at": bookmark.updated_at,
-        }
+        doc = dict(zip(_BM_KEYS, (bookmark.id, *_bm_get(bookmark))))
+        doc["tags"] = list(dict.fromkeys(t.lower() for t in bookmark.tags))
+        return doc
 
     def _from_document(self, doc: dict) -> Bookmark:
-        """Convert MongoDB document to Bookmark entity."""
-        return Bookmark(
+        """
+        Convert MongoDB document to Bookmark entity.
+
+        Stored documents were written from valid entities, so hydration
+        bypasses __init__/__post_init__ (title derivation, default
+        factories) and fills the instance dict directly - the dataclass
+        equivalent of Pydantic's model_construct for trusted reads.
+        """
+        bookmark = object.__new__(Bookmark)
+        bookmark.__dict__.update(
             id=str(doc["_id"]),
             user_id=doc.get("user_id", ""),
             session_id=doc.get("session_id", ""),
@@ -208,6 +397,7 @@ class MongoDBBookmarkRepository(IBookmarkRepository):
             artifacts=doc.get("artifacts", []),
             is_pinned=doc.get("is_pinned", False),
             is_archived=doc.get("is_archived", False),
-            created_at=doc.get("created_at", datetime.now(timezone.utc)),
-            updated_at=doc.get("updated_at", datetime.now(timezone.utc)),
+            created_at=doc.get("created_at") or _EPOCH,
+            updated_at=doc.get("updated_at") or _EPOCH,
         )
+        return bookmark
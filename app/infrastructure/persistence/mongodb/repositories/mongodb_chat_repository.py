@@ -1,26 +1,68 @@
 """MongoDB Chat Repository implementation."""
 
-from typing import Optional, List
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from datetime import datetime
+from typing import Optional, List, Tuple
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.chat_session import ChatSession
 from app.domain.entities.chat_message import ChatMessage
 from app.application.interfaces.repositories.chat_repository import IChatRepository
 from app.infrastructure.persistence.mongodb.mappers import (
-    ChatSessionMapper,
-    ChatMessageMapper,
-)
-from app.infrastructure.persistence.mongodb.models import (
-    ChatSessionInDB,
-    ChatMessageInDB,
+    chat_session_doc_to_entity,
+    chat_session_to_model,
+    chat_message_doc_to_entity,
+    chat_message_to_model,
 )
+from app.infrastructure.persistence.mongodb.pagination import find_page_with_total
+
+
+def _parse_object_id(value: str) -> Optional[ObjectId]:
+    """ObjectId for a stored id string, or None if it cannot be one."""
+    return ObjectId(value) if ObjectId.is_valid(value) else None
+
+
+def _apply_keyset(
+    query: dict, field: str, after: Tuple[datetime, str], descending: bool
+) -> None:
+    """
+    Restrict `query` to documents strictly past the (field, _id) cursor.
+
+    Replaces skip-based paging: the server seeks straight to the cursor
+    position instead of walking every skipped document.
+    """
+    last_value, last_id = after
+    last_oid = _parse_object_id(last_id)
+    if last_oid is None:
+        raise ValueError(f"Invalid pagination cursor id: {last_id!r}")
+    op = "$lt" if descending else "$gt"
+    query["$or"] = [
+        {field: {op: last_value}},
+        {field: last_value, "_id": {op: last_oid}},
+    ]
+
+
+def _admin_session_query(
+    user_id: Optional[str], date_from, date_to, is_archived: Optional[bool]
+) -> dict:
+    """Filter shared by the admin session listing and count."""
+    query = {"is_deleted": False}
+
+    if user_id:
+        query["user_id"] = user_id
+    if is_archived is not None:
+        query["is_archived"] = is_archived
+    if date_from:
+        query["created_at"] = {"$gte": date_from}
+    if date_to:
+        query.setdefault("created_at", {})["$lte"] = date_to
+    return query
 
 
 class MongoDBChatRepository(IChatRepository):
     """MongoDB implementation of Chat Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.sessions_collection = db["chat_sessions"]
         self.messages_collection = db["chat_messages"]
@@ -29,7 +71,7 @@ class MongoDBChatRepository(IChatRepository):
 
     async def create_session(self, session: ChatSession) -> ChatSession:
         """Create new chat session."""
-        session_model = ChatSessionMapper.to_model(session)
+        session_model = chat_session_to_model(session)
         session_dict = session_model.dict(by_alias=True, exclude={"id"})
 
         result = await self.sessions_collection.insert_one(session_dict)
@@ -38,21 +80,19 @@ class MongoDBChatRepository(IChatRepository):
 
     async def get_session_by_id(self, session_id: str) -> Optional[ChatSession]:
         """Get chat session by ID."""
-        try:
-            doc = await self.sessions_collection.find_one({"_id": ObjectId(session_id)})
-        except:
+        object_id = _parse_object_id(session_id)
+        if object_id is None:
             return None
 
+        doc = await self.sessions_collection.find_one({"_id": object_id})
         if not doc:
             return None
 
-        doc["id"] = str(doc.pop("_id"))
-        session_model = ChatSessionInDB(**doc)
-        return ChatSessionMapper.to_entity(session_model)
+        return chat_session_doc_to_entity(doc)
 
     async def update_session(self, session: ChatSession) -> ChatSession:
         """Update chat session."""
-        session_model = ChatSessionMapper.to_model(session)
+        session_model = chat_session_to_model(session)
         session_dict = session_model.dict(by_alias=True, exclude={"id"})
 
         await self.sessions_collection.update_one(
@@ -74,26 +114,23 @@ class MongoDBChatRepository(IChatRepository):
         skip: int = 0,
         limit: int = 100,
         include_archived: bool = False,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ChatSession]:
-        """List sessions by user."""
+        """List sessions by user (pass `after` for keyset paging)."""
         query = {"user_id": user_id, "is_deleted": False}
         if not include_archived:
             query["is_archived"] = False
 
-        cursor = (
-            self.sessions_collection.find(query)
-            .sort("updated_at", -1)
-            .skip(skip)
-            .limit(limit)
+        if after is not None:
+            _apply_keyset(query, "updated_at", after, descending=True)
+        cursor = self.sessions_collection.find(query).sort(
+            [("updated_at", -1), ("_id", -1)]
         )
-        sessions = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            session_model = ChatSessionInDB(**doc)
-            sessions.append(ChatSessionMapper.to_entity(session_model))
-
-        return sessions
+        if after is None and skip:
+            cursor = cursor.skip(skip)
+        cursor = cursor.limit(limit)
+        docs = await cursor.to_list(length=limit)
+        return [chat_session_doc_to_entity(doc) for doc in docs]
 
     async def count_sessions_by_user(
         self,
@@ -111,8 +148,8 @@ class MongoDBChatRepository(IChatRepository):
 
     async def create_message(self, message: ChatMessage) -> ChatMessage:
         """Create new chat message."""
-        message_model = ChatMessageMapper.to_model(message)
-        message_dict = message_model.dict(by_alias=True, exclude={"id"})
+        message_model = chat_message_to_model(message)
+        message_dict = message_model.model_dump(by_alias=True, exclude={"id"})
 
         result = await self.messages_collection.insert_one(message_dict)
         message.id = str(result.inserted_id)
@@ -120,22 +157,20 @@ class MongoDBChatRepository(IChatRepository):
 
     async def get_message_by_id(self, message_id: str) -> Optional[ChatMessage]:
         """Get message by ID."""
-        try:
-            doc = await self.messages_collection.find_one({"_id": ObjectId(message_id)})
-        except:
+        object_id = _parse_object_id(message_id)
+        if object_id is None:
             return None
 
+        doc = await self.messages_collection.find_one({"_id": object_id})
         if not doc:
             return None
 
-        doc["id"] = str(doc.pop("_id"))
-        message_model = ChatMessageInDB(**doc)
-        return ChatMessageMapper.to_entity(message_model)
+        return chat_message_doc_to_entity(doc)
 
     async def update_message(self, message: ChatMessage) -> ChatMessage:
         """Update message."""
-        message_model = ChatMessageMapper.to_model(message)
-        message_dict = message_model.dict(by_alias=True, exclude={"id"})
+        message_model = chat_message_to_model(message)
+        message_dict = message_model.model_dump(by_alias=True, exclude={"id"})
 
         await self.messages_collection.update_one(
             {"_id": ObjectId(message.id)}, {"$set": message_dict}
@@ -156,26 +191,23 @@ class MongoDBChatRepository(IChatRepository):
         skip: int = 0,
         limit: int = 100,
         include_deleted: bool = False,
+        after: Optional[Tuple[datetime, str]] = None,
     ) -> List[ChatMessage]:
-        """List messages by session."""
+        """List messages by session (pass `after` for keyset paging)."""
         query = {"session_id": session_id}
         if not include_deleted:
             query["is_deleted"] = False
 
-        cursor = (
-            self.messages_collection.find(query)
-            .sort("created_at", 1)
-            .skip(skip)
-            .limit(limit)
+        if after is not None:
+            _apply_keyset(query, "created_at", after, descending=False)
+        cursor = self.messages_collection.find(query).sort(
+            [("created_at", 1), ("_id", 1)]
         )
-        messages = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            message_model = ChatMessageInDB(**doc)
-            messages.append(ChatMessageMapper.to_entity(message_model))
-
-        return messages
+        if after is None and skip:
+            cursor = cursor.skip(skip)
+        cursor = cursor.limit(limit)
+        docs = await cursor.to_list(length=limit)
+        return [chat_message_doc_to_entity(doc) for doc in docs]
 
     async def count_messages_by_session(
         self,
@@ -203,13 +235,8 @@ class MongoDBChatRepository(IChatRepository):
             .limit(limit)
         )
 
-        messages = []
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            message_model = ChatMessageInDB(**doc)
-            messages.append(ChatMessageMapper.to_entity(message_model))
-
-        return messages
+        docs = await cursor.to_list(length=limit)
+        return [chat_message_doc_to_entity(doc) for doc in docs]
 
     # ===== Admin Methods =====
 
@@ -223,34 +250,15 @@ class MongoDBChatRepository(IChatRepository):
         limit: int = 20,
     ) -> List[ChatSession]:
         """Find all sessions with admin filters."""
-        query = {"is_deleted": False}
-
-        if user_id:
-            query["user_id"] = user_id
-        if is_archived is not None:
-            query["is_archived"] = is_archived
-        if date_from:
-            query["created_at"] = {"$gte": date_from}
-        if date_to:
-            if "created_at" in query:
-                query["created_at"]["$lte"] = date_to
-            else:
-                query["created_at"] = {"$lte": date_to}
-
+        query = _admin_session_query(user_id, date_from, date_to, is_archived)
         cursor = (
             self.sessions_collection.find(query)
-            .sort("updated_at", -1)
+            .sort([("updated_at", -1), ("_id", -1)])
             .skip(skip)
             .limit(limit)
         )
-        sessions = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            session_model = ChatSessionInDB(**doc)
-            sessions.append(ChatSessionMapper.to_entity(session_model))
-
-        return sessions
+        docs = await cursor.to_list(length=limit)
+        return [chat_session_doc_to_entity(doc) for doc in docs]
 
     async def count_all_sessions(
         self,
@@ -260,22 +268,28 @@ class MongoDBChatRepository(IChatRepository):
         is_archived: Optional[bool] = None,
     ) -> int:
         """Count all sessions with admin filters."""
-        query = {"is_deleted": False}
-
-        if user_id:
-            query["user_id"] = user_id
-        if is_archived is not None:
-            query["is_archived"] = is_archived
-        if date_from:
-            query["created_at"] = {"$gte": date_from}
-        if date_to:
-            if "created_at" in query:
-                query["created_at"]["$lte"] = date_to
-            else:
-                query["created_at"] = {"$lte": date_to}
-
+        query = _admin_session_query(user_id, date_from, date_to, is_archived)
         return await self.sessions_collection.count_documents(query)
 
+    async def list_and_count_all_sessions(
+        self,
+        user_id: Optional[str] = None,
+        date_from=None,
+        date_to=None,
+        is_archived: Optional[bool] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[ChatSession], int]:
+        """Get a page of sessions and the total count in one $facet round trip."""
+        docs, total = await find_page_with_total(
+            self.sessions_collection,
+            _admin_session_query(user_id, date_from, date_to, is_archived),
+            {"updated_at": -1, "_id": -1},
+            skip,
+            limit,
+        )
+        return [chat_session_doc_to_entity(doc) for doc in docs], total
+
     async def archive_session(self, session_id: str) -> bool:
         """Archive a session."""
         result = await self.sessions_collection.update_one(
@@ -292,12 +306,13 @@ class MongoDBChatRepository(IChatRepository):
 
     async def hard_delete_session(self, session_id: str) -> bool:
         """Hard delete session and messages."""
-        # Delete messages
+        object_id = _parse_object_id(session_id)
+        if object_id is None:
+            return False
+        # Messages first: a failure here must not orphan them under a
+        # session that is already gone
         await self.messages_collection.delete_many({"session_id": session_id})
-        # Delete session
-        result = await self.sessions_collection.delete_one(
-            {"_id": ObjectId(session_id)}
-        )
+        result = await self.sessions_collection.delete_one({"_id": object_id})
         return result.deleted_count > 0
 
     async def find_by_user_id(
@@ -326,13 +341,9 @@ class MongoDBChatRepository(IChatRepository):
             query["created_at"] = {"$gte": date_from}
 
         cursor = (
-            self.sessions_collection.find(query).sort("updated_at", -1).limit(limit)
+            self.sessions_collection.find(query)
+            .sort([("updated_at", -1), ("_id", -1)])
+            .limit(limit)
         )
-        sessions = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            session_model = ChatSessionInDB(**doc)
-            sessions.append(ChatSessionMapper.to_entity(session_model))
-
-        return sessions
+        docs = await cursor.to_list(length=limit)
+        return [chat_session_doc_to_entity(doc) for doc in docs]
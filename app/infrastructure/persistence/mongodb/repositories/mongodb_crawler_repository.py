@@ -1,7 +1,7 @@
 """MongoDB Crawler Repository implementation."""
 
 from typing import Optional, List, Dict, Any
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.crawl_job import CrawlJob
@@ -14,7 +14,7 @@ from app.application.interfaces.repositories.crawler_repository import (
 class MongoDBCrawlerRepository(ICrawlerRepository):
     """MongoDB implementation of Crawler Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["crawl_jobs"]
 
@@ -84,12 +84,8 @@ class MongoDBCrawlerRepository(ICrawlerRepository):
         cursor = (
             self.collection.find(query).sort("created_at", -1).skip(skip).limit(limit)
         )
-        jobs = []
-
-        async for doc in cursor:
-            jobs.append(self._doc_to_entity(doc))
-
-        return jobs
+        docs = await cursor.to_list(length=limit)
+        return [self._doc_to_entity(doc) for doc in docs]
 
     async def count_jobs(
         self,
@@ -112,12 +108,8 @@ class MongoDBCrawlerRepository(ICrawlerRepository):
     async def get_scheduled_jobs(self) -> List[CrawlJob]:
         """Get scheduled jobs."""
         cursor = self.collection.find({"schedule_cron": {"$ne": None}})
-        jobs = []
-
-        async for doc in cursor:
-            jobs.append(self._doc_to_entity(doc))
-
-        return jobs
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_entity(doc) for doc in docs]
 
     async def get_crawler_stats(self) -> Dict[str, Any]:
         """Get crawler statistics."""
@@ -127,7 +119,7 @@ class MongoDBCrawlerRepository(ICrawlerRepository):
         pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
 
         status_counts = {}
-        async for doc in self.collection.aggregate(pipeline):
+        async for doc in await self.collection.aggregate(pipeline):
             status_counts[doc["_id"]] = doc["count"]
 
         return {
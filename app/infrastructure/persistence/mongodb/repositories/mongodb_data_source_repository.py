@@ -1,8 +1,8 @@
 """MongoDB Data Source Repository implementation."""
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.data_source import DataSource, SourceAuth, CrawlConfig
@@ -15,12 +15,13 @@ from app.domain.enums.data_source import (
 from app.application.interfaces.repositories.data_source_repository import (
     IDataSourceRepository,
 )
+from app.infrastructure.persistence.mongodb.pagination import find_page_with_total
 
 
 class MongoDBDataSourceRepository(IDataSourceRepository):
     """MongoDB implementation of DataSource Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["data_sources"]
 
@@ -69,12 +70,8 @@ class MongoDBDataSourceRepository(IDataSourceRepository):
         query = self._build_query(status, category, is_active)
 
         cursor = self.collection.find(query).sort("priority", 1).skip(skip).limit(limit)
-        sources = []
-
-        async for doc in cursor:
-            sources.append(self._doc_to_entity(doc))
-
-        return sources
+        docs = await cursor.to_list(length=limit)
+        return [self._doc_to_entity(doc) for doc in docs]
 
     async def count(
         self,
@@ -86,17 +83,31 @@ class MongoDBDataSourceRepository(IDataSourceRepository):
         query = self._build_query(status, category, is_active)
         return await self.collection.count_documents(query)
 
+    async def list_with_total(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[SourceStatus] = None,
+        category: Optional[DataCategory] = None,
+        is_active: Optional[bool] = None,
+    ) -> Tuple[List[DataSource], int]:
+        """List data sources and the total count in one $facet round trip."""
+        docs, total = await find_page_with_total(
+            self.collection,
+            self._build_query(status, category, is_active),
+            {"priority": 1},
+            skip,
+            limit,
+        )
+        return [self._doc_to_entity(doc) for doc in docs], total
+
     async def get_active_sources(self) -> List[DataSource]:
         """Get all active data sources for scheduling."""
         query = {"is_active": True, "status": {"$ne": SourceStatus.DISABLED.value}}
 
         cursor = self.collection.find(query).sort("priority", 1)
-        sources = []
-
-        async for doc in cursor:
-            sources.append(self._doc_to_entity(doc))
-
-        return sources
+        docs = await cursor.to_list(length=None)
+        return [self._doc_to_entity(doc) for doc in docs]
 
     async def get_by_url(self, base_url: str) -> Optional[DataSource]:
         """Get data source by base URL."""
@@ -133,29 +144,37 @@ class MongoDBDataSourceRepository(IDataSourceRepository):
                 },
             }
         else:
-            update = {
-                "$set": {
-                    "last_crawl_at": now,
-                    "error_message": error,
-                    "updated_at": now,
+            # Pipeline update: the pause-on-too-many-errors check runs
+            # server-side in the same command instead of a read + second write
+            tripped = {
+                "$gte": ["$error_count", {"$ifNull": ["$max_errors", 5]}]
+            }
+            update = [
+                {
+                    "$set": {
+                        "last_crawl_at": now,
+                        "error_message": {"$literal": error},
+                        "updated_at": now,
+                        "total_crawls": {
+                            "$add": [{"$ifNull": ["$total_crawls", 0]}, 1]
+                        },
+                        "error_count": {
+                            "$add": [{"$ifNull": ["$error_count", 0]}, 1]
+                        },
+                    }
                 },
-                "$inc": {
-                    "total_crawls": 1,
-                    "error_count": 1,
+                {
+                    "$set": {
+                        "status": {
+                            "$cond": [tripped, SourceStatus.ERROR.value, "$status"]
+                        },
+                        "is_active": {"$cond": [tripped, False, "$is_active"]},
+                    }
                 },
-            }
+            ]
 
         result = await self.collection.update_one({"_id": ObjectId(source_id)}, update)
 
-        # Check if need to pause due to errors
-        if not success:
-            source = await self.get_by_id(source_id)
-            if source and source.error_count >= source.max_errors:
-                await self.collection.update_one(
-                    {"_id": ObjectId(source_id)},
-                    {"$set": {"status": SourceStatus.ERROR.value, "is_active": False}},
-                )
-
         return result.modified_count > 0
 
     def _build_query(
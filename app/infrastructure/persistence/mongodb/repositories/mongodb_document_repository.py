@@ -1,27 +1,45 @@
 """MongoDB Document Repository implementation."""
 
 from typing import Optional, List, Dict, Any
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.document import Document
 from app.application.interfaces.repositories.document_repository import (
     IDocumentRepository,
 )
-from app.infrastructure.persistence.mongodb.mappers import DocumentMapper
+from app.infrastructure.persistence.mongodb.mappers import (
+    document_to_entity,
+    documents_to_entities,
+    document_to_model,
+)
 from app.infrastructure.persistence.mongodb.models import DocumentInDB
 
 
+def _model_from_db(doc: Dict[str, Any]) -> DocumentInDB:
+    """
+    Build a model from a stored document without re-validating it.
+
+    Documents are written through DocumentInDB, so reads are trusted and
+    model_construct skips Pydantic validation/coercion.
+    """
+    doc["id"] = str(doc.pop("_id"))
+    return DocumentInDB.model_construct(**doc)
+
+
 class MongoDBDocumentRepository(IDocumentRepository):
     """MongoDB implementation of Document Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    # Max IDs per $in query
+    BATCH_SIZE = 64
+
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["documents"]
 
     async def create(self, document: Document) -> Document:
         """Create new document."""
-        doc_model = DocumentMapper.to_model(document)
+        doc_model = document_to_model(document)
         doc_dict = doc_model.dict(by_alias=True, exclude={"id"})
 
         result = await self.collection.insert_one(doc_dict)
@@ -38,13 +56,26 @@ class MongoDBDocumentRepository(IDocumentRepository):
         if not doc:
             return None
 
-        doc["id"] = str(doc.pop("_id"))
-        doc_model = DocumentInDB(**doc)
-        return DocumentMapper.to_entity(doc_model)
+        return document_to_entity(_model_from_db(doc))
+
+    async def get_by_ids(self, document_ids: List[str]) -> Dict[str, Document]:
+        """Get documents by IDs with batched $in queries."""
+        object_ids = [
+            ObjectId(doc_id) for doc_id in document_ids if ObjectId.is_valid(doc_id)
+        ]
+
+        documents = {}
+        for start in range(0, len(object_ids), self.BATCH_SIZE):
+            batch = object_ids[start : start + self.BATCH_SIZE]
+            async for doc in self.collection.find({"_id": {"$in": batch}}):
+                doc_model = _model_from_db(doc)
+                documents[doc_model.id] = document_to_entity(doc_model)
+
+        return documents
 
     async def update(self, document: Document) -> Document:
         """Update document."""
-        doc_model = DocumentMapper.to_model(document)
+        doc_model = document_to_model(document)
         doc_dict = doc_model.dict(by_alias=True, exclude={"id"})
 
         await self.collection.update_one(
@@ -78,14 +109,7 @@ class MongoDBDocumentRepository(IDocumentRepository):
         cursor = (
             self.collection.find(query).sort("created_at", -1).skip(skip).limit(limit)
         )
-        documents = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            doc_model = DocumentInDB(**doc)
-            documents.append(DocumentMapper.to_entity(doc_model))
-
-        return documents
+        return documents_to_entities([_model_from_db(doc) async for doc in cursor])
 
     async def count(
         self,
@@ -123,14 +147,7 @@ class MongoDBDocumentRepository(IDocumentRepository):
             query[f"metadata.{key}"] = value
 
         cursor = self.collection.find(query)
-        documents = []
-
-        async for doc in cursor:
-            doc["id"] = str(doc.pop("_id"))
-            doc_model = DocumentInDB(**doc)
-            documents.append(DocumentMapper.to_entity(doc_model))
-
-        return documents
+        return documents_to_entities([_model_from_db(doc) async for doc in cursor])
 
     async def exists(self, document_id: str) -> bool:
         """Check if document exists."""
@@ -2,7 +2,7 @@
 
 from typing import Optional, List
 from datetime import datetime, timedelta
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.feedback import (
@@ -19,7 +19,7 @@ from app.application.interfaces.repositories.feedback_repository import (
 class MongoDBFeedbackRepository(IFeedbackRepository):
     """MongoDB implementation of Feedback Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["feedbacks"]
 
@@ -296,7 +296,7 @@ class MongoDBFeedbackRepository(IFeedbackRepository):
             ]
         )
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result:
             return {
@@ -361,7 +361,7 @@ class MongoDBFeedbackRepository(IFeedbackRepository):
             {"$sort": {"_id": 1}},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -410,7 +410,7 @@ class MongoDBFeedbackRepository(IFeedbackRepository):
             {"$limit": limit},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -1,7 +1,7 @@
 """MongoDB File Repository implementation."""
 
 from typing import Optional, List
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.file_metadata import FileMetadata
@@ -12,7 +12,7 @@ from app.application.interfaces.repositories.file_repository import IFileReposit
 class MongoDBFileRepository(IFileRepository):
     """MongoDB implementation of File Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["file_metadata"]
 
@@ -127,7 +127,7 @@ class MongoDBFileRepository(IFileRepository):
             {"$group": {"_id": None, "total": {"$sum": "$size"}}},
         ]
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
         return result[0]["total"] if result else 0
 
     async def exists(self, file_id: str) -> bool:
@@ -2,7 +2,7 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.pending_update import PendingUpdate
@@ -19,7 +19,7 @@ from app.application.interfaces.repositories.pending_update_repository import (
 class MongoDBPendingUpdateRepository(IPendingUpdateRepository):
     """MongoDB implementation of PendingUpdate Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["pending_updates"]
 
@@ -184,7 +184,7 @@ class MongoDBPendingUpdateRepository(IPendingUpdateRepository):
             }
         ]
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result:
             return {
@@ -2,7 +2,7 @@
 
 from typing import Optional, List
 from datetime import datetime, timedelta
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 import uuid
 
@@ -22,7 +22,7 @@ from app.application.interfaces.repositories.search_log_repository import (
 class MongoDBSearchLogRepository(ISearchLogRepository):
     """MongoDB implementation of SearchLog Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["search_logs"]
 
@@ -219,7 +219,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         distribution = {"high": 0, "medium": 0, "low": 0, "none": 0, "total": 0}
         for item in results:
@@ -255,7 +255,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
             }
         )
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result or result[0]["total"] == 0:
             return 0.0
@@ -286,7 +286,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
             {"$sort": {"query_count": -1}},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -326,7 +326,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
             {"$limit": 50},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -402,7 +402,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -417,7 +417,7 @@ class MongoDBSearchLogRepository(ISearchLogRepository):
 class MongoDBKnowledgeGapRepository(IKnowledgeGapRepository):
     """MongoDB implementation of KnowledgeGap Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["knowledge_gaps"]
 
@@ -545,7 +545,7 @@ class MongoDBKnowledgeGapRepository(IKnowledgeGapRepository):
             }
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         counts = {
             "detected": 0,
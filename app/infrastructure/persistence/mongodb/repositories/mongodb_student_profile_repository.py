@@ -4,7 +4,7 @@ from typing import Optional, List
 from datetime import datetime
 import uuid
 
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.student_profile import (
@@ -22,7 +22,7 @@ from app.application.interfaces.repositories.student_profile_repository import (
 class MongoDBStudentProfileRepository(IStudentProfileRepository):
     """MongoDB implementation of Student Profile Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["student_profiles"]
 
@@ -2,7 +2,7 @@
 
 from typing import Optional, List
 from datetime import datetime, timedelta
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
 from bson import ObjectId
 
 from app.domain.entities.usage_metric import (
@@ -22,7 +22,7 @@ from app.application.interfaces.repositories.usage_repository import (
 class MongoDBUsageMetricRepository(IUsageMetricRepository):
     """MongoDB implementation of UsageMetric Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["usage_metrics"]
 
@@ -208,7 +208,7 @@ class MongoDBUsageMetricRepository(IUsageMetricRepository):
             }
         )
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result:
             return {
@@ -256,7 +256,7 @@ class MongoDBUsageMetricRepository(IUsageMetricRepository):
             ]
         )
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result or not result[0]["latencies"]:
             return {"p50": 0, "p75": 0, "p90": 0, "p95": 0, "p99": 0}
@@ -305,7 +305,7 @@ class MongoDBUsageMetricRepository(IUsageMetricRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -344,7 +344,7 @@ class MongoDBUsageMetricRepository(IUsageMetricRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [{"hour": item["_id"], "count": item["count"]} for item in results]
 
@@ -352,7 +352,7 @@ class MongoDBUsageMetricRepository(IUsageMetricRepository):
 class MongoDBLLMUsageRepository(ILLMUsageRepository):
     """MongoDB implementation of LLMUsage Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["llm_usage"]
 
@@ -496,7 +496,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
             }
         )
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result:
             return {
@@ -543,7 +543,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         total_cost = sum(item["cost"] for item in results) or 1
 
@@ -586,7 +586,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         total_cost = sum(item["cost"] for item in results) or 1
 
@@ -629,7 +629,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
             ]
         )
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         total_cost = sum(item["cost"] for item in results) or 1
 
@@ -664,7 +664,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
             {"$sort": {"_id": 1}},
         ]
 
-        results = await self.collection.aggregate(pipeline).to_list(None)
+        results = await (await self.collection.aggregate(pipeline)).to_list(None)
 
         return [
             {
@@ -679,7 +679,7 @@ class MongoDBLLMUsageRepository(ILLMUsageRepository):
 class MongoDBDailyStatsRepository(IDailyStatsRepository):
     """MongoDB implementation of DailyUsageStats Repository."""
 
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncDatabase):
         self.db = db
         self.collection = db["daily_stats"]
 
@@ -785,7 +785,7 @@ class MongoDBDailyStatsRepository(IDailyStatsRepository):
             },
         ]
 
-        result = await self.collection.aggregate(pipeline).to_list(1)
+        result = await (await self.collection.aggregate(pipeline)).to_list(1)
 
         if not result:
             return {
@@ -537,7 +537,9 @@ class QdrantVectorStore(IVectorStoreService):
                 )
 
             logger.debug(
-                f"Search returned {len(formatted)} results from '{resolved_collection}'"
+                "Search returned %s results from '%s'",
+                len(formatted),
+                resolved_collection,
             )
             return formatted
 
@@ -3,6 +3,8 @@ Document processor using markitdown.
 Converts various file formats to markdown text.
 """
 
+import asyncio
+
 from markitdown import MarkItDown
 
 from app.application.interfaces.processors.document_processor import IDocumentProcessor
@@ -16,11 +18,16 @@ class MarkItDownProcessor(IDocumentProcessor):
 
     async def process_file(self, file_path: str) -> str:
         """Process file and extract text."""
-        result = self.converter.convert(file_path)
+        # Conversion is CPU/disk bound - keep it off the event loop
+        result = await asyncio.to_thread(self.converter.convert, file_path)
         return result.text_content
 
     async def process_bytes(self, file_bytes: bytes, mime_type: str) -> str:
         """Process file bytes and extract text."""
+        return await asyncio.to_thread(self._convert_bytes, file_bytes, mime_type)
+
+    def _convert_bytes(self, file_bytes: bytes, mime_type: str) -> str:
+        """Convert bytes synchronously (runs in a worker thread)."""
         # MarkItDown doesn't support bytes directly, need to save to temp file
         import tempfile
         from pathlib import Path
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -6,11 +8,12 @@ from app.infrastructure.persistence.mongodb.client import (
     get_mongodb_client,
     get_database,
 )
+from app.config import openai_config
 from app.config.services import ServiceRegistry
 from app.api.middleware import LoggingMiddleware
 from app.api.v1 import chat_api_router, admin_api_router, auth_api_router
 from app.api.v1.admin.config import router as config_router
-
+from app.api.v1.chat.history import NEXT_CURSOR_HEADER
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,6 +27,16 @@ async def lifespan(app: FastAPI):
         print(f"❌ Failed to initialize application: {e}")
         raise e
 
+    # Warm the default (OpenAI) LLM client so the first request skips
+    # TLS/auth setup; bounded so an unreachable endpoint never stalls startup
+    try:
+        await asyncio.wait_for(
+            ServiceRegistry.get_llm().warmup(),
+            timeout=openai_config.warmup_timeout,
+        )
+    except Exception as e:
+        print(f"⚠️ LLM warmup skipped: {e!r}")
+
     yield
 
     # Shutdown
@@ -49,6 +62,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers only let scripts read listed response headers
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 app.add_middleware(LoggingMiddleware)
 